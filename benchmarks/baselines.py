@@ -0,0 +1,38 @@
+"""Stored benchmark baselines and regression checks."""
+import json
+import os
+import typing
+
+Measurements = typing.Dict[str, float]
+
+
+def load_baselines(path: str) -> Measurements:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf8') as baselines_file:
+        return json.load(baselines_file)
+
+
+def save_baselines(path: str, measurements: Measurements) -> None:
+    baselines = {**load_baselines(path), **measurements}
+    with open(path, 'w', encoding='utf8') as baselines_file:
+        json.dump(baselines, baselines_file, indent=2, sort_keys=True)
+        baselines_file.write('\n')
+
+
+def find_regressions(
+    measurements: Measurements,
+    baselines: Measurements,
+    threshold: float,
+    higher_is_better: bool = True,
+) -> typing.List[str]:
+    """Names of measurements worse than baseline by more than threshold (0.2 is 20%)."""
+    regressions = []
+    for name, value in measurements.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        limit = baseline * (1 - threshold) if higher_is_better else baseline * (1 + threshold)
+        if (value < limit) if higher_is_better else (value > limit):
+            regressions.append(name)
+    return regressions
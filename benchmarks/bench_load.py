@@ -0,0 +1,265 @@
+"""Load test simulating concurrent CI reporters: add_run, add_results_for_cases, close_run.
+
+Without --url a local stand-in server is started; --server-rate makes it answer
+429 above the given requests per second, like TestRail API rate limits.
+
+Usage: python -m benchmarks.bench_load [--reporters 20] [--server-rate 50] [--client-rate 40]
+"""
+import argparse
+import collections
+import concurrent.futures
+import dataclasses
+import http.server
+import json
+import re
+import sys
+import threading
+import time
+import typing
+
+from best_testrail_client.client import TestRailClient
+from best_testrail_client.models.result import Result
+from best_testrail_client.models.run import Run
+from best_testrail_client.transport.rate_limit import TokenBucketRateLimiter, take_token
+
+OPERATIONS = ('add_run', 'add_results_for_cases', 'close_run')
+PERCENTILES = (50, 90, 99)
+ENDPOINT_PATTERN = re.compile(r'/api/v2/(\w+)/(\d+)')
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    server: 'StandInServer'
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        match = ENDPOINT_PATTERN.search(self.path)
+        if match is None or match.group(1) not in OPERATIONS:
+            self._respond(404, {'error': 'Unknown endpoint'})
+            return
+        time.sleep(self.server.latency)
+        if not self.server.take_request_token():
+            self._respond(429, {'error': 'API Rate Limit Exceeded'}, {'Retry-After': '1'})
+            return
+        endpoint, object_id = match.group(1), int(match.group(2))
+        self._respond(200, self.server.handle(endpoint, object_id, json.loads(body or b'{}')))
+
+    def log_message(self, format: str, *args: typing.Any) -> None:  # noqa: A002
+        pass
+
+    def _respond(
+        self, status_code: int, data: typing.Any,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> None:
+        content = json.dumps(data).encode('utf8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    """Local TestRail stand-in serving run and result endpoints from memory."""
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, rate: typing.Optional[float] = None, latency: float = 0):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.rate = rate
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._tokens = rate or 0
+        self._updated_at = time.monotonic()
+        self._runs: typing.Dict[int, typing.Any] = {}
+        self._results_count = 0
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}/'
+
+    def take_request_token(self) -> bool:
+        if self.rate is None:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            tokens, wait = take_token(
+                self._tokens, self._updated_at, now, self.rate, burst=max(int(self.rate), 1),
+            )
+            self._tokens, self._updated_at = tokens, now
+        return not wait
+
+    def handle(self, endpoint: str, object_id: int, data: typing.Any) -> typing.Any:
+        with self._lock:
+            if endpoint == 'add_run':
+                run_id = len(self._runs) + 1
+                self._runs[run_id] = {**data, 'id': run_id, 'project_id': object_id}
+                return self._runs[run_id]
+            if endpoint == 'close_run':
+                return {**self._runs.get(object_id, {}), 'is_completed': True}
+            results = []
+            for result in data.get('results', []):
+                self._results_count += 1
+                results.append({**result, 'id': self._results_count, 'test_id': object_id})
+            return results
+
+    def __enter__(self) -> 'StandInServer':
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+@dataclasses.dataclass
+class LoadTestReport:
+    seconds: float = 0
+    flows_count: int = 0
+    failed_flows_count: int = 0
+    results_count: int = 0
+    requests_count: int = 0
+    throttled_count: int = 0
+    errors: typing.Dict[str, int] = dataclasses.field(default_factory=dict)
+    latencies: typing.Dict[str, typing.List[float]] = dataclasses.field(
+        default_factory=lambda: collections.defaultdict(list),
+    )
+
+    def describe(self) -> str:
+        seconds = self.seconds or 1
+        lines = [
+            f'flows: {self.flows_count} ({self.failed_flows_count} failed) in {self.seconds:.1f}s',
+            f'throughput: {self.results_count / seconds:.1f} results/s, '
+            f'{self.requests_count / seconds:.1f} requests/s',
+            f'429 rate: {self.throttled_count / (self.requests_count or 1):.1%} '
+            f'({self.throttled_count} of {self.requests_count} requests)',
+        ]
+        for operation in OPERATIONS:
+            latencies = sorted(self.latencies.get(operation, []))
+            described = ', '.join(
+                f'p{rank} {get_percentile(latencies, rank) * 1000:.1f}ms' for rank in PERCENTILES
+            )
+            lines.append(f'{operation}: {described if latencies else "no calls"}')
+        for error, count in self.errors.items():
+            lines.append(f'{count} flows failed with {error}')
+        return '\n'.join(lines)
+
+
+def get_percentile(sorted_values: typing.List[float], rank: float) -> float:
+    """Nearest-rank percentile of sorted values, 0 for no values."""
+    if not sorted_values:
+        return 0
+    index = max(int(round(rank / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def run_flow(
+    client: TestRailClient, project_id: int, cases_count: int, chunk_size: int,
+    latencies: typing.Dict[str, typing.List[float]],
+) -> int:
+    """One reporter flow, returns posted results count; raises on a failed step."""
+    def timed(operation: str, func: typing.Callable[[], typing.Any]) -> typing.Any:
+        # the client does not raise on error statuses, the reporter's own metrics tell 429s
+        throttled_count = client.get_metrics().get_status_count(429)
+        started_at = time.monotonic()
+        try:
+            return func()
+        finally:
+            latencies[operation].append(time.monotonic() - started_at)
+            if client.get_metrics().get_status_count(429) > throttled_count:
+                raise RuntimeError(f'{operation} is throttled')
+
+    case_ids = list(range(1, cases_count + 1))
+    run = timed('add_run', lambda: client.runs.add_run(
+        Run(name='Load test', include_all=False, case_ids=case_ids), project_id=project_id,
+    ))
+    if run.id is None:
+        raise RuntimeError('Run is not created')
+    results_count = 0
+    for offset in range(0, cases_count, chunk_size):
+        results = [
+            Result(case_id=case_id, status_id=1) for case_id in case_ids[offset:offset + chunk_size]
+        ]
+        results_count += len(timed(
+            'add_results_for_cases',
+            lambda: client.results.add_results_for_cases(run_id=run.id, results=results),
+        ))
+    timed('close_run', lambda: client.runs.close_run(run_id=run.id))
+    return results_count
+
+
+def run_reporter(
+    client: TestRailClient, args: argparse.Namespace, report: LoadTestReport,
+    report_lock: threading.Lock,
+) -> None:
+    for _ in range(args.flows):
+        latencies: typing.Dict[str, typing.List[float]] = collections.defaultdict(list)
+        error = None
+        try:
+            results_count = run_flow(
+                client, args.project_id, args.cases, args.chunk_size, latencies,
+            )
+        except Exception as flow_error:  # noqa: B902
+            error = f'{type(flow_error).__name__}: {flow_error}'
+        with report_lock:
+            report.flows_count += 1
+            if error is not None:
+                report.failed_flows_count += 1
+                report.errors[error] = report.errors.get(error, 0) + 1
+            else:
+                report.results_count += results_count
+            for operation, values in latencies.items():
+                report.latencies[operation].extend(values)
+
+
+def run_load_test(url: str, args: argparse.Namespace) -> LoadTestReport:
+    # one client per reporter, like separate CI jobs, sharing an optional request budget
+    rate_limiter = TokenBucketRateLimiter(args.client_rate) if args.client_rate else None
+    clients = [
+        TestRailClient(url, args.login, args.token, rate_limiter=rate_limiter)
+        for _ in range(args.reporters)
+    ]
+    report, report_lock = LoadTestReport(), threading.Lock()
+    started_at = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.reporters) as executor:
+        list(executor.map(lambda client: run_reporter(client, args, report, report_lock), clients))
+    report.seconds = time.monotonic() - started_at
+    for client in clients:
+        metrics = client.get_metrics()
+        report.requests_count += metrics.requests_count
+        report.throttled_count += metrics.get_status_count(429)
+    return report
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', help='TestRail url, a local stand-in server by default')
+    parser.add_argument('--login', default='login')
+    parser.add_argument('--token', default='token')
+    parser.add_argument('--project-id', type=int, default=1)
+    parser.add_argument('--reporters', type=int, default=20, help='concurrent reporters')
+    parser.add_argument('--flows', type=int, default=5, help='flows per reporter')
+    parser.add_argument('--cases', type=int, default=1000, help='results per flow')
+    parser.add_argument('--chunk-size', type=int, default=250, help='results per request')
+    parser.add_argument('--client-rate', type=float, help='shared client requests per second')
+    parser.add_argument('--server-rate', type=float, help='stand-in server requests per second')
+    parser.add_argument(
+        '--server-latency', type=float, default=0, help='stand-in server seconds per request',
+    )
+    return parser
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.url is not None:
+        report = run_load_test(args.url, args)
+    else:
+        with StandInServer(rate=args.server_rate, latency=args.server_latency) as server:
+            report = run_load_test(server.url, args)
+    sys.stdout.write(f'{report.describe()}\n')
+    return 1 if report.failed_flows_count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
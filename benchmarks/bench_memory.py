@@ -0,0 +1,162 @@
+"""Memory footprint of models and list endpoints, measured offline with tracemalloc.
+
+Reports peak and retained bytes per record for every code path:
+`decode` is json.loads of the response body, `build` is from_json over decoded data,
+`custom_split` is the extra cost of custom fields in from_json and `endpoint` is
+a whole client call against a fake session.
+
+Usage: python -m benchmarks.bench_memory [--count 10000] [--update-baselines]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+import typing
+
+from benchmarks.baselines import find_regressions, load_baselines, save_baselines
+from benchmarks.fake_transport import make_fake_client
+from benchmarks.payloads import make_case_data, make_payloads, make_result_data
+from best_testrail_client.custom_types import JsonData
+from best_testrail_client.models.basemodel import BaseModel
+from best_testrail_client.models.case import Case
+from best_testrail_client.models.result import Result
+from best_testrail_client.models.run import Run
+from best_testrail_client.models.section import Section
+from best_testrail_client.models.test import Test
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines_memory.json')
+
+
+def make_test_data(test_id: int) -> JsonData:
+    case_data = make_case_data(test_id)
+    return {
+        **{key: value for key, value in case_data.items() if key in Test.__annotations__},
+        **{key: value for key, value in case_data.items() if key.startswith('custom_')},
+        'case_id': test_id, 'run_id': 1, 'status_id': 1,
+    }
+
+
+def make_run_data(run_id: int) -> JsonData:
+    return {
+        'id': run_id, 'name': f'Run {run_id}', 'include_all': False, 'project_id': 1,
+        'passed_count': run_id, 'failed_count': 1, 'is_completed': False,
+        'created_on': 1393845644, 'updated_on': 1393845644, 'config_ids': [2, 6],
+        **{f'custom_status{status}_count': 0 for status in range(1, 8)},
+    }
+
+
+def make_section_data(section_id: int) -> JsonData:
+    return {
+        'id': section_id, 'name': f'Section {section_id}', 'depth': 1, 'parent_id': 1,
+        'display_order': section_id, 'suite_id': 1, 'description': None,
+    }
+
+
+PayloadFactory = typing.Callable[[int], JsonData]
+
+MODELS: typing.Dict[str, typing.Tuple[typing.Type[BaseModel], PayloadFactory]] = {
+    'case': (Case, make_case_data),
+    'result': (Result, make_result_data),
+    'test': (Test, make_test_data),
+    'run': (Run, make_run_data),
+    'section': (Section, make_section_data),
+}
+EndpointCall = typing.Callable[[typing.Any], typing.Any]
+
+# list endpoint route and call per model
+ENDPOINTS: typing.Dict[str, typing.Tuple[str, EndpointCall]] = {
+    'case': ('get_cases', lambda client: client.cases.get_cases(project_id=1)),
+    'result': ('get_results_for_run', lambda client: client.results.get_results_for_run(run_id=1)),
+    'test': ('get_tests', lambda client: client.tests.get_tests(run_id=1)),
+    'run': ('get_runs', lambda client: client.runs.get_runs(project_id=1)),
+    'section': ('get_sections', lambda client: client.sections.get_sections(project_id=1)),
+}
+
+
+def trace_memory(func: typing.Callable[[], typing.Any]) -> typing.Tuple[int, int]:
+    """Peak and retained bytes allocated by func, its result kept alive while measuring."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        started_size = tracemalloc.get_traced_memory()[0]
+        result = func()
+        retained_size, peak_size = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak_size - started_size, retained_size - started_size
+
+
+def measure_model(
+    model_class: typing.Type[BaseModel], factory: PayloadFactory, count: int,
+) -> typing.Dict[str, typing.Tuple[float, float]]:
+    payloads = make_payloads(factory, count)
+    body = json.dumps(payloads).encode('utf8')
+    plain_payloads = [
+        {key: value for key, value in data.items() if not key.startswith('custom_')}
+        for data in payloads
+    ]
+    decode = trace_memory(lambda: json.loads(body))
+    build = trace_memory(lambda: [model_class.from_json(data) for data in payloads])
+    measurements = {
+        'decode': (decode[0] / count, decode[1] / count),
+        'build': (build[0] / count, build[1] / count),
+    }
+    if plain_payloads != payloads:
+        plain_build = trace_memory(
+            lambda: [model_class.from_json(data) for data in plain_payloads],
+        )
+        measurements['custom_split'] = (
+            (build[0] - plain_build[0]) / count, (build[1] - plain_build[1]) / count,
+        )
+    return measurements
+
+
+def measure_endpoint(model_name: str, count: int) -> typing.Tuple[float, float]:
+    route, call = ENDPOINTS[model_name]
+    client = make_fake_client({route: make_payloads(MODELS[model_name][1], count)})
+    call(client)  # warm up lazy imports and the session outside of tracing
+    peak, retained = trace_memory(lambda: call(client))
+    return peak / count, retained / count
+
+
+def collect_measurements(count: int) -> typing.Dict[str, typing.Tuple[float, float]]:
+    measurements = {}
+    for model_name, (model_class, factory) in MODELS.items():
+        for path, sizes in measure_model(model_class, factory, count).items():
+            measurements[f'{model_name}.{path}'] = sizes
+        measurements[f'{model_name}.endpoint'] = measure_endpoint(model_name, count)
+    return measurements
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=10000, help='records per measurement')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed growth')
+    parser.add_argument('--baselines', default=BASELINES_PATH)
+    parser.add_argument('--update-baselines', action='store_true')
+    return parser
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    measurements = collect_measurements(args.count)
+    sys.stdout.write(f'{"path":<24} {"peak B/record":>14} {"retained B/record":>18}\n')
+    for name, (peak, retained) in measurements.items():
+        sys.stdout.write(f'{name:<24} {peak:>14,.0f} {retained:>18,.0f}\n')
+    retained_sizes = {f'{name}.retained': sizes[1] for name, sizes in measurements.items()}
+    if args.update_baselines:
+        save_baselines(args.baselines, retained_sizes)
+        return 0
+    regressions = find_regressions(
+        retained_sizes, load_baselines(args.baselines), args.threshold, higher_is_better=False,
+    )
+    for name in regressions:
+        sys.stderr.write(f'Regression: {name} grew more than {args.threshold:.0%}\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Startup time of `import best_testrail_client.client` plus client construction.
+
+Every sample runs in a fresh interpreter. Fails when the best sample exceeds the budget
+or stored baseline, or when startup imports modules that must stay deferred.
+
+Usage: python -m benchmarks.bench_startup [--samples 20] [--budget-ms 15] [--update-baselines]
+"""
+import argparse
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import typing
+
+from benchmarks.baselines import find_regressions, load_baselines, save_baselines
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines_startup.json')
+DEFERRED_MODULES = ('requests', 'concurrent.futures', 'best_testrail_client.api.cases_api')
+SAMPLE_SCRIPT = """
+import json, sys, time
+started_at = time.perf_counter()
+import best_testrail_client.client
+best_testrail_client.client.TestRailClient('https://testrail.invalid/', 'login', 'token')
+seconds = time.perf_counter() - started_at
+print(json.dumps({'seconds': seconds, 'modules': sorted(sys.modules)}))
+"""
+
+
+def take_sample() -> typing.Tuple[float, typing.List[str]]:
+    output = subprocess.check_output(  # noqa: S603
+        [sys.executable, '-c', SAMPLE_SCRIPT],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    sample = json.loads(output)
+    return sample['seconds'], sample['modules']
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--samples', type=int, default=20)
+    parser.add_argument('--budget-ms', type=float, default=15)
+    parser.add_argument('--threshold', type=float, default=0.5, help='allowed slowdown')
+    parser.add_argument('--baselines', default=BASELINES_PATH)
+    parser.add_argument('--update-baselines', action='store_true')
+    return parser
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    samples = [take_sample() for _ in range(args.samples)]
+    best_ms = min(seconds for seconds, _ in samples) * 1000
+    loaded_modules = [module for module in DEFERRED_MODULES if module in samples[0][1]]
+    sys.stdout.write(f'client_startup: {best_ms:.2f}ms (budget {args.budget_ms:.0f}ms)\n')
+    measurements = {'client_startup_ms': best_ms}
+    if args.update_baselines:
+        save_baselines(args.baselines, measurements)
+        return 0
+    failures = [f'{module} is imported on startup' for module in loaded_modules]
+    if best_ms > args.budget_ms:
+        failures.append(f'startup exceeds {args.budget_ms:.0f}ms budget')
+    failures.extend(
+        f'Regression: {name} grew more than {args.threshold:.0%}'
+        for name in find_regressions(
+            measurements, load_baselines(args.baselines), args.threshold, higher_is_better=False,
+        )
+    )
+    for failure in failures:
+        sys.stderr.write(f'{failure}\n')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Throughput micro-benchmarks for model encode/decode and request building.
+
+Usage: python -m benchmarks.bench_throughput [--scale 0.1] [--update-baselines]
+"""
+import argparse
+import dataclasses
+import os
+import sys
+import time
+import typing
+
+from benchmarks.baselines import find_regressions, load_baselines, save_baselines
+from benchmarks.fake_transport import make_fake_client
+from benchmarks.payloads import (
+    make_case_data, make_payloads, make_result_data, make_result_field_data,
+)
+from best_testrail_client.models.case import Case
+from best_testrail_client.models.result import Result
+from best_testrail_client.models.result_field import ResultField
+from best_testrail_client.utils import convert_list_to_filter
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines_throughput.json')
+
+
+@dataclasses.dataclass
+class Benchmark:
+    name: str
+    items_count: int
+    setup: typing.Callable[[int], typing.Any]
+    run: typing.Callable[[typing.Any], typing.Any]
+
+
+def _bench_request_overhead(client: typing.Any) -> None:
+    for case_id in range(1, 2001):
+        client.cases.get_case(case_id=case_id)
+
+
+def get_benchmarks(scale: float) -> typing.List[Benchmark]:
+    cases_count, results_count = int(100_000 * scale), int(50_000 * scale)
+    fields_count = int(5_000 * scale)
+    return [
+        Benchmark(
+            'case_from_json', cases_count,
+            lambda count: make_payloads(make_case_data, count),
+            lambda payloads: [Case.from_json(data) for data in payloads],
+        ),
+        Benchmark(
+            'case_to_json', cases_count,
+            lambda count: [Case.from_json(data) for data in make_payloads(make_case_data, count)],
+            lambda cases: [case.to_json() for case in cases],
+        ),
+        Benchmark(
+            'result_from_json', results_count,
+            lambda count: make_payloads(make_result_data, count),
+            lambda payloads: [Result.from_json(data) for data in payloads],
+        ),
+        Benchmark(
+            'result_to_json', results_count,
+            lambda count: [
+                Result.from_json(data) for data in make_payloads(make_result_data, count)
+            ],
+            lambda results: [result.to_json(include_none=False) for result in results],
+        ),
+        Benchmark(
+            'result_field_from_json', fields_count,
+            lambda count: make_payloads(make_result_field_data, count),
+            lambda payloads: [ResultField.from_json(data) for data in payloads],
+        ),
+        Benchmark(
+            'convert_list_to_filter', results_count,
+            lambda count: [list(range(item, item + 50)) for item in range(count)],
+            lambda id_lists: [convert_list_to_filter(ids) for ids in id_lists],
+        ),
+        Benchmark(
+            'client_get_cases', cases_count,
+            lambda count: make_fake_client({
+                'get_cases': make_payloads(make_case_data, count),
+            }).set_project_id(project_id=1),
+            lambda client: client.cases.get_cases(),
+        ),
+        Benchmark(
+            'client_request_overhead', 2000,
+            lambda count: make_fake_client({'get_case': make_case_data(1)}),
+            _bench_request_overhead,
+        ),
+    ]
+
+
+def measure(benchmark: Benchmark, repeat: int) -> float:
+    """Best items per second out of `repeat` runs."""
+    subject = benchmark.setup(benchmark.items_count)
+    best_seconds = float('inf')
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        benchmark.run(subject)
+        best_seconds = min(best_seconds, time.perf_counter() - started_at)
+    return benchmark.items_count / best_seconds
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--scale', type=float, default=1.0, help='payload size multiplier')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown')
+    parser.add_argument('--baselines', default=BASELINES_PATH)
+    parser.add_argument('--update-baselines', action='store_true')
+    parser.add_argument('--only', default=None, help='comma separated benchmark names')
+    return parser
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    benchmarks = get_benchmarks(args.scale)
+    if args.only:
+        benchmarks = [item for item in benchmarks if item.name in args.only.split(',')]
+    measurements = {}
+    for benchmark in benchmarks:
+        # throughput depends on payload size, so baselines are kept per scale
+        key = benchmark.name if args.scale == 1 else f'{benchmark.name}@{args.scale}'
+        measurements[key] = measure(benchmark, args.repeat)
+        sys.stdout.write(f'{key:<28} {measurements[key]:>14,.0f} items/s\n')
+    if args.update_baselines:
+        save_baselines(args.baselines, measurements)
+        return 0
+    regressions = find_regressions(measurements, load_baselines(args.baselines), args.threshold)
+    for name in regressions:
+        sys.stderr.write(f'Regression: {name} is more than {args.threshold:.0%} slower\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
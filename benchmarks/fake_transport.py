@@ -0,0 +1,37 @@
+"""Offline stand-in for the HTTP session used by Transport."""
+import json
+import typing
+
+from best_testrail_client.client import TestRailClient
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def json(self) -> typing.Any:
+        return json.loads(self.content)
+
+
+class FakeSession:
+    """Returns canned JSON bodies by endpoint name, e.g. `get_cases`."""
+    def __init__(self, routes: typing.Dict[str, typing.Any]):
+        self._routes = {
+            endpoint: json.dumps(payload).encode('utf8') for endpoint, payload in routes.items()
+        }
+        self.requests_count = 0
+
+    def request(self, method: str, url: str, **kwargs: typing.Any) -> FakeResponse:
+        self.requests_count += 1
+        endpoint = url.split('/api/v2/', 1)[1].split('/', 1)[0]
+        return FakeResponse(self._routes.get(endpoint, b'{}'))
+
+
+def make_fake_client(
+    routes: typing.Dict[str, typing.Any], **client_kwargs: typing.Any,
+) -> TestRailClient:
+    client = TestRailClient('https://testrail.invalid/', 'login', 'token', **client_kwargs)
+    client._transport._session = FakeSession(routes)  # type: ignore
+    return client
@@ -0,0 +1,79 @@
+"""Synthetic API payloads shaped like real TestRail responses."""
+import typing
+
+from best_testrail_client.custom_types import JsonData
+
+
+def make_case_data(case_id: int) -> JsonData:
+    return {
+        'created_by': 5,
+        'created_on': 1392300984 + case_id,
+        'custom_automation_id': f'tests.test_module.TestClass.test_{case_id}',
+        'custom_expected': 'Expected result of the case with some reasonably long text',
+        'custom_preconds': 'Preconditions',
+        'custom_steps_separated': [
+            {'content': f'Step {step}', 'expected': f'Expected {step}'} for step in range(3)
+        ],
+        'display_order': case_id,
+        'estimate': '1m 5s',
+        'estimate_forecast': None,
+        'id': case_id,
+        'milestone_id': 7,
+        'priority_id': 2,
+        'refs': f'RF-{case_id}, RF-{case_id + 1}',
+        'section_id': case_id % 500,
+        'suite_id': 1,
+        'template_id': 1,
+        'title': f'Case number {case_id} checks something important',
+        'type_id': 4,
+        'updated_by': 1,
+        'updated_on': 1393586511 + case_id,
+    }
+
+
+def make_result_data(result_id: int) -> JsonData:
+    return {
+        'assignedto_id': 1,
+        'attachment_ids': [],
+        'comment': 'This test failed: assertion error in step 2',
+        'created_by': 1,
+        'created_on': 1393851801 + result_id,
+        'custom_step_results': [{'status_id': 1}, {'status_id': 5}],
+        'defects': 'TR-1',
+        'elapsed': '5m',
+        'id': result_id,
+        'status_id': 5 if result_id % 7 == 0 else 1,
+        'test_id': result_id // 2,
+        'version': '1.0RC1',
+    }
+
+
+def make_result_field_data(field_id: int, configs_count: int = 5) -> JsonData:
+    return {
+        'configs': [
+            {
+                'context': {'is_global': False, 'project_ids': list(range(config_id + 1))},
+                'id': config_id,
+                'options': {
+                    'format': 'markdown',
+                    'has_actual': True,
+                    'has_expected': True,
+                    'is_required': False,
+                },
+            }
+            for config_id in range(configs_count)
+        ],
+        'description': None,
+        'display_order': field_id,
+        'id': field_id,
+        'label': f'Field {field_id}',
+        'name': f'field_{field_id}',
+        'system_name': f'custom_field_{field_id}',
+        'type_id': 11,
+    }
+
+
+def make_payloads(
+    factory: typing.Callable[[int], JsonData], count: int,
+) -> typing.List[JsonData]:
+    return [factory(item_id) for item_id in range(1, count + 1)]
@@ -3,6 +3,7 @@ import typing
 from best_testrail_client.api.base_api import BaseAPI
 from best_testrail_client.custom_types import ModelID, AttachmentFile, DeleteResult
 from best_testrail_client.models.attachment import Attachment
+from best_testrail_client.transport.fan_out import BulkResult
 
 
 class AttachmentsAPI(BaseAPI):
@@ -39,3 +40,12 @@ class AttachmentsAPI(BaseAPI):
         """http://docs.gurock.com/testrail-api2/reference-attachments#delete_attachment"""
         self._request(f'delete_attachment/{attachment_id}', method='POST')
         return True
+
+    # Custom methods
+    def get_attachments_for_test_many(
+        self, test_ids: typing.Iterable[ModelID],
+    ) -> BulkResult[ModelID, typing.List[Attachment]]:
+        """Concurrent get_attachments_for_test for each test id."""
+        return self._fan_out(
+            lambda test_id: self.get_attachments_for_test(test_id=test_id), test_ids,
+        )
@@ -1,22 +1,25 @@
 from __future__ import annotations
 
-import json
 import typing
 
-import requests
-
 from best_testrail_client.custom_types import ModelID, JsonData, Method, AttachmentFile
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.transport.deadline import check_deadline
+from best_testrail_client.transport.fan_out import BulkResult, KeyType, ValueType
+from best_testrail_client.transport.transport import Transport
 
 
 class BaseAPI:
-    def __init__(self, testrail_url: str, login: str, token: str):
-        self._token = token
-        self._login = login
+    def __init__(
+        self, testrail_url: str, login: str, token: str,
+        transport: typing.Optional[Transport] = None,
+    ):
         self._project_id: typing.Optional[ModelID] = None
+        self._transport = transport or Transport(testrail_url, login, token)
 
-        if not testrail_url.endswith('/'):
-            testrail_url += '/'
-        self._base_url = f'{testrail_url}index.php?/api/v2/'
+    def share_state(self, api: BaseAPI) -> BaseAPI:
+        """Share per-namespace state (listeners, batching) of an API of the same kind."""
+        return self
 
     def _request(
         self,
@@ -24,24 +27,50 @@ class BaseAPI:
         params: typing.Optional[JsonData] = None,
         attachment: typing.Optional[AttachmentFile] = None,
     ) -> typing.Any:
-        if data is None:
-            data = {}
-        attach_files = None
-        if attachment is not None:
-            attach_files = {'attachment': (attachment['name'], attachment['file_content'])}
-
-        response = requests.request(
-            method, f'{self._base_url}{url}', json=data,
-            auth=(self._login, self._token), params=params, files=attach_files,
+        return self._transport.request(
+            url, data=data, method=method, params=params, attachment=attachment,
         )
 
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response
+    def _fan_out(
+        self, func: typing.Callable[[KeyType], ValueType], keys: typing.Iterable[KeyType],
+    ) -> BulkResult[KeyType, ValueType]:
+        return self._transport.fan_out.map(func, keys)
+
+    def _iterate_pages(
+        self, fetch_page: typing.Callable[[int], typing.List[ValueType]], page_size: int,
+    ) -> typing.Iterator[typing.List[ValueType]]:
+        """Fetch pages by offset until a short page.
+
+        The first page is fetched alone, then the number of pages fetched at once doubles
+        while pages come back full, up to fan-out workers. A short listing costs one request.
+        """
+        offset, window = 0, 1
+        while True:
+            check_deadline()
+            bulk_result = self._fan_out(
+                fetch_page, [offset + page_size * page for page in range(window)],
+            )
+            for item in bulk_result.items:
+                if item.error is not None:
+                    raise item.error
+                yield item.value  # type: ignore
+                if len(item.value) < page_size:  # type: ignore
+                    return
+            offset += page_size * window
+            window = min(window * 2, self._transport.fan_out.concurrency)
 
 
 class ProjectDependableAPI(BaseAPI):
+    _is_project_id_frozen = False
+
     def set_project_id(self, project_id: ModelID) -> ProjectDependableAPI:
+        if self._is_project_id_frozen:
+            raise TestRailException('Project of a project client API is immutable')
         self._project_id = project_id
         return self
+
+    def freeze_project_id(self, project_id: ModelID) -> ProjectDependableAPI:
+        """Bind API to a project for good, used by project clients."""
+        self.set_project_id(project_id=project_id)
+        self._is_project_id_frozen = True
+        return self
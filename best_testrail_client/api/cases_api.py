@@ -1,14 +1,31 @@
+from __future__ import annotations
+
 import typing
 
-from best_testrail_client.api.base_api import ProjectDependableAPI
+import typing_extensions
+
+from best_testrail_client.api.base_api import BaseAPI, ProjectDependableAPI
 from best_testrail_client.custom_types import ModelID, CaseFilter, JsonData, DeleteResult
 from best_testrail_client.exceptions import TestRailException
 from best_testrail_client.models.case import Case
+from best_testrail_client.transport.fan_out import BulkResult
 from best_testrail_client.utils import convert_list_to_filter
 
 
+class CaseListener(typing_extensions.Protocol):
+    def case_saved(self, case: Case) -> None:
+        ...
+
+    def case_deleted(self, case_id: ModelID) -> None:
+        ...
+
+
 class CasesAPI(ProjectDependableAPI):
     """Cases API. http://docs.gurock.com/testrail-api2/reference-cases"""
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any):
+        super().__init__(*args, **kwargs)
+        self._listeners: typing.List[CaseListener] = []
+
     def get_case(self, case_id: ModelID) -> Case:
         """http://docs.gurock.com/testrail-api2/reference-cases#get_case"""
         case_data = self._request(f'get_case/{case_id}')
@@ -43,7 +60,9 @@ class CasesAPI(ProjectDependableAPI):
         created_case_data = self._request(
             f'add_case/{section_id}', method='POST', data=new_case_data,
         )
-        return Case.from_json(created_case_data)
+        created_case = Case.from_json(created_case_data)
+        self._notify_saved(created_case)
+        return created_case
 
     def update_case(self, case_id: ModelID, case: Case) -> Case:
         """http://docs.gurock.com/testrail-api2/reference-cases#update_case"""
@@ -51,9 +70,75 @@ class CasesAPI(ProjectDependableAPI):
         created_case_data = self._request(
             f'update_case/{case_id}', method='POST', data=new_case_data,
         )
-        return Case.from_json(created_case_data)
+        updated_case = Case.from_json(created_case_data)
+        self._notify_saved(updated_case)
+        return updated_case
 
     def delete_case(self, case_id: ModelID) -> DeleteResult:
         """http://docs.gurock.com/testrail-api2/reference-cases#delete_case"""
         self._request(f'delete_case/{case_id}', method='POST')
+        for listener in self._listeners:
+            listener.case_deleted(case_id)
         return True
+
+    # Custom methods
+    def iter_cases(
+        self,
+        project_id: typing.Optional[ModelID] = None,
+        suite_id: typing.Optional[ModelID] = None,
+        filters: typing.Optional[CaseFilter] = None,
+        page_size: int = 250,
+    ) -> typing.Iterator[typing.List[Case]]:
+        """Pages of get_cases, fetched concurrently."""
+        page_filters = dict(filters or {})
+        return self._iterate_pages(
+            lambda offset: self.get_cases(
+                project_id=project_id,
+                suite_id=suite_id,
+                filters=typing.cast(
+                    CaseFilter, {**page_filters, 'limit': page_size, 'offset': offset},
+                ),
+            ),
+            page_size=page_size,
+        )
+
+    def get_cases_by_ids(self, case_ids: typing.Iterable[ModelID]) -> BulkResult[ModelID, Case]:
+        """Concurrent get_case for each case id."""
+        return self._fan_out(lambda case_id: self.get_case(case_id=case_id), case_ids)
+
+    def add_cases_many(self, cases: typing.Iterable[Case]) -> BulkResult[Case, Case]:
+        """Concurrent add_case for each case into its section_id."""
+        return self._fan_out(
+            lambda case: self.add_case(section_id=case.section_id, case=case),  # type: ignore
+            cases,
+        )
+
+    def update_cases_many(self, cases: typing.Iterable[Case]) -> BulkResult[Case, Case]:
+        """Concurrent update_case for each case by its id."""
+        return self._fan_out(
+            lambda case: self.update_case(case_id=case.id, case=case),  # type: ignore
+            cases,
+        )
+
+    def delete_cases_many(
+        self, case_ids: typing.Iterable[ModelID],
+    ) -> BulkResult[ModelID, DeleteResult]:
+        """Concurrent delete_case for each case id."""
+        return self._fan_out(lambda case_id: self.delete_case(case_id=case_id), case_ids)
+
+    def subscribe(self, listener: CaseListener) -> CasesAPI:
+        """Notify listener about cases added, updated or deleted through this API."""
+        self._listeners.append(listener)
+        return self
+
+    def unsubscribe(self, listener: CaseListener) -> CasesAPI:
+        self._listeners.remove(listener)
+        return self
+
+    def share_state(self, api: BaseAPI) -> CasesAPI:
+        self._listeners = typing.cast(CasesAPI, api)._listeners
+        return self
+
+    def _notify_saved(self, case: Case) -> None:
+        for listener in self._listeners:
+            listener.case_saved(case)
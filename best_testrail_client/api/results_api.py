@@ -1,13 +1,32 @@
+from __future__ import annotations
+
+import collections
+import dataclasses
 import typing
 
 from best_testrail_client.api.base_api import BaseAPI
 from best_testrail_client.custom_types import ModelID, CreatedFilters, StatusFilters, JsonData
+from best_testrail_client.exceptions import APIError
 from best_testrail_client.models.result import Result
+from best_testrail_client.transport.deadline import has_overrides
+from best_testrail_client.transport.fan_out import BulkResult
+from best_testrail_client.transport.micro_batch import MicroBatcher
+from best_testrail_client.transport.scheduler import Priority, get_priority
 from best_testrail_client.utils import convert_list_to_filter
 
 
+# results are batched per run and priority
+_BatchKey = typing.Tuple[ModelID, Priority]
+
+
 class ResultsAPI(BaseAPI):
     """Results API. http://docs.gurock.com/testrail-api2/reference-results"""
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any):
+        super().__init__(*args, **kwargs)
+        self._batcher: typing.Optional[MicroBatcher[_BatchKey, Result, Result]] = None
+        # API holding the batcher, project client views use their client's one
+        self._batching_api = self
+
     def get_results(
         self,
         test_id: ModelID,
@@ -69,11 +88,13 @@ class ResultsAPI(BaseAPI):
 
     def add_result_for_case(self, run_id: ModelID, case_id: ModelID, result: Result) -> Result:
         """http://docs.gurock.com/testrail-api2/reference-results#add_result_for_case"""
-        new_result_data = result.to_json(include_none=False)
-        result_data = self._request(
-            f'add_result_for_case/{run_id}/{case_id}', method='POST', data=new_result_data,
-        )
-        return Result.from_json(data_json=result_data)
+        # calls under deadline or timeout overrides are not delayed by others in a batch
+        batcher = self._batching_api._batcher
+        if batcher is not None and not has_overrides():
+            return batcher.submit(
+                (run_id, get_priority()), dataclasses.replace(result, case_id=case_id),
+            )
+        return self._send_result_for_case(run_id=run_id, case_id=case_id, result=result)
 
     def add_results(self, run_id: ModelID, results: typing.List[Result]) -> typing.List[Result]:
         """http://docs.gurock.com/testrail-api2/reference-results#add_results"""
@@ -95,4 +116,90 @@ class ResultsAPI(BaseAPI):
         results_data = self._request(
             f'add_results_for_cases/{run_id}', method='POST', data=new_results_data,
         )
+        if isinstance(results_data, dict) and 'error' in results_data:
+            raise APIError(results_data['error'])
         return [Result.from_json(data_json=result_data) for result_data in results_data]
+
+    # Custom methods
+    def enable_auto_batching(self, window: float = 0.05, max_batch_size: int = 250) -> ResultsAPI:
+        """Merge concurrent add_result_for_case calls of a run into add_results_for_cases.
+
+        Callers wait up to `window` seconds for others, so enable it for concurrent reporters.
+        Results of a batch rejected by TestRail are added one by one, so only invalid ones
+        fail. Batches failed by the transport, e.g. with CircuitOpen, fail for every caller.
+        """
+        self._batching_api._batcher = MicroBatcher(
+            self._flush_results_for_cases, window=window, max_batch_size=max_batch_size,
+            fallback=self._add_batched_result, fallback_errors=(APIError,),
+        )
+        return self
+
+    def disable_auto_batching(self) -> ResultsAPI:
+        self._batching_api._batcher = None
+        return self
+
+    def share_state(self, api: BaseAPI) -> ResultsAPI:
+        self._batching_api = typing.cast(ResultsAPI, api)._batching_api
+        return self
+
+    def iter_results_for_run(
+        self,
+        run_id: ModelID,
+        filters: typing.Optional[CreatedFilters] = None,
+        page_size: int = 250,
+    ) -> typing.Iterator[typing.List[Result]]:
+        """Pages of get_results_for_run, fetched concurrently."""
+        page_filters = dict(filters or {})
+        return self._iterate_pages(
+            lambda offset: self.get_results_for_run(
+                run_id=run_id,
+                filters=typing.cast(
+                    CreatedFilters, {**page_filters, 'limit': page_size, 'offset': offset},
+                ),
+            ),
+            page_size=page_size,
+        )
+
+    def get_results_many(
+        self, test_ids: typing.Iterable[ModelID],
+    ) -> BulkResult[ModelID, typing.List[Result]]:
+        """Concurrent get_results for each test id."""
+        return self._fan_out(lambda test_id: self.get_results(test_id=test_id), test_ids)
+
+    def get_results_for_case_many(
+        self, run_id: ModelID, case_ids: typing.Iterable[ModelID],
+    ) -> BulkResult[ModelID, typing.List[Result]]:
+        """Concurrent get_results_for_case for each case id of the run."""
+        return self._fan_out(
+            lambda case_id: self.get_results_for_case(run_id=run_id, case_id=case_id), case_ids,
+        )
+
+    def _send_result_for_case(self, run_id: ModelID, case_id: ModelID, result: Result) -> Result:
+        new_result_data = result.to_json(include_none=False)
+        result_data = self._request(
+            f'add_result_for_case/{run_id}/{case_id}', method='POST', data=new_result_data,
+        )
+        if isinstance(result_data, dict) and 'error' in result_data:
+            raise APIError(result_data['error'])
+        return Result.from_json(data_json=result_data)
+
+    def _add_batched_result(self, batch_key: _BatchKey, result: Result) -> Result:
+        run_id, _ = batch_key
+        return self._send_result_for_case(
+            run_id=run_id, case_id=typing.cast(ModelID, result.case_id), result=result,
+        )
+
+    def _flush_results_for_cases(
+        self, batch_key: _BatchKey, results: typing.List[Result],
+    ) -> typing.List[Result]:
+        run_id, _ = batch_key
+        added_results = self.add_results_for_cases(run_id=run_id, results=results)
+        if any(added_result.case_id is None for added_result in added_results):
+            return added_results
+        # results are matched by case, in order for several results of one case
+        results_by_case: typing.Dict[typing.Optional[ModelID], typing.Deque[Result]] = (
+            collections.defaultdict(collections.deque)
+        )
+        for added_result in added_results:
+            results_by_case[added_result.case_id].append(added_result)
+        return [results_by_case[result.case_id].popleft() for result in results]
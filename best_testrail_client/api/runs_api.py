@@ -1,9 +1,10 @@
 import typing
 
 from best_testrail_client.api.base_api import ProjectDependableAPI
-from best_testrail_client.custom_types import ModelID, DeleteResult
+from best_testrail_client.custom_types import ModelID, DeleteResult, JsonData, RunFilter
 from best_testrail_client.exceptions import TestRailException
 from best_testrail_client.models.run import Run
+from best_testrail_client.utils import convert_list_to_filter
 
 
 class RunsAPI(ProjectDependableAPI):
@@ -13,12 +14,24 @@ class RunsAPI(ProjectDependableAPI):
         run_data = self._request(f'get_run/{run_id}')
         return Run.from_json(data_json=run_data)
 
-    def get_runs(self, project_id: typing.Optional[ModelID] = None) -> typing.List[Run]:
+    def get_runs(
+        self,
+        project_id: typing.Optional[ModelID] = None,
+        filters: typing.Optional[RunFilter] = None,
+    ) -> typing.List[Run]:
         """http://docs.gurock.com/testrail-api2/reference-runs#get_runs"""
+        params: JsonData = {}
+        if filters is not None:
+            params = {key: value for key, value in filters.items()}
+            params['created_by'] = convert_list_to_filter(values_list=filters.get('created_by'))
+            params['milestone_id'] = convert_list_to_filter(values_list=filters.get('milestone_id'))
+            params['suite_id'] = convert_list_to_filter(values_list=filters.get('suite_id'))
+            if filters.get('is_completed') is not None:
+                params['is_completed'] = int(bool(filters.get('is_completed')))
         project_id = project_id or self._project_id
         if project_id is None:
             raise TestRailException('Provide project id')
-        runs_data = self._request(f'get_runs/{project_id}')
+        runs_data = self._request(f'get_runs/{project_id}', params=params)
         return [Run.from_json(data_json=run_data) for run_data in runs_data]
 
     def add_run(self, run: Run, project_id: typing.Optional[ModelID] = None) -> Run:
@@ -47,3 +60,22 @@ class RunsAPI(ProjectDependableAPI):
         """http://docs.gurock.com/testrail-api2/reference-runs#delete_run"""
         self._request(f'delete_run/{run_id}', method='POST')
         return True
+
+    # Custom methods
+    def iter_runs(
+        self,
+        project_id: typing.Optional[ModelID] = None,
+        filters: typing.Optional[RunFilter] = None,
+        page_size: int = 250,
+    ) -> typing.Iterator[typing.List[Run]]:
+        """Pages of get_runs, fetched concurrently."""
+        page_filters = dict(filters or {})
+        return self._iterate_pages(
+            lambda offset: self.get_runs(
+                project_id=project_id,
+                filters=typing.cast(
+                    RunFilter, {**page_filters, 'limit': page_size, 'offset': offset},
+                ),
+            ),
+            page_size=page_size,
+        )
@@ -4,6 +4,7 @@ from best_testrail_client.api.base_api import ProjectDependableAPI
 from best_testrail_client.custom_types import ModelID, DeleteResult
 from best_testrail_client.exceptions import TestRailException
 from best_testrail_client.models.section import Section
+from best_testrail_client.transport.fan_out import BulkResult
 
 
 class SectionsAPI(ProjectDependableAPI):
@@ -51,3 +52,12 @@ class SectionsAPI(ProjectDependableAPI):
         """http://docs.gurock.com/testrail-api2/reference-sections#delete_section"""
         self._request(f'delete_section/{section_id}', method='POST')
         return True
+
+    # Custom methods
+    def add_sections_many(
+        self, sections: typing.Iterable[Section], project_id: typing.Optional[ModelID] = None,
+    ) -> BulkResult[Section, Section]:
+        """Concurrent add_section for each section, keyed by the section to create."""
+        return self._fan_out(
+            lambda section: self.add_section(section=section, project_id=project_id), sections,
+        )
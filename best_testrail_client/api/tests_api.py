@@ -1,8 +1,9 @@
 import typing
 
 from best_testrail_client.api.base_api import BaseAPI
-from best_testrail_client.custom_types import ModelID
+from best_testrail_client.custom_types import ModelID, JsonData, StatusFilters
 from best_testrail_client.models.test import Test
+from best_testrail_client.utils import convert_list_to_filter
 
 
 class TestsAPI(BaseAPI):
@@ -12,7 +13,35 @@ class TestsAPI(BaseAPI):
         test_data = self._request(f'get_test/{test_id}')
         return Test.from_json(test_data)
 
-    def get_tests(self, run_id: ModelID) -> typing.List[Test]:
+    def get_tests(
+        self, run_id: ModelID, filters: typing.Optional[StatusFilters] = None,
+    ) -> typing.List[Test]:
         """http://docs.gurock.com/testrail-api2/reference-tests#get_tests"""
-        tests_data = self._request(f'get_tests/{run_id}')
+        params: JsonData = {}
+        if filters is not None:
+            params = {
+                'limit': filters.get('limit'),
+                'offset': filters.get('offset'),
+                'status_id': convert_list_to_filter(values_list=filters.get('status_ids')),
+            }
+        tests_data = self._request(f'get_tests/{run_id}', params=params)
         return [Test.from_json(test_data) for test_data in tests_data]
+
+    # Custom methods
+    def iter_tests(
+        self,
+        run_id: ModelID,
+        filters: typing.Optional[StatusFilters] = None,
+        page_size: int = 250,
+    ) -> typing.Iterator[typing.List[Test]]:
+        """Pages of get_tests, fetched concurrently."""
+        page_filters = dict(filters or {})
+        return self._iterate_pages(
+            lambda offset: self.get_tests(
+                run_id=run_id,
+                filters=typing.cast(
+                    StatusFilters, {**page_filters, 'limit': page_size, 'offset': offset},
+                ),
+            ),
+            page_size=page_size,
+        )
@@ -2,6 +2,7 @@ import typing
 
 from best_testrail_client.api.base_api import BaseAPI
 from best_testrail_client.custom_types import ModelID, JsonData
+from best_testrail_client.exceptions import APIError
 from best_testrail_client.models.user import User
 
 
@@ -15,6 +16,8 @@ class UsersAPI(BaseAPI):
     def get_user_by_email(self, email: str) -> User:
         """http://docs.gurock.com/testrail-api2/reference-users#get_user_by_email"""
         user_data = self._request(f'get_user_by_email/{email}')
+        if 'error' in user_data:
+            raise APIError(user_data['error'])
         return User.from_json(user_data)
 
     def get_users(self) -> typing.List[User]:
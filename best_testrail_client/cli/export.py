@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from best_testrail_client.services.project_export import EXPORT_ENTITIES, ProjectExporter
+from best_testrail_client.services.sinks import SINK_FORMATS
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.client import TestRailClient
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        'export', help='export project cases, sections, runs and results',
+    )
+    parser.add_argument('--project-id', type=int, required=True)
+    parser.add_argument('--suite-id', type=int, default=None)
+    parser.add_argument('--output-dir', default='.')
+    parser.add_argument('--format', dest='sink_format', choices=SINK_FORMATS, default='jsonl')
+    parser.add_argument(
+        '--entities', default=','.join(EXPORT_ENTITIES),
+        help=f'comma separated entities to export, any of {", ".join(EXPORT_ENTITIES)}',
+    )
+    parser.add_argument('--page-size', type=int, default=250)
+    parser.set_defaults(handler=handle)
+
+
+def handle(client: TestRailClient, args: argparse.Namespace) -> int:
+    entities = [entity.strip() for entity in args.entities.split(',') if entity.strip()]
+    unknown_entities = set(entities) - set(EXPORT_ENTITIES)
+    if unknown_entities:
+        sys.stderr.write(f'Unknown entities: {", ".join(sorted(unknown_entities))}\n')
+        return 2
+    os.makedirs(args.output_dir, exist_ok=True)
+    exporter = ProjectExporter(
+        client, project_id=args.project_id, suite_id=args.suite_id, page_size=args.page_size,
+    )
+    for stats in exporter.export(args.output_dir, args.sink_format, entities=entities):
+        sys.stdout.write(stats.describe() + '\n')
+    return 0
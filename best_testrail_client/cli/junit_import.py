@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import re
+import sys
+import typing
+
+from best_testrail_client.custom_types import ModelID
+from best_testrail_client.enums import BaseResultStatus
+from best_testrail_client.models.result import Result
+from best_testrail_client.transport.scheduler import low_priority
+from best_testrail_client.utils import convert_seconds_to_timespan
+
+try:
+    from defusedxml.ElementTree import iterparse
+except ImportError:  # pragma: no cover
+    from xml.etree.ElementTree import iterparse  # noqa: DUO107, S405
+
+if False:  # TYPE_CHECKING
+    from xml.etree.ElementTree import Element  # noqa: DUO107, S405
+
+    from best_testrail_client.client import TestRailClient
+
+
+DEFAULT_CASE_ID_PATTERN = r'(?<![A-Za-z0-9])C(\d+)(?!\d)'
+CASE_ID_PROPERTIES = ('testrail_case_id', 'case_id')
+# finished elements not needed later, dropped as soon as they are parsed
+DROPPED_TAGS = ('testsuite', 'system-out', 'system-err')
+MAX_COMMENT_LENGTH = 4000
+
+
+@dataclasses.dataclass
+class JUnitCase:
+    name: str
+    classname: str
+    status: str
+    elapsed: float
+    case_id: typing.Optional[ModelID] = None
+    message: typing.Optional[str] = None
+
+
+def iter_junit_cases(
+    source: typing.Union[str, typing.BinaryIO], case_id_pattern: str = DEFAULT_CASE_ID_PATTERN,
+) -> typing.Iterator[JUnitCase]:
+    """Parse JUnit XML report incrementally, dropping testcases and suites once parsed."""
+    case_id_regex = re.compile(case_id_pattern)
+    parents: typing.List[Element] = []
+    for event, element in iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            parents.append(element)
+            continue
+        parents.pop()
+        if element.tag == 'testcase':
+            yield _build_junit_case(element, case_id_regex)
+        is_in_testcase = bool(parents) and parents[-1].tag == 'testcase'
+        if element.tag == 'testcase' or (element.tag in DROPPED_TAGS and not is_in_testcase):
+            element.clear()
+            if parents:
+                parents[-1].remove(element)
+
+
+def _build_junit_case(element: Element, case_id_regex: typing.Pattern) -> JUnitCase:
+    status, message = 'passed', None
+    for child in element:
+        if child.tag in ('failure', 'error', 'skipped'):
+            status = 'skipped' if child.tag == 'skipped' else 'failed'
+            message = '\n'.join(filter(None, [child.get('message'), child.text]))
+    name = element.get('name', '')
+    return JUnitCase(
+        name=name,
+        classname=element.get('classname', ''),
+        status=status,
+        elapsed=float(element.get('time') or 0),
+        case_id=_get_case_id(element, name, case_id_regex),
+        message=message[:MAX_COMMENT_LENGTH] if message else None,
+    )
+
+
+def _get_case_id(
+    element: Element, name: str, case_id_regex: typing.Pattern,
+) -> typing.Optional[ModelID]:
+    for case_property in element.iter('property'):
+        if case_property.get('name') in CASE_ID_PROPERTIES and case_property.get('value'):
+            case_id = case_property.get('value', '').strip().lstrip('Cc')
+            # a non-numeric id leaves the testcase unmapped, it is reported as skipped
+            return int(case_id) if case_id.isdigit() else None
+    match = case_id_regex.search(name)
+    return int(match.group(1)) if match else None
+
+
+def convert_to_result(
+    junit_case: JUnitCase, skipped_status_id: typing.Optional[ModelID] = None,
+) -> typing.Optional[Result]:
+    status_ids = {
+        'passed': BaseResultStatus.PASSED.value,
+        'failed': BaseResultStatus.FAILED.value,
+        'skipped': skipped_status_id,
+    }
+    status_id = status_ids[junit_case.status]
+    if junit_case.case_id is None or status_id is None:
+        return None
+    return Result(
+        status_id=status_id,
+        case_id=junit_case.case_id,
+        comment=junit_case.message,
+        elapsed=convert_seconds_to_timespan(junit_case.elapsed),
+    )
+
+
+@low_priority
+def import_junit(
+    client: TestRailClient,
+    run_id: ModelID,
+    reports: typing.Iterable[str],
+    case_id_pattern: str = DEFAULT_CASE_ID_PATTERN,
+    skipped_status_id: typing.Optional[ModelID] = None,
+    chunk_size: int = 500,
+    progress: typing.Optional[typing.TextIO] = None,
+) -> typing.Tuple[int, int]:
+    """Upload JUnit reports into run, returning uploaded and skipped testcase counts."""
+    uploaded_count, skipped_count = 0, 0
+    chunk: typing.List[Result] = []
+    for report in reports:
+        for junit_case in iter_junit_cases(report, case_id_pattern=case_id_pattern):
+            result = convert_to_result(junit_case, skipped_status_id=skipped_status_id)
+            if result is None:
+                skipped_count += 1
+                continue
+            chunk.append(result)
+            if len(chunk) >= chunk_size:
+                uploaded_count += _upload_chunk(client, run_id, chunk, progress)
+                chunk = []
+    if chunk:
+        uploaded_count += _upload_chunk(client, run_id, chunk, progress)
+    return uploaded_count, skipped_count
+
+
+def _upload_chunk(
+    client: TestRailClient, run_id: ModelID, chunk: typing.List[Result],
+    progress: typing.Optional[typing.TextIO],
+) -> int:
+    client.results.add_results_for_cases(run_id=run_id, results=chunk)
+    if progress is not None:
+        progress.write(f'Uploaded {len(chunk)} results to run {run_id}\n')
+    return len(chunk)
+
+
+def add_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser('import-junit', help='upload JUnit XML reports into a run')
+    parser.add_argument('reports', nargs='+', help='JUnit XML report paths')
+    parser.add_argument('--run-id', type=int, required=True)
+    parser.add_argument(
+        '--case-id-pattern', default=DEFAULT_CASE_ID_PATTERN,
+        help='regex with a group capturing case id in testcase name',
+    )
+    parser.add_argument(
+        '--skipped-status-id', type=int, default=None,
+        help='status for skipped testcases, they are not uploaded by default',
+    )
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.set_defaults(handler=handle)
+
+
+def handle(client: TestRailClient, args: argparse.Namespace) -> int:
+    uploaded_count, skipped_count = import_junit(
+        client,
+        run_id=args.run_id,
+        reports=args.reports,
+        case_id_pattern=args.case_id_pattern,
+        skipped_status_id=args.skipped_status_id,
+        chunk_size=args.chunk_size,
+        progress=sys.stderr,
+    )
+    sys.stderr.write(f'Done: {uploaded_count} results uploaded, {skipped_count} skipped\n')
+    return 0
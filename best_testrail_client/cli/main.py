@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+import os
+import typing
+
+from best_testrail_client import __version__
+from best_testrail_client.cli import export, junit_import
+from best_testrail_client.client import TestRailClient
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='best-testrail', description='TestRail API v2 tools.')
+    parser.add_argument('--version', action='version', version=__version__)
+    parser.add_argument(
+        '--url', default=os.environ.get('TESTRAIL_URL'),
+        help='TestRail URL, defaults to TESTRAIL_URL environment variable',
+    )
+    parser.add_argument(
+        '--login', default=os.environ.get('TESTRAIL_LOGIN'),
+        help='account email, defaults to TESTRAIL_LOGIN environment variable',
+    )
+    parser.add_argument(
+        '--token', default=os.environ.get('TESTRAIL_TOKEN'),
+        help='API token, defaults to TESTRAIL_TOKEN environment variable',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    junit_import.add_parser(subparsers)
+    export.add_parser(subparsers)
+    return parser
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not (args.url and args.login and args.token):
+        parser.error('TestRail url, login and token are required')
+    client = TestRailClient(args.url, args.login, args.token)
+    return args.handler(client, args)
@@ -1,47 +1,163 @@
 from __future__ import annotations
 
-from best_testrail_client.api.attachments_api import AttachmentsAPI
-from best_testrail_client.api.case_types_api import CaseTypesAPI
-from best_testrail_client.api.cases_api import CasesAPI
-from best_testrail_client.api.configurations_api import ConfigurationsAPI
-from best_testrail_client.api.milestoness_api import MilestonesAPI
-from best_testrail_client.api.priorities_api import PrioritiesAPI
-from best_testrail_client.api.result_fields_api import ResultFieldsAPI
-from best_testrail_client.api.results_api import ResultsAPI
-from best_testrail_client.api.runs_api import RunsAPI
-from best_testrail_client.api.sections_api import SectionsAPI
-from best_testrail_client.api.statuses_api import StatusesAPI
-from best_testrail_client.api.templates_api import TemplatesAPI
-from best_testrail_client.api.tests_api import TestsAPI
-from best_testrail_client.api.users_api import UsersAPI
-from best_testrail_client.custom_types import ModelID
+import importlib
+import threading
+import typing
+
+from best_testrail_client.api.base_api import BaseAPI, ProjectDependableAPI
+from best_testrail_client.custom_types import ModelID, Timeout
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.transport.transport import DEFAULT_TIMEOUT, Transport
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.api.attachments_api import AttachmentsAPI
+    from best_testrail_client.api.case_types_api import CaseTypesAPI
+    from best_testrail_client.api.cases_api import CasesAPI
+    from best_testrail_client.api.configurations_api import ConfigurationsAPI
+    from best_testrail_client.api.milestoness_api import MilestonesAPI
+    from best_testrail_client.api.priorities_api import PrioritiesAPI
+    from best_testrail_client.api.result_fields_api import ResultFieldsAPI
+    from best_testrail_client.api.results_api import ResultsAPI
+    from best_testrail_client.api.runs_api import RunsAPI
+    from best_testrail_client.api.sections_api import SectionsAPI
+    from best_testrail_client.api.statuses_api import StatusesAPI
+    from best_testrail_client.api.templates_api import TemplatesAPI
+    from best_testrail_client.api.tests_api import TestsAPI
+    from best_testrail_client.api.users_api import UsersAPI
+    from best_testrail_client.transport.circuit_breaker import CircuitBreaker
+    from best_testrail_client.transport.metrics import MetricsSnapshot
+    from best_testrail_client.transport.rate_limit import RateLimiter
+    from best_testrail_client.transport.scheduler import RequestScheduler
+
+APIType = typing.TypeVar('APIType', bound=BaseAPI)
+
+
+class LazyAPI(typing.Generic[APIType]):
+    """API namespace imported and created on first access, then cached on the client."""
+    def __init__(self, module_name: str, class_name: str):
+        self._module_name = f'best_testrail_client.api.{module_name}'
+        self._class_name = class_name
+        self._name = class_name
+
+    def __set_name__(self, owner: typing.Type[TestRailClient], name: str) -> None:
+        self._name = name
+
+    @typing.overload
+    def __get__(self, client: None, owner: typing.Type[TestRailClient]) -> LazyAPI[APIType]:
+        ...
+
+    @typing.overload
+    def __get__(self, client: TestRailClient, owner: typing.Type[TestRailClient]) -> APIType:
+        ...
+
+    def __get__(
+        self, client: typing.Optional[TestRailClient], owner: typing.Type[TestRailClient],
+    ) -> typing.Union[LazyAPI[APIType], APIType]:
+        if client is None:
+            return self
+        api_class = getattr(importlib.import_module(self._module_name), self._class_name)
+        with client._apis_lock:
+            if self._name not in client.__dict__:
+                api = api_class(
+                    client._testrail_url, client._login, client._token, client._transport,
+                )
+                client._setup_api(self._name, api)
+                client.__dict__[self._name] = api
+            return client.__dict__[self._name]
 
 
 class TestRailClient:
-    """http://docs.gurock.com/testrail-api2/start"""
-    def __init__(self, testrail_url: str, login: str, token: str):
-
-        self.attachments = AttachmentsAPI(testrail_url, login, token)
-        self.cases = CasesAPI(testrail_url, login, token)
-        self.case_types = CaseTypesAPI(testrail_url, login, token)
-        self.configurations = ConfigurationsAPI(testrail_url, login, token)
-        self.milestones = MilestonesAPI(testrail_url, login, token)
-        self.priorities = PrioritiesAPI(testrail_url, login, token)
-        self.results = ResultsAPI(testrail_url, login, token)
-        self.result_fields = ResultFieldsAPI(testrail_url, login, token)
-        self.runs = RunsAPI(testrail_url, login, token)
-        self.sections = SectionsAPI(testrail_url, login, token)
-        self.statuses = StatusesAPI(testrail_url, login, token)
-        self.templates = TemplatesAPI(testrail_url, login, token)
-        self.tests = TestsAPI(testrail_url, login, token)
-        self.users = UsersAPI(testrail_url, login, token)
+    """http://docs.gurock.com/testrail-api2/start
+
+    API namespaces are created on first access, so short-lived scripts pay only for
+    the ones they use.
+    """
+    attachments: LazyAPI[AttachmentsAPI] = LazyAPI('attachments_api', 'AttachmentsAPI')
+    cases: LazyAPI[CasesAPI] = LazyAPI('cases_api', 'CasesAPI')
+    case_types: LazyAPI[CaseTypesAPI] = LazyAPI('case_types_api', 'CaseTypesAPI')
+    configurations: LazyAPI[ConfigurationsAPI] = LazyAPI(
+        'configurations_api', 'ConfigurationsAPI',
+    )
+    milestones: LazyAPI[MilestonesAPI] = LazyAPI('milestoness_api', 'MilestonesAPI')
+    priorities: LazyAPI[PrioritiesAPI] = LazyAPI('priorities_api', 'PrioritiesAPI')
+    results: LazyAPI[ResultsAPI] = LazyAPI('results_api', 'ResultsAPI')
+    result_fields: LazyAPI[ResultFieldsAPI] = LazyAPI('result_fields_api', 'ResultFieldsAPI')
+    runs: LazyAPI[RunsAPI] = LazyAPI('runs_api', 'RunsAPI')
+    sections: LazyAPI[SectionsAPI] = LazyAPI('sections_api', 'SectionsAPI')
+    statuses: LazyAPI[StatusesAPI] = LazyAPI('statuses_api', 'StatusesAPI')
+    templates: LazyAPI[TemplatesAPI] = LazyAPI('templates_api', 'TemplatesAPI')
+    tests: LazyAPI[TestsAPI] = LazyAPI('tests_api', 'TestsAPI')
+    users: LazyAPI[UsersAPI] = LazyAPI('users_api', 'UsersAPI')
+
+    def __init__(
+        self, testrail_url: str, login: str, token: str,
+        coalesce_requests: bool = True, max_workers: int = 8,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        timeout: typing.Optional[Timeout] = DEFAULT_TIMEOUT,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        scheduler: typing.Optional[RequestScheduler] = None,
+        adaptive_concurrency: bool = False,
+    ):
+        self._testrail_url = testrail_url
+        self._login = login
+        self._token = token
+        self._project_id: typing.Optional[ModelID] = None
+        self._apis_lock = threading.Lock()
+        self._transport = Transport(
+            testrail_url, login, token,
+            coalesce_requests=coalesce_requests, max_workers=max_workers,
+            rate_limiter=rate_limiter, timeout=timeout, circuit_breaker=circuit_breaker,
+            scheduler=scheduler, adaptive_concurrency=adaptive_concurrency,
+        )
 
     # Custom methods
     def set_project_id(self, project_id: ModelID) -> TestRailClient:
-        self.cases.set_project_id(project_id=project_id)
-        self.configurations.set_project_id(project_id=project_id)
-        self.milestones.set_project_id(project_id=project_id)
-        self.runs.set_project_id(project_id=project_id)
-        self.sections.set_project_id(project_id=project_id)
-        self.templates.set_project_id(project_id=project_id)
+        """Set default project of project dependable APIs, including ones created later."""
+        with self._apis_lock:
+            self._project_id = project_id
+            apis = list(self.__dict__.values())
+        for api in apis:
+            if isinstance(api, ProjectDependableAPI):
+                api.set_project_id(project_id=project_id)
         return self
+
+    def for_project(self, project_id: ModelID) -> ProjectClient:
+        """Client view bound to a project, sharing this client's transport."""
+        return ProjectClient(self, project_id)
+
+    def get_metrics(self) -> MetricsSnapshot:
+        return self._transport.get_metrics()
+
+    def _setup_api(self, name: str, api: BaseAPI) -> None:
+        if self._project_id is not None and isinstance(api, ProjectDependableAPI):
+            api.set_project_id(project_id=self._project_id)
+
+
+class ProjectClient(TestRailClient):
+    """Immutable project-scoped view of a client, cheap to create for every project.
+
+    Views share the transport (connection pool, fan-out pool, rate limits, metrics) and
+    have their own API namespaces, so threads may work on different projects at once.
+    Namespaces share the client's per-namespace state: auto batching of results and
+    case listeners.
+    """
+    def __init__(self, client: TestRailClient, project_id: ModelID):
+        self._client = client
+        self._testrail_url = client._testrail_url
+        self._login = client._login
+        self._token = client._token
+        self._project_id = project_id
+        self._apis_lock = threading.Lock()
+        self._transport = client._transport
+
+    @property
+    def project_id(self) -> ModelID:
+        return typing.cast(ModelID, self._project_id)
+
+    def set_project_id(self, project_id: ModelID) -> TestRailClient:
+        raise TestRailException('Project client is immutable, use for_project() instead')
+
+    def _setup_api(self, name: str, api: BaseAPI) -> None:
+        api.share_state(getattr(self._client, name))
+        if isinstance(api, ProjectDependableAPI):
+            api.freeze_project_id(project_id=self.project_id)
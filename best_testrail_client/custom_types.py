@@ -13,6 +13,9 @@ JsonData = typing.Dict[FieldName, FieldValue]
 
 Method = typing_extensions.Literal['GET', 'POST']
 
+# seconds, or (connect, read) seconds as in requests
+Timeout = typing.Union[float, typing.Tuple[float, float]]
+
 
 class PaginatorFilters(typing_extensions.TypedDict, total=False):
     limit: typing.Optional[int]
@@ -39,6 +42,16 @@ class CaseFilter(CreatedFilters, total=False):
     updated_by: typing.Optional[typing.List[ModelID]]
 
 
+class RunFilter(PaginatorFilters, total=False):
+    created_after: typing.Optional[TimeStamp]
+    created_before: typing.Optional[TimeStamp]
+    created_by: typing.Optional[typing.List[ModelID]]
+    is_completed: typing.Optional[bool]
+    milestone_id: typing.Optional[typing.List[ModelID]]
+    refs_filter: typing.Optional[str]
+    suite_id: typing.Optional[typing.List[ModelID]]
+
+
 class AttachmentFile(typing_extensions.TypedDict):
     name: str
     file_content: bytes
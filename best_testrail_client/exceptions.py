@@ -1,2 +1,16 @@
 class TestRailException(Exception):
     pass
+
+
+class DeadlineExceeded(TestRailException):
+    pass
+
+
+class CircuitOpen(TestRailException):
+    def __init__(self, message: str, diverted: bool = False):
+        super().__init__(message)
+        self.diverted = diverted
+
+
+class APIError(TestRailException):
+    pass
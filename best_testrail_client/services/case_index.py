@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import collections
+import threading
+import typing
+
+from best_testrail_client.custom_types import ModelID, FieldName, FieldValue
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.case import Case
+
+
+IndexKey = typing.Hashable
+
+
+def normalize_title(title: str) -> str:
+    return ' '.join(title.split()).casefold()
+
+
+def split_refs(refs: typing.Optional[str]) -> typing.List[str]:
+    if not refs:
+        return []
+    return [ref.strip().casefold() for ref in refs.split(',') if ref.strip()]
+
+
+def get_custom_index_name(key: FieldName) -> str:
+    # custom keys get their own namespace, not to collide with built-in indexes
+    return f'custom:{key}'
+
+
+class CaseIndex:
+    """In-memory hash indexes over cases for O(1) lookups by refs, title, section and custom fields.
+
+    Build it from `CasesAPI.get_cases` output or `CaseMirror.iter_cases()` and subscribe it
+    to `CasesAPI` to keep it up to date with cases added or updated through the client.
+    """
+    def __init__(
+        self, cases: typing.Iterable[Case] = (), custom_keys: typing.Sequence[FieldName] = (),
+    ):
+        self._lock = threading.RLock()
+        self._custom_keys = tuple(custom_keys)
+        self._cases: typing.Dict[ModelID, Case] = {}
+        self._indexes: typing.Dict[str, typing.DefaultDict[IndexKey, typing.Set[ModelID]]] = {
+            index_name: collections.defaultdict(set)
+            for index_name in (
+                'refs', 'title', 'section', 'section_title',
+                *(get_custom_index_name(key) for key in self._custom_keys),
+            )
+        }
+        for case in cases:
+            self.add(case)
+
+    def __len__(self) -> int:
+        return len(self._cases)
+
+    def add(self, case: Case) -> None:
+        if case.id is None:
+            return
+        with self._lock:
+            self.remove(case.id)
+            self._cases[case.id] = case
+            for index_name, key in self._get_index_keys(case):
+                self._indexes[index_name][key].add(case.id)
+
+    def remove(self, case_id: ModelID) -> None:
+        with self._lock:
+            case = self._cases.pop(case_id, None)
+            if case is None:
+                return
+            for index_name, key in self._get_index_keys(case):
+                case_ids = self._indexes[index_name][key]
+                case_ids.discard(case_id)
+                if not case_ids:
+                    del self._indexes[index_name][key]
+
+    # CasesAPI listener interface
+    def case_saved(self, case: Case) -> None:
+        self.add(case)
+
+    def case_deleted(self, case_id: ModelID) -> None:
+        self.remove(case_id)
+
+    def get(self, case_id: ModelID) -> typing.Optional[Case]:
+        return self._cases.get(case_id)
+
+    def get_by_ref(self, ref: str) -> typing.List[Case]:
+        return self._lookup('refs', ref.strip().casefold())
+
+    def get_by_title(
+        self, title: str, section_id: typing.Optional[ModelID] = None,
+    ) -> typing.List[Case]:
+        if section_id is None:
+            return self._lookup('title', normalize_title(title))
+        return self._lookup('section_title', (section_id, normalize_title(title)))
+
+    def get_by_section(self, section_id: ModelID) -> typing.List[Case]:
+        return self._lookup('section', section_id)
+
+    def get_by_custom(self, key: FieldName, value: FieldValue) -> typing.List[Case]:
+        if key not in self._custom_keys:
+            raise TestRailException(f'Custom field {key!r} is not indexed, add it to custom_keys')
+        return self._lookup(get_custom_index_name(key), value)
+
+    def _lookup(self, index_name: str, key: IndexKey) -> typing.List[Case]:
+        with self._lock:
+            case_ids = self._indexes[index_name].get(key, ())
+            return [self._cases[case_id] for case_id in sorted(case_ids)]
+
+    def _get_index_keys(self, case: Case) -> typing.Iterator[typing.Tuple[str, IndexKey]]:
+        for ref in split_refs(case.refs):
+            yield 'refs', ref
+        if case.title is not None:
+            yield 'title', normalize_title(case.title)
+            yield 'section_title', (case.section_id, normalize_title(case.title))
+        if case.section_id is not None:
+            yield 'section', case.section_id
+        for key in self._custom_keys:
+            value = (case.custom or {}).get(key)
+            if value is not None and isinstance(value, typing.Hashable):
+                yield get_custom_index_name(key), value
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+import typing
+
+from best_testrail_client.custom_types import ModelID, CaseFilter, TimeStamp
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.case import Case
+from best_testrail_client.models.section import Section
+from best_testrail_client.transport.scheduler import low_priority
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.api.cases_api import CasesAPI
+    from best_testrail_client.api.sections_api import SectionsAPI
+
+
+MIRROR_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS cases ('
+    'id INTEGER PRIMARY KEY, section_id INTEGER, updated_on INTEGER, data TEXT NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS cases_section_id ON cases (section_id)',
+    'CREATE TABLE IF NOT EXISTS sections ('
+    'id INTEGER PRIMARY KEY, parent_id INTEGER, data TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)',
+)
+FETCH_BATCH_SIZE = 500
+DEFAULT_FULL_SYNC_INTERVAL = 24 * 60 * 60
+
+
+@dataclasses.dataclass
+class MirrorSyncStats:
+    full: bool
+    cases_fetched: int
+    cases_deleted: int
+    sections: int
+    watermark: typing.Optional[TimeStamp]
+
+
+class CaseMirror:
+    """Persistent on-disk (sqlite) mirror of project cases and sections.
+
+    The first sync fetches all cases, later ones fetch only cases with `updated_on` past
+    the stored watermark. Sections are cheap to fetch, so they are refreshed on every sync
+    and cases of removed sections are dropped with them. Cases deleted inside surviving
+    sections are only noticed by a full sync, which runs every `full_sync_interval` seconds
+    (daily by default, never with None). The file records its project and suite, opening
+    it for another one raises TestRailException.
+    """
+    def __init__(
+        self,
+        path: str,
+        cases_api: CasesAPI,
+        sections_api: SectionsAPI,
+        project_id: typing.Optional[ModelID] = None,
+        suite_id: typing.Optional[ModelID] = None,
+        full_sync_interval: typing.Optional[int] = DEFAULT_FULL_SYNC_INTERVAL,
+    ):
+        self._cases_api = cases_api
+        self._sections_api = sections_api
+        self._project_id = project_id
+        self._suite_id = suite_id
+        self._full_sync_interval = full_sync_interval
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        try:
+            with self._connection:
+                for statement in MIRROR_SCHEMA:
+                    self._connection.execute(statement)
+                self._check_scope(path)
+        except TestRailException:
+            self._connection.close()
+            raise
+
+    @property
+    def watermark(self) -> typing.Optional[TimeStamp]:
+        return self._get_meta('watermark')
+
+    @low_priority
+    def sync(self, full: bool = False) -> MirrorSyncStats:
+        with self._lock:
+            watermark = self.watermark
+            full = full or watermark is None or self._is_full_sync_due()
+            sections = self._sections_api.get_sections(
+                project_id=self._project_id, suite_id=self._suite_id,
+            )
+            filters: CaseFilter = {}
+            if not full and watermark is not None:
+                # same-second updates are refetched, upserts make it harmless
+                filters['updated_after'] = watermark - 1
+            cases = self._cases_api.get_cases(
+                project_id=self._project_id, suite_id=self._suite_id, filters=filters,
+            )
+            with self._connection:
+                deleted_count = self._store_sections(sections)
+                self._store_cases(cases)
+                if full:
+                    deleted_count += self._delete_cases_except(case.id for case in cases)
+                    self._set_meta('last_full_sync', int(time.time()))
+                watermark = self._update_watermark(cases, watermark)
+        return MirrorSyncStats(
+            full=full, cases_fetched=len(cases), cases_deleted=deleted_count,
+            sections=len(sections), watermark=watermark,
+        )
+
+    def get_case(self, case_id: ModelID) -> typing.Optional[Case]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT data FROM cases WHERE id = ?', (case_id,),
+            ).fetchone()
+        return Case.from_json(json.loads(row[0])) if row is not None else None
+
+    def get_cases(self, section_id: typing.Optional[ModelID] = None) -> typing.List[Case]:
+        return list(self.iter_cases(section_id=section_id))
+
+    def iter_cases(self, section_id: typing.Optional[ModelID] = None) -> typing.Iterator[Case]:
+        query = 'SELECT data FROM cases ORDER BY id'
+        params: typing.Tuple[ModelID, ...] = ()
+        if section_id is not None:
+            query = 'SELECT data FROM cases WHERE section_id = ? ORDER BY id'
+            params = (section_id,)
+        with self._lock:
+            cursor = self._connection.execute(query, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield Case.from_json(json.loads(row[0]))
+
+    def count_cases(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM cases').fetchone()[0]
+
+    def get_sections(self) -> typing.List[Section]:
+        with self._lock:
+            rows = self._connection.execute('SELECT data FROM sections ORDER BY id').fetchall()
+        return [Section.from_json(json.loads(row[0])) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _check_scope(self, path: str) -> None:
+        scope = {'project_id': self._project_id, 'suite_id': self._suite_id}
+        stored_scope = dict(self._connection.execute(
+            "SELECT key, value FROM meta WHERE key IN ('project_id', 'suite_id')",
+        ).fetchall())
+        if not stored_scope:
+            for key, value in scope.items():
+                self._connection.execute(
+                    'INSERT INTO meta (key, value) VALUES (?, ?)', (key, value),
+                )
+        elif stored_scope != scope:
+            raise TestRailException(
+                f'{path} mirrors project {stored_scope.get("project_id")} '
+                f'suite {stored_scope.get("suite_id")}, '
+                f'not project {self._project_id} suite {self._suite_id}',
+            )
+
+    def _is_full_sync_due(self) -> bool:
+        if self._full_sync_interval is None:
+            return False
+        last_full_sync = self._get_meta('last_full_sync') or 0
+        return time.time() - last_full_sync >= self._full_sync_interval
+
+    def _store_sections(self, sections: typing.List[Section]) -> int:
+        self._connection.execute('DELETE FROM sections')
+        self._connection.executemany(
+            'INSERT INTO sections (id, parent_id, data) VALUES (?, ?, ?)',
+            [
+                (section.id, section.parent_id, json.dumps(section.to_json()))
+                for section in sections
+            ],
+        )
+        return self._connection.execute(
+            'DELETE FROM cases WHERE section_id NOT IN (SELECT id FROM sections)',
+        ).rowcount
+
+    def _store_cases(self, cases: typing.List[Case]) -> None:
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO cases (id, section_id, updated_on, data) VALUES (?, ?, ?, ?)',
+            [
+                (case.id, case.section_id, case.updated_on, json.dumps(case.to_json()))
+                for case in cases
+            ],
+        )
+
+    def _delete_cases_except(self, case_ids: typing.Iterable[typing.Optional[ModelID]]) -> int:
+        self._connection.execute('CREATE TEMP TABLE IF NOT EXISTS synced_ids (id INTEGER)')
+        self._connection.execute('DELETE FROM synced_ids')
+        self._connection.executemany(
+            'INSERT INTO synced_ids (id) VALUES (?)', [(case_id,) for case_id in case_ids],
+        )
+        return self._connection.execute(
+            'DELETE FROM cases WHERE id NOT IN (SELECT id FROM synced_ids)',
+        ).rowcount
+
+    def _update_watermark(
+        self, cases: typing.List[Case], watermark: typing.Optional[TimeStamp],
+    ) -> typing.Optional[TimeStamp]:
+        updated_on = [case.updated_on for case in cases if case.updated_on is not None]
+        if watermark is not None:
+            updated_on.append(watermark)
+        if not updated_on:
+            return watermark
+        new_watermark = max(updated_on)
+        self._set_meta('watermark', new_watermark)
+        return new_watermark
+
+    def _get_meta(self, key: str) -> typing.Optional[int]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value FROM meta WHERE key = ?', (key,),
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def _set_meta(self, key: str, value: int) -> None:
+        self._connection.execute(
+            'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value),
+        )
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import dataclasses
+import enum
+import typing
+
+from best_testrail_client.custom_types import ModelID, FieldName, FieldValue, DeleteResult
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.case import Case
+from best_testrail_client.transport.fan_out import BulkResult
+from best_testrail_client.transport.scheduler import low_priority
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.api.cases_api import CasesAPI
+
+
+READ_ONLY_CASE_FIELDS = frozenset((
+    'created_by', 'created_on', 'display_order', 'estimate_forecast', 'id', 'suite_id',
+    'updated_by', 'updated_on',
+))
+
+FieldChange = typing.Tuple[FieldValue, FieldValue]
+
+
+class SyncAction(enum.Enum):
+    ADD = 'add'
+    UPDATE = 'update'
+    DELETE = 'delete'
+
+
+@dataclasses.dataclass
+class CaseChange:
+    action: SyncAction
+    key: FieldValue
+    case_id: typing.Optional[ModelID] = None
+    case: typing.Optional[Case] = None
+    changed_fields: typing.Dict[FieldName, FieldChange] = dataclasses.field(default_factory=dict)
+
+    def describe(self) -> str:
+        target = f'{self.key!r}' if self.case_id is None else f'{self.key!r} (C{self.case_id})'
+        fields = ', '.join(
+            f'{field_name}: {old!r} -> {new!r}'
+            for field_name, (old, new) in sorted(self.changed_fields.items())
+        )
+        return f'{self.action.value} {target}' + (f': {fields}' if fields else '')
+
+
+@dataclasses.dataclass
+class SyncPlan:
+    changes: typing.List[CaseChange]
+    unchanged_count: int
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.changes
+
+    def get_changes(self, action: SyncAction) -> typing.List[CaseChange]:
+        return [change for change in self.changes if change.action == action]
+
+    def describe(self) -> typing.List[str]:
+        return [change.describe() for change in self.changes]
+
+
+@dataclasses.dataclass
+class SyncResult:
+    added: BulkResult[Case, Case]
+    updated: BulkResult[Case, Case]
+    deleted: BulkResult[ModelID, DeleteResult]
+
+    @property
+    def is_successful(self) -> bool:
+        return all(
+            bulk_result.is_successful
+            for bulk_result in (self.added, self.updated, self.deleted)
+        )
+
+
+class CaseSync:
+    """Declarative sync of desired cases into TestRail with minimal writes.
+
+    Desired and current cases are matched by `key_field` (a case attribute or a custom
+    field name). Only fields set on desired cases are compared, so a sync without
+    changes costs a single `get_cases` call. Use `plan(...).describe()` for a dry run.
+    """
+    def __init__(
+        self,
+        cases_api: CasesAPI,
+        project_id: typing.Optional[ModelID] = None,
+        suite_id: typing.Optional[ModelID] = None,
+        key_field: FieldName = 'refs',
+        delete_missing: bool = False,
+    ):
+        self._cases_api = cases_api
+        self._project_id = project_id
+        self._suite_id = suite_id
+        self._key_field = key_field
+        self._delete_missing = delete_missing
+
+    def plan(
+        self,
+        desired: typing.Iterable[Case],
+        current: typing.Optional[typing.Iterable[Case]] = None,
+    ) -> SyncPlan:
+        if current is None:
+            current = self._cases_api.get_cases(
+                project_id=self._project_id, suite_id=self._suite_id,
+            )
+        current_by_key = self._group_by_key(current)
+        desired_by_key = self._get_desired_by_key(desired)
+        changes = [
+            change for change in (
+                self._diff(key, case, current_by_key.get(key))
+                for key, case in desired_by_key.items()
+            )
+            if change is not None
+        ]
+        unchanged_count = len(desired_by_key) - len(changes)
+        if self._delete_missing:
+            changes.extend(
+                CaseChange(action=SyncAction.DELETE, key=key, case_id=case.id)
+                for key, case in current_by_key.items() if key not in desired_by_key
+            )
+        return SyncPlan(changes=changes, unchanged_count=unchanged_count)
+
+    @low_priority
+    def apply(self, plan: SyncPlan) -> SyncResult:
+        return SyncResult(
+            added=self._cases_api.add_cases_many(
+                change.case for change in plan.get_changes(SyncAction.ADD)  # type: ignore
+            ),
+            updated=self._cases_api.update_cases_many(
+                change.case for change in plan.get_changes(SyncAction.UPDATE)  # type: ignore
+            ),
+            deleted=self._cases_api.delete_cases_many(
+                change.case_id for change in plan.get_changes(SyncAction.DELETE)  # type: ignore
+            ),
+        )
+
+    def _get_key(self, case: Case) -> FieldValue:
+        if self._key_field in READ_ONLY_CASE_FIELDS or not hasattr(case, self._key_field):
+            return (case.custom or {}).get(self._key_field)
+        return getattr(case, self._key_field)
+
+    def _get_desired_by_key(
+        self, desired: typing.Iterable[Case],
+    ) -> typing.Dict[FieldValue, Case]:
+        desired_by_key: typing.Dict[FieldValue, Case] = {}
+        for case in desired:
+            key = self._get_key(case)
+            if key is None or key in desired_by_key:
+                raise TestRailException(f'Desired cases need unique {self._key_field}: {key!r}')
+            desired_by_key[key] = case
+        return desired_by_key
+
+    def _group_by_key(self, cases: typing.Iterable[Case]) -> typing.Dict[FieldValue, Case]:
+        cases_by_key: typing.Dict[FieldValue, Case] = {}
+        for case in sorted(cases, key=lambda current_case: current_case.id or 0):
+            key = self._get_key(case)
+            if key is not None:
+                cases_by_key.setdefault(key, case)
+        return cases_by_key
+
+    def _diff(
+        self, key: FieldValue, desired: Case, current: typing.Optional[Case],
+    ) -> typing.Optional[CaseChange]:
+        desired_data = {
+            field_name: value for field_name, value in desired.to_json(include_none=False).items()
+            if field_name not in READ_ONLY_CASE_FIELDS
+        }
+        if current is None:
+            if desired.section_id is None:
+                raise TestRailException(f'New case {key!r} needs section_id')
+            return CaseChange(action=SyncAction.ADD, key=key, case=desired)
+        current_data = current.to_json()
+        changed_fields = {
+            field_name: (current_data.get(field_name), value)
+            for field_name, value in desired_data.items() if current_data.get(field_name) != value
+        }
+        if not changed_fields:
+            return None
+        patch = Case.from_json({'id': current.id, **{
+            field_name: value for field_name, (_, value) in changed_fields.items()
+        }})
+        return CaseChange(
+            action=SyncAction.UPDATE, key=key, case_id=current.id, case=patch,
+            changed_fields=changed_fields,
+        )
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import dataclasses
+import enum
+import random
+import threading
+import time
+import typing
+
+from best_testrail_client.custom_types import ModelID, RunFilter, TimeStamp
+from best_testrail_client.models.milestone import Milestone
+from best_testrail_client.models.run import Run
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.client import TestRailClient
+
+RUN_WATCHED_FIELDS = (
+    'name', 'passed_count', 'failed_count', 'blocked_count', 'retest_count',
+    'untested_count', 'is_completed', 'updated_on',
+)
+MILESTONE_WATCHED_FIELDS = (
+    'name', 'is_completed', 'is_started', 'due_on', 'start_on', 'completed_on', 'parent_id',
+)
+
+Fingerprint = typing.Tuple[typing.Any, ...]
+Entity = typing.Union[Run, Milestone]
+
+
+class ChangeType(enum.Enum):
+    CREATED = 'created'
+    UPDATED = 'updated'
+    COMPLETED = 'completed'
+    DELETED = 'deleted'
+
+
+@dataclasses.dataclass(frozen=True)
+class ChangeEvent:
+    entity: str
+    change_type: ChangeType
+    project_id: ModelID
+    entity_id: ModelID
+    current: typing.Optional[Entity] = None
+    changed_fields: typing.Tuple[str, ...] = ()
+
+
+@dataclasses.dataclass
+class _ProjectState:
+    interval: float
+    is_initialized: bool = False
+    # run id -> (created_on, fingerprint) of active runs
+    runs: typing.Dict[ModelID, typing.Tuple[TimeStamp, Fingerprint]] = dataclasses.field(
+        default_factory=dict,
+    )
+    # newest created_on of seen runs, all runs created before it were seen
+    created_on: typing.Optional[TimeStamp] = None
+    # ids of seen runs created in the watermark second
+    boundary_ids: typing.Set[ModelID] = dataclasses.field(default_factory=set)
+    milestones: typing.Dict[ModelID, Fingerprint] = dataclasses.field(default_factory=dict)
+
+
+def get_fingerprint(entity: Entity, fields: typing.Tuple[str, ...]) -> Fingerprint:
+    return tuple(getattr(entity, field) for field in fields)
+
+
+def get_changed_fields(
+    previous: Fingerprint, current: Fingerprint, fields: typing.Tuple[str, ...],
+) -> typing.Tuple[str, ...]:
+    return tuple(
+        field for field, old, new in zip(fields, previous, current) if old != new
+    )
+
+
+class ChangeWatcher:
+    """Polls runs and milestones of projects and emits only changes since the last poll.
+
+    Every poll lists active runs and completed runs created since the newest seen run:
+    runs gone from the active list are completed if found there and deleted otherwise,
+    and runs created and completed between polls are found there too. State is a
+    fingerprint of watched fields per entity. The first poll of a project records state
+    without events.
+    """
+    def __init__(
+        self,
+        client: TestRailClient,
+        project_ids: typing.Iterable[ModelID] = (),
+        interval: float = 60,
+        jitter: float = 0.1,
+        watch_runs: bool = True,
+        watch_milestones: bool = True,
+    ):
+        self._client = client
+        self._interval = interval
+        self._jitter = jitter
+        self._watch_runs = watch_runs
+        self._watch_milestones = watch_milestones
+        self._lock = threading.Lock()
+        self._projects: typing.Dict[ModelID, _ProjectState] = {}
+        for project_id in project_ids:
+            self.add_project(project_id)
+
+    def add_project(self, project_id: ModelID, interval: typing.Optional[float] = None) -> None:
+        with self._lock:
+            self._projects.setdefault(project_id, _ProjectState(interval or self._interval))
+
+    def remove_project(self, project_id: ModelID) -> None:
+        with self._lock:
+            self._projects.pop(project_id, None)
+
+    def poll(self, project_id: ModelID) -> typing.List[ChangeEvent]:
+        with self._lock:
+            state = self._projects.get(project_id)
+        if state is None:
+            return []
+        events: typing.List[ChangeEvent] = []
+        if self._watch_runs:
+            events.extend(self._poll_runs(project_id, state))
+        if self._watch_milestones:
+            events.extend(self._poll_milestones(project_id, state))
+        is_initialized, state.is_initialized = state.is_initialized, True
+        return events if is_initialized else []
+
+    def poll_all(self) -> typing.List[ChangeEvent]:
+        with self._lock:
+            project_ids = list(self._projects)
+        events = []
+        for project_id in project_ids:
+            events.extend(self.poll(project_id))
+        return events
+
+    def follow(
+        self, stop_event: typing.Optional[threading.Event] = None,
+    ) -> typing.Iterator[ChangeEvent]:
+        """Stream of events, every project polled at its interval with jitter.
+
+        Projects added or removed while following are picked up within `interval`.
+        """
+        stop_event = stop_event or threading.Event()
+        # project id -> monotonic time of its next poll
+        schedule: typing.Dict[ModelID, float] = {}
+        while not stop_event.is_set():
+            intervals = self._update_schedule(schedule)
+            now = time.monotonic()
+            next_poll_at = min(schedule.values(), default=now + self._interval)
+            if next_poll_at > now:
+                stop_event.wait(min(next_poll_at - now, self._interval))
+                continue
+            project_id = min(schedule, key=schedule.__getitem__)
+            yield from self.poll(project_id)
+            schedule[project_id] = time.monotonic() + self._get_delay(intervals[project_id])
+
+    def watch(
+        self,
+        callback: typing.Callable[[ChangeEvent], None],
+        stop_event: typing.Optional[threading.Event] = None,
+    ) -> None:
+        for event in self.follow(stop_event=stop_event):
+            callback(event)
+
+    def _update_schedule(
+        self, schedule: typing.Dict[ModelID, float],
+    ) -> typing.Dict[ModelID, float]:
+        """Sync schedule with watched projects, returning their intervals."""
+        with self._lock:
+            intervals = {project_id: state.interval for project_id, state in self._projects.items()}
+        for project_id in set(schedule) - set(intervals):
+            del schedule[project_id]
+        for project_id, interval in intervals.items():
+            if project_id not in schedule:
+                # first polls are spread, not to poll all watched projects at once
+                first_delay = interval * random.uniform(0, self._jitter)  # noqa: S311
+                schedule[project_id] = time.monotonic() + first_delay
+        return intervals
+
+    def _get_delay(self, interval: float) -> float:
+        return interval * (1 + random.uniform(-self._jitter, self._jitter))  # noqa: S311
+
+    def _poll_runs(self, project_id: ModelID, state: _ProjectState) -> typing.List[ChangeEvent]:
+        active_runs = {
+            run.id: run
+            for page in self._client.runs.iter_runs(project_id, filters={'is_completed': False})
+            for run in page if run.id is not None
+        }
+        events = []
+        for run_id, run in active_runs.items():
+            fingerprint = get_fingerprint(run, RUN_WATCHED_FIELDS)
+            previous = state.runs.get(run_id)
+            if previous is None:
+                events.append(ChangeEvent('run', ChangeType.CREATED, project_id, run_id, run))
+            elif previous[1] != fingerprint:
+                events.append(ChangeEvent(
+                    'run', ChangeType.UPDATED, project_id, run_id, run,
+                    get_changed_fields(previous[1], fingerprint, RUN_WATCHED_FIELDS),
+                ))
+        gone_runs = {
+            run_id: created_on for run_id, (created_on, _) in state.runs.items()
+            if run_id not in active_runs
+        }
+        completed_runs = self._get_completed_runs(project_id, state, gone_runs)
+        events.extend(self._get_completed_run_events(project_id, state, gone_runs, completed_runs))
+        state.runs = {
+            run_id: (run.created_on or 0, get_fingerprint(run, RUN_WATCHED_FIELDS))
+            for run_id, run in active_runs.items()
+        }
+        self._advance(state, [*active_runs.values(), *completed_runs.values()])
+        return events
+
+    def _get_completed_runs(
+        self, project_id: ModelID, state: _ProjectState, gone_runs: typing.Dict[ModelID, TimeStamp],
+    ) -> typing.Dict[ModelID, Run]:
+        """Completed runs created since the watermark or the oldest gone run."""
+        filters: RunFilter = {'is_completed': True}
+        created_ons = list(gone_runs.values())
+        if state.created_on is not None:
+            created_ons.append(state.created_on)
+        if created_ons:
+            filters['created_after'] = min(created_ons) - 1
+        return {
+            run.id: run
+            for page in self._client.runs.iter_runs(project_id, filters=filters)
+            for run in page if run.id is not None
+        }
+
+    def _get_completed_run_events(
+        self,
+        project_id: ModelID,
+        state: _ProjectState,
+        gone_runs: typing.Dict[ModelID, TimeStamp],
+        completed_runs: typing.Dict[ModelID, Run],
+    ) -> typing.List[ChangeEvent]:
+        events = []
+        for run_id, run in completed_runs.items():
+            if run_id not in gone_runs and self._is_unseen(state, run):
+                events.append(ChangeEvent('run', ChangeType.CREATED, project_id, run_id, run))
+                events.append(ChangeEvent('run', ChangeType.COMPLETED, project_id, run_id, run))
+        events.extend(
+            ChangeEvent('run', ChangeType.COMPLETED, project_id, run_id, completed_runs[run_id])
+            if run_id in completed_runs
+            else ChangeEvent('run', ChangeType.DELETED, project_id, run_id)
+            for run_id in gone_runs
+        )
+        return events
+
+    @staticmethod
+    def _is_unseen(state: _ProjectState, run: Run) -> bool:
+        if state.created_on is None:
+            return True
+        created_on = run.created_on or 0
+        is_boundary_unseen = created_on == state.created_on and run.id not in state.boundary_ids
+        return created_on > state.created_on or is_boundary_unseen
+
+    @staticmethod
+    def _advance(state: _ProjectState, runs: typing.List[Run]) -> None:
+        created_ons = [run.created_on or 0 for run in runs]
+        if not created_ons:
+            return
+        newest_created_on = max(created_ons)
+        if state.created_on is None or newest_created_on > state.created_on:
+            state.created_on = newest_created_on
+            state.boundary_ids = set()
+        state.boundary_ids.update(
+            typing.cast(ModelID, run.id) for run in runs
+            if (run.created_on or 0) == state.created_on
+        )
+
+    def _poll_milestones(
+        self, project_id: ModelID, state: _ProjectState,
+    ) -> typing.List[ChangeEvent]:
+        milestones = {
+            milestone.id: milestone
+            for milestone in self._client.milestones.get_milestones(project_id=project_id)
+            if milestone.id is not None
+        }
+        events = [
+            ChangeEvent('milestone', ChangeType.DELETED, project_id, milestone_id)
+            for milestone_id in state.milestones if milestone_id not in milestones
+        ]
+        for milestone_id, milestone in milestones.items():
+            fingerprint = get_fingerprint(milestone, MILESTONE_WATCHED_FIELDS)
+            previous = state.milestones.get(milestone_id)
+            if previous is None:
+                events.append(ChangeEvent(
+                    'milestone', ChangeType.CREATED, project_id, milestone_id, milestone,
+                ))
+            elif previous != fingerprint:
+                changed_fields = get_changed_fields(previous, fingerprint, MILESTONE_WATCHED_FIELDS)
+                change_type = ChangeType.UPDATED
+                if 'is_completed' in changed_fields and milestone.is_completed:
+                    change_type = ChangeType.COMPLETED
+                events.append(ChangeEvent(
+                    'milestone', change_type, project_id, milestone_id, milestone, changed_fields,
+                ))
+        state.milestones = {
+            milestone_id: get_fingerprint(milestone, MILESTONE_WATCHED_FIELDS)
+            for milestone_id, milestone in milestones.items()
+        }
+        return events
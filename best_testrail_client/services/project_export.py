@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import dataclasses
+import os
+import time
+import typing
+
+from best_testrail_client.custom_types import ModelID
+from best_testrail_client.models.basemodel import BaseModel
+from best_testrail_client.models.case import Case
+from best_testrail_client.models.result import Result
+from best_testrail_client.models.run import Run
+from best_testrail_client.models.section import Section
+from best_testrail_client.services.sinks import Sink, open_sink
+from best_testrail_client.transport.scheduler import low_priority
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.client import TestRailClient
+
+
+EXPORT_ENTITIES: typing.Dict[str, typing.Type[BaseModel]] = {
+    'cases': Case,
+    'sections': Section,
+    'runs': Run,
+    'results': Result,
+}
+
+
+@dataclasses.dataclass
+class ExportStats:
+    entity: str
+    records: int = 0
+    seconds: float = 0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else 0
+
+    def describe(self) -> str:
+        return (
+            f'{self.entity}: {self.records} records in {self.seconds:.1f}s '
+            f'({self.records_per_second:.1f}/s)'
+        )
+
+
+class ProjectExporter:
+    """Streams project cases, sections, runs and results into one sink per entity.
+
+    Cases, sections and runs are exported in parallel; results are exported run by run
+    after runs. Pages are written as they arrive, so memory is bounded by page size.
+    """
+    def __init__(
+        self,
+        client: TestRailClient,
+        project_id: ModelID,
+        suite_id: typing.Optional[ModelID] = None,
+        page_size: int = 250,
+    ):
+        self._client = client
+        self._project_id = project_id
+        self._suite_id = suite_id
+        self._page_size = page_size
+
+    @low_priority
+    def export(
+        self,
+        output_dir: str,
+        sink_format: str = 'jsonl',
+        entities: typing.Iterable[str] = tuple(EXPORT_ENTITIES),
+    ) -> typing.List[ExportStats]:
+        entities = list(entities)
+        sinks = {
+            entity: open_sink(
+                os.path.join(output_dir, f'{entity}.{sink_format}'), sink_format,
+                EXPORT_ENTITIES[entity],
+            )
+            for entity in entities
+        }
+        stats = {entity: ExportStats(entity=entity) for entity in entities}
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                export_funcs = (self._export_cases, self._export_sections, self._export_runs)
+                futures = [
+                    executor.submit(contextvars.copy_context().run, export_func, sinks, stats)
+                    for export_func in export_funcs
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            for sink in sinks.values():
+                sink.close()
+        return list(stats.values())
+
+    def _export_cases(
+        self, sinks: typing.Dict[str, Sink], stats: typing.Dict[str, ExportStats],
+    ) -> None:
+        if 'cases' in sinks:
+            self._write_pages(
+                self._client.cases.iter_cases(
+                    project_id=self._project_id, suite_id=self._suite_id,
+                    page_size=self._page_size,
+                ),
+                sinks['cases'], stats['cases'],
+            )
+
+    def _export_sections(
+        self, sinks: typing.Dict[str, Sink], stats: typing.Dict[str, ExportStats],
+    ) -> None:
+        if 'sections' in sinks:
+            sections = self._client.sections.get_sections(
+                project_id=self._project_id, suite_id=self._suite_id,
+            )
+            self._write_pages([sections], sinks['sections'], stats['sections'])
+
+    def _export_runs(
+        self, sinks: typing.Dict[str, Sink], stats: typing.Dict[str, ExportStats],
+    ) -> None:
+        if 'runs' not in sinks and 'results' not in sinks:
+            return
+        run_ids: typing.List[ModelID] = []
+        runs_pages = self._client.runs.iter_runs(
+            project_id=self._project_id, page_size=self._page_size,
+        )
+        for page in runs_pages:
+            run_ids.extend(run.id for run in page if run.id is not None)
+            if 'runs' in sinks:
+                self._write_pages([page], sinks['runs'], stats['runs'])
+        if 'results' in sinks:
+            self._export_results(run_ids, sinks['results'], stats['results'])
+
+    def _export_results(
+        self, run_ids: typing.List[ModelID], sink: Sink, stats: ExportStats,
+    ) -> None:
+        for run_id in run_ids:
+            self._write_pages(
+                self._client.results.iter_results_for_run(run_id=run_id, page_size=self._page_size),
+                sink, stats,
+            )
+
+    @staticmethod
+    def _write_pages(
+        pages: typing.Iterable[typing.Sequence[BaseModel]], sink: Sink, stats: ExportStats,
+    ) -> None:
+        started_at = time.monotonic()
+        for page in pages:
+            for model in page:
+                sink.write(model)
+            stats.records += len(page)
+        stats.seconds += time.monotonic() - started_at
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+import typing
+
+from best_testrail_client.custom_types import CreatedFilters, ModelID, TimeStamp
+from best_testrail_client.models.result import Result
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.api.results_api import ResultsAPI
+
+
+@dataclasses.dataclass
+class _RunWatermark:
+    created_on: typing.Optional[TimeStamp] = None
+    # ids of results created in the watermark second, refetched by the next poll
+    boundary_ids: typing.Set[ModelID] = dataclasses.field(default_factory=set)
+
+
+class RunResultsFollower:
+    """Tail-follows results of runs, fetching only results created after a watermark.
+
+    Every poll requests results with `created_after` one second before the newest seen
+    result, so results added within the same second are not missed, and drops results
+    already seen by id. New results are returned oldest first.
+    """
+    def __init__(
+        self,
+        results_api: ResultsAPI,
+        run_ids: typing.Iterable[ModelID] = (),
+        page_size: int = 250,
+    ):
+        self._results_api = results_api
+        self._page_size = page_size
+        self._lock = threading.Lock()
+        self._watermarks: typing.Dict[ModelID, _RunWatermark] = {}
+        for run_id in run_ids:
+            self.add_run(run_id)
+
+    def add_run(self, run_id: ModelID, created_after: typing.Optional[TimeStamp] = None) -> None:
+        """Follow a run, from its first result or from results created after a timestamp."""
+        with self._lock:
+            self._watermarks.setdefault(run_id, _RunWatermark(created_on=created_after))
+
+    def remove_run(self, run_id: ModelID) -> None:
+        with self._lock:
+            self._watermarks.pop(run_id, None)
+
+    def get_watermark(self, run_id: ModelID) -> typing.Optional[TimeStamp]:
+        with self._lock:
+            watermark = self._watermarks.get(run_id)
+        return watermark.created_on if watermark is not None else None
+
+    def poll(self) -> typing.List[Result]:
+        """New results of all followed runs since the previous poll."""
+        with self._lock:
+            run_ids = list(self._watermarks)
+        new_results: typing.List[Result] = []
+        for run_id in run_ids:
+            new_results.extend(self.poll_run(run_id))
+        return new_results
+
+    def poll_run(self, run_id: ModelID) -> typing.List[Result]:
+        with self._lock:
+            watermark = self._watermarks.get(run_id)
+            if watermark is None:
+                return []
+            created_on, seen_ids = watermark.created_on, set(watermark.boundary_ids)
+        filters: CreatedFilters = {}
+        if created_on is not None:
+            filters['created_after'] = created_on - 1
+        new_results = []
+        for page in self._results_api.iter_results_for_run(
+            run_id=run_id, filters=filters, page_size=self._page_size,
+        ):
+            for result in page:
+                if result.id is None or result.id in seen_ids:
+                    continue
+                seen_ids.add(result.id)
+                new_results.append(result)
+        new_results.sort(key=lambda result: (result.created_on or 0, result.id or 0))
+        self._advance(run_id, new_results)
+        return new_results
+
+    def follow(
+        self, interval: float = 5, stop_event: typing.Optional[threading.Event] = None,
+    ) -> typing.Iterator[Result]:
+        """Stream of new results, polled every `interval` seconds until `stop_event` is set."""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            yield from self.poll()
+            stop_event.wait(interval)
+
+    def watch(
+        self,
+        callback: typing.Callable[[Result], None],
+        interval: float = 5,
+        stop_event: typing.Optional[threading.Event] = None,
+    ) -> None:
+        """Call `callback` for every new result until `stop_event` is set."""
+        for result in self.follow(interval=interval, stop_event=stop_event):
+            callback(result)
+
+    def _advance(self, run_id: ModelID, new_results: typing.List[Result]) -> None:
+        created_ons = [result.created_on for result in new_results if result.created_on is not None]
+        if not created_ons:
+            return
+        newest_created_on = max(created_ons)
+        with self._lock:
+            watermark = self._watermarks.get(run_id)
+            if watermark is None:
+                return
+            if watermark.created_on is None or newest_created_on > watermark.created_on:
+                watermark.created_on = newest_created_on
+                watermark.boundary_ids = set()
+            watermark.boundary_ids.update(
+                typing.cast(ModelID, result.id)
+                for result in new_results if result.created_on == watermark.created_on
+            )
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import dataclasses
+import typing
+
+from best_testrail_client.custom_types import ModelID, CaseFilter
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.run import Run
+from best_testrail_client.transport.scheduler import low_priority
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.api.cases_api import CasesAPI
+    from best_testrail_client.api.runs_api import RunsAPI
+    from best_testrail_client.api.tests_api import TestsAPI
+
+
+class RunBuilder:
+    """Creates runs with very large case selections.
+
+    The run is created with the first `chunk_size` cases and extended chunk by chunk
+    with `update_run`. TestRail replaces the selection on update, so every update carries
+    the selection built so far, but each call only makes the server add one chunk of tests.
+    """
+    def __init__(
+        self, runs_api: RunsAPI, tests_api: TestsAPI, cases_api: CasesAPI, chunk_size: int = 5000,
+    ):
+        self._runs_api = runs_api
+        self._tests_api = tests_api
+        self._cases_api = cases_api
+        self._chunk_size = chunk_size
+
+    @low_priority
+    def create(
+        self,
+        run: Run,
+        project_id: typing.Optional[ModelID] = None,
+        case_ids: typing.Optional[typing.Iterable[ModelID]] = None,
+        case_filter: typing.Optional[CaseFilter] = None,
+        verify: bool = True,
+    ) -> Run:
+        """Create run with case_ids or cases selected by case_filter.
+
+        An empty case_filter selects all suite cases server-side with `include_all`.
+        """
+        if case_ids is None and case_filter is None:
+            raise TestRailException('Provide case ids or case filter')
+        if case_ids is None and not case_filter:
+            return self._runs_api.add_run(
+                dataclasses.replace(run, include_all=True, case_ids=None), project_id=project_id,
+            )
+        if case_ids is None:
+            case_ids = self._select_case_ids(run, project_id, case_filter or {})
+        selected_case_ids = list(dict.fromkeys(case_ids))
+        created_run = self._create_chunked(run, project_id, selected_case_ids)
+        if verify:
+            self.verify(created_run, selected_case_ids)
+        return created_run
+
+    def verify(self, run: Run, case_ids: typing.List[ModelID]) -> None:
+        """Check run tests match case_ids, retrying the selection update once."""
+        missing_case_ids = self._get_missing_case_ids(run, case_ids)
+        if missing_case_ids:
+            self._update_selection(run, case_ids)
+            missing_case_ids = self._get_missing_case_ids(run, case_ids)
+        if missing_case_ids:
+            raise TestRailException(
+                f'Run {run.id} is missing {len(missing_case_ids)} cases, '
+                f'e.g. {sorted(missing_case_ids)[:10]}',
+            )
+
+    def _select_case_ids(
+        self, run: Run, project_id: typing.Optional[ModelID], case_filter: CaseFilter,
+    ) -> typing.List[ModelID]:
+        cases = self._cases_api.get_cases(
+            project_id=project_id, suite_id=run.suite_id, filters=case_filter,
+        )
+        return [case.id for case in cases if case.id is not None]
+
+    def _create_chunked(
+        self, run: Run, project_id: typing.Optional[ModelID], case_ids: typing.List[ModelID],
+    ) -> Run:
+        created_run = self._runs_api.add_run(
+            dataclasses.replace(run, include_all=False, case_ids=case_ids[:self._chunk_size]),
+            project_id=project_id,
+        )
+        chunk_ends = range(self._chunk_size * 2, len(case_ids) + self._chunk_size, self._chunk_size)
+        for chunk_end in chunk_ends:
+            created_run = self._update_selection(created_run, case_ids[:chunk_end])
+        return created_run
+
+    def _update_selection(self, run: Run, case_ids: typing.List[ModelID]) -> Run:
+        return self._runs_api.update_run(
+            Run(name=run.name, include_all=False, id=run.id, case_ids=case_ids),
+        )
+
+    def _get_missing_case_ids(
+        self, run: Run, case_ids: typing.List[ModelID],
+    ) -> typing.Set[ModelID]:
+        missing_case_ids = set(case_ids)
+        for page in self._tests_api.iter_tests(run_id=run.id):  # type: ignore
+            missing_case_ids.difference_update(test.case_id for test in page)
+        return missing_case_ids
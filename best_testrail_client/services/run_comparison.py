@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import dataclasses
+import enum
+import queue
+import threading
+import typing
+
+from best_testrail_client.custom_types import ModelID
+from best_testrail_client.enums import BaseResultStatus
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.client import TestRailClient
+
+PASSED_STATUS_IDS = (BaseResultStatus.PASSED.value,)
+FAILED_STATUS_IDS = (BaseResultStatus.FAILED.value,)
+
+# (test id, status id) of a test waiting for its case in the other run
+_TestState = typing.Tuple[typing.Optional[ModelID], typing.Optional[ModelID]]
+_CompactTest = typing.Tuple[ModelID, typing.Optional[ModelID], typing.Optional[ModelID]]
+# (side, page of (case id, test id, status id), error), page is None when the side is done
+_PageMessage = typing.Tuple[
+    int, typing.Optional[typing.List[_CompactTest]], typing.Optional[Exception],
+]
+
+
+class DiffKind(enum.Enum):
+    NEW_FAILURE = 'new_failure'
+    FIXED = 'fixed'
+    FLIPPED = 'flipped'
+    MISSING = 'missing'
+    ADDED = 'added'
+    UNCHANGED = 'unchanged'
+
+
+@dataclasses.dataclass(frozen=True)
+class CaseDiff:
+    case_id: ModelID
+    kind: DiffKind
+    base_test_id: typing.Optional[ModelID] = None
+    base_status_id: typing.Optional[ModelID] = None
+    target_test_id: typing.Optional[ModelID] = None
+    target_status_id: typing.Optional[ModelID] = None
+
+
+@dataclasses.dataclass
+class RunComparison:
+    base_run_id: ModelID
+    target_run_id: ModelID
+    diffs: typing.List[CaseDiff] = dataclasses.field(default_factory=list)
+    counts: typing.Dict[DiffKind, int] = dataclasses.field(default_factory=dict)
+
+    def add(self, diff: CaseDiff) -> None:
+        self.counts[diff.kind] = self.counts.get(diff.kind, 0) + 1
+        if diff.kind != DiffKind.UNCHANGED:
+            self.diffs.append(diff)
+
+    def get_count(self, kind: DiffKind) -> int:
+        return self.counts.get(kind, 0)
+
+    def get_diffs(self, kind: DiffKind) -> typing.List[CaseDiff]:
+        return [diff for diff in self.diffs if diff.kind == kind]
+
+
+class RunComparator:
+    """Compares latest statuses of tests of two runs, joined by case id.
+
+    Tests of both runs are fetched concurrently and joined as pages arrive, so diffs are
+    streamed before the runs are fully fetched. Only tests not yet matched in the other run
+    are kept, as compact tuples. A change to a failed status is a new failure, a change
+    from a failed to a passed status is a fix, any other status change is a flip.
+    """
+    def __init__(
+        self,
+        client: TestRailClient,
+        page_size: int = 250,
+        passed_status_ids: typing.Iterable[ModelID] = PASSED_STATUS_IDS,
+        failed_status_ids: typing.Iterable[ModelID] = FAILED_STATUS_IDS,
+        max_pending_pages: int = 8,
+    ):
+        self._client = client
+        self._page_size = page_size
+        self._passed_status_ids = frozenset(passed_status_ids)
+        self._failed_status_ids = frozenset(failed_status_ids)
+        self._max_pending_pages = max_pending_pages
+
+    def compare(self, base_run_id: ModelID, target_run_id: ModelID) -> RunComparison:
+        """Changes between runs with counts of every diff kind."""
+        comparison = RunComparison(base_run_id=base_run_id, target_run_id=target_run_id)
+        for diff in self.iter_diffs(base_run_id, target_run_id, include_unchanged=True):
+            comparison.add(diff)
+        return comparison
+
+    def iter_diffs(
+        self, base_run_id: ModelID, target_run_id: ModelID, include_unchanged: bool = False,
+    ) -> typing.Iterator[CaseDiff]:
+        """Stream of diffs per case, missing and added cases come last."""
+        pages: queue.Queue[_PageMessage] = queue.Queue(maxsize=self._max_pending_pages)
+        stop_event = threading.Event()
+        unmatched: typing.Tuple[typing.Dict[ModelID, _TestState], ...] = ({}, {})
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            for side, run_id in enumerate((base_run_id, target_run_id)):
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._fetch_tests, side, run_id, pages, stop_event,
+                )
+            try:
+                yield from self._join(pages, unmatched, include_unchanged)
+            finally:
+                stop_event.set()
+        for case_id, (test_id, status_id) in unmatched[0].items():
+            yield CaseDiff(
+                case_id, DiffKind.MISSING, base_test_id=test_id, base_status_id=status_id,
+            )
+        for case_id, (test_id, status_id) in unmatched[1].items():
+            yield CaseDiff(
+                case_id, DiffKind.ADDED, target_test_id=test_id, target_status_id=status_id,
+            )
+
+    def get_kind(
+        self, base_status_id: typing.Optional[ModelID], target_status_id: typing.Optional[ModelID],
+    ) -> DiffKind:
+        if base_status_id == target_status_id:
+            return DiffKind.UNCHANGED
+        if target_status_id in self._failed_status_ids:
+            return DiffKind.NEW_FAILURE
+        is_fixed = (
+            base_status_id in self._failed_status_ids
+            and target_status_id in self._passed_status_ids
+        )
+        return DiffKind.FIXED if is_fixed else DiffKind.FLIPPED
+
+    def _join(
+        self,
+        pages: queue.Queue[_PageMessage],
+        unmatched: typing.Tuple[typing.Dict[ModelID, _TestState], ...],
+        include_unchanged: bool,
+    ) -> typing.Iterator[CaseDiff]:
+        finished_sides = 0
+        while finished_sides < len(unmatched):
+            side, page, error = pages.get()
+            if error is not None:
+                raise error
+            if page is None:
+                finished_sides += 1
+                continue
+            for diff in self._join_page(side, page, unmatched):
+                if include_unchanged or diff.kind != DiffKind.UNCHANGED:
+                    yield diff
+
+    def _join_page(
+        self,
+        side: int,
+        page: typing.List[_CompactTest],
+        unmatched: typing.Tuple[typing.Dict[ModelID, _TestState], ...],
+    ) -> typing.Iterator[CaseDiff]:
+        other_unmatched = unmatched[1 - side]
+        for case_id, test_id, status_id in page:
+            if case_id not in other_unmatched:
+                unmatched[side][case_id] = (test_id, status_id)
+                continue
+            tests = [other_unmatched.pop(case_id), (test_id, status_id)]
+            (base_test_id, base_status_id), (target_test_id, target_status_id) = (
+                tests if side else tests[::-1]
+            )
+            yield CaseDiff(
+                case_id, self.get_kind(base_status_id, target_status_id),
+                base_test_id, base_status_id, target_test_id, target_status_id,
+            )
+
+    def _fetch_tests(
+        self,
+        side: int,
+        run_id: ModelID,
+        pages: queue.Queue[_PageMessage],
+        stop_event: threading.Event,
+    ) -> None:
+        try:
+            for page in self._client.tests.iter_tests(run_id=run_id, page_size=self._page_size):
+                compact_page = [
+                    (test.case_id, test.id, test.status_id)
+                    for test in page if test.case_id is not None
+                ]
+                if not self._put(pages, (side, compact_page, None), stop_event):
+                    return
+        except Exception as error:  # noqa: B902
+            self._put(pages, (side, None, error), stop_event)
+            return
+        self._put(pages, (side, None, None), stop_event)
+
+    @staticmethod
+    def _put(
+        pages: queue.Queue[_PageMessage], message: _PageMessage, stop_event: threading.Event,
+    ) -> bool:
+        """Put message, giving up when the consumer has stopped."""
+        while not stop_event.is_set():
+            try:
+                pages.put(message, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
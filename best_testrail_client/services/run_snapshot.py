@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import json
+import os
+import sqlite3
+import tempfile
+import typing
+
+from best_testrail_client.custom_types import ModelID, JsonData
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.run import Run
+from best_testrail_client.models.test import Test
+from best_testrail_client.transport.scheduler import low_priority
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.client import TestRailClient
+
+
+class RunSnapshotExporter:
+    """Streams a run snapshot to a JSONL file, one record per test.
+
+    The first line is a `run` record, every following line is a `test` record with the test,
+    its results and attachment metadata. Results of the run are fetched in concurrent pages
+    and spooled to a temporary sqlite file, tests are then written in chunks as their pages
+    arrive, so memory stays bounded by `chunk_size` tests and the pages in flight.
+    Exporting into an existing file of the same run resumes it, skipping tests that are
+    already written.
+    """
+    def __init__(self, client: TestRailClient, chunk_size: int = 200, page_size: int = 250):
+        self._client = client
+        self._chunk_size = chunk_size
+        self._page_size = page_size
+
+    @low_priority
+    def export(self, run_id: ModelID, path: str) -> int:
+        """Export run into path, returning the number of test records written."""
+        written_test_ids = self._prepare_resume(run_id, path)
+        with tempfile.TemporaryDirectory() as spool_dir:
+            spool = sqlite3.connect(os.path.join(spool_dir, 'results.sqlite'))
+            try:
+                run = self._fetch_run(run_id, spool)
+                with open(path, 'a', encoding='utf8') as snapshot_file:
+                    if written_test_ids is None:
+                        self._write_record(snapshot_file, {'type': 'run', 'run': run.to_json()})
+                    return self._write_run_tests(
+                        snapshot_file, run_id, run, written_test_ids or set(), spool,
+                    )
+            finally:
+                spool.close()
+
+    def _fetch_run(self, run_id: ModelID, spool: sqlite3.Connection) -> Run:
+        spool.execute('CREATE TABLE results (test_id INTEGER, data TEXT)')
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            run_future = executor.submit(
+                contextvars.copy_context().run, self._client.runs.get_run, run_id=run_id,
+            )
+            self._spool_results(run_id, spool)
+            run = run_future.result()
+        spool.execute('CREATE INDEX results_test_id ON results (test_id)')
+        return run
+
+    def _write_run_tests(
+        self,
+        snapshot_file: typing.TextIO,
+        run_id: ModelID,
+        run: Run,
+        written_test_ids: typing.Set[ModelID],
+        spool: sqlite3.Connection,
+    ) -> int:
+        written_count = 0
+        chunk: typing.List[Test] = []
+        for page in self._client.tests.iter_tests(run_id=run_id, page_size=self._page_size):
+            chunk.extend(test for test in page if test.id not in written_test_ids)
+            while len(chunk) >= self._chunk_size:
+                self._write_tests(snapshot_file, run, chunk[:self._chunk_size], spool)
+                written_count += self._chunk_size
+                chunk = chunk[self._chunk_size:]
+        if chunk:
+            self._write_tests(snapshot_file, run, chunk, spool)
+        return written_count + len(chunk)
+
+    def _prepare_resume(
+        self, run_id: ModelID, path: str,
+    ) -> typing.Optional[typing.Set[ModelID]]:
+        """Return ids of tests already in path, None if nothing was written yet."""
+        if not os.path.exists(path):
+            return None
+        written_test_ids, complete_size = set(), 0
+        with open(path, 'rb') as snapshot_file:
+            for line in snapshot_file:
+                if not line.endswith(b'\n'):
+                    break
+                complete_size += len(line)
+                record = json.loads(line)
+                if record['type'] == 'run' and record['run'].get('id') != run_id:
+                    raise TestRailException(
+                        f'{path} is a snapshot of run {record["run"].get("id")}, not {run_id}',
+                    )
+                if record['type'] == 'test':
+                    written_test_ids.add(record['test']['id'])
+        with open(path, 'r+b') as snapshot_file:
+            snapshot_file.truncate(complete_size)  # drop a partially written last line
+        return written_test_ids if complete_size else None
+
+    def _spool_results(self, run_id: ModelID, spool: sqlite3.Connection) -> None:
+        pages = self._client.results.iter_results_for_run(run_id=run_id, page_size=self._page_size)
+        for page in pages:
+            spool.executemany(
+                'INSERT INTO results (test_id, data) VALUES (?, ?)',
+                [(result.test_id, json.dumps(result.to_json())) for result in page],
+            )
+
+    def _write_tests(
+        self,
+        snapshot_file: typing.TextIO,
+        run: Run,
+        tests: typing.List[Test],
+        spool: sqlite3.Connection,
+    ) -> None:
+        attachments = self._client.attachments.get_attachments_for_test_many(
+            test.id for test in tests  # type: ignore
+        )
+        if not attachments.is_successful:
+            raise next(iter(attachments.errors.values()))
+        for test, test_attachments in zip(tests, attachments.values):
+            results = [
+                json.loads(row[0]) for row in spool.execute(
+                    'SELECT data FROM results WHERE test_id = ? ORDER BY rowid', (test.id,),
+                )
+            ]
+            self._write_record(snapshot_file, {
+                'type': 'test',
+                'run_id': run.id,
+                'test': test.to_json(),
+                'results': results,
+                'attachments': [attachment.to_json() for attachment in test_attachments],
+            })
+        snapshot_file.flush()
+
+    @staticmethod
+    def _write_record(snapshot_file: typing.TextIO, record: JsonData) -> None:
+        snapshot_file.write(json.dumps(record) + '\n')
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+import typing
+
+from best_testrail_client.custom_types import ModelID
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.section import Section
+from best_testrail_client.transport.scheduler import low_priority
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.api.sections_api import SectionsAPI
+
+
+SectionPath = typing.Tuple[str, ...]
+
+
+class SectionTree:
+    """Cached section hierarchy of a project (suite) with a path to section index.
+
+    Paths are section names joined with `separator`, e.g. `'A/B/C'`.
+    """
+    def __init__(
+        self,
+        sections_api: SectionsAPI,
+        project_id: typing.Optional[ModelID] = None,
+        suite_id: typing.Optional[ModelID] = None,
+        separator: str = '/',
+    ):
+        self._sections_api = sections_api
+        self._project_id = project_id
+        self._suite_id = suite_id
+        self._separator = separator
+        self._lock = threading.RLock()
+        # serializes finding and creating missing sections, not to create duplicates
+        self._create_lock = threading.Lock()
+        self._sections: typing.Dict[ModelID, Section] = {}
+        self._paths: typing.Dict[SectionPath, ModelID] = {}
+        self._is_loaded = False
+
+    def refresh(self) -> None:
+        sections = self._sections_api.get_sections(
+            project_id=self._project_id, suite_id=self._suite_id,
+        )
+        with self._lock:
+            self._sections = {section.id: section for section in sections if section.id}
+            self._paths = {}
+            for section in sorted(sections, key=lambda item: (item.depth or 0, item.id or 0)):
+                parent_path = self._get_section_path(section.parent_id)
+                if parent_path is not None:
+                    self._paths.setdefault((*parent_path, section.name), section.id)  # type: ignore
+            self._is_loaded = True
+
+    def get_section(self, path: str) -> typing.Optional[Section]:
+        self._ensure_loaded()
+        with self._lock:
+            section_id = self._paths.get(self._split_path(path))
+            return self._sections.get(section_id) if section_id is not None else None
+
+    def get_path(self, section_id: ModelID) -> typing.Optional[str]:
+        self._ensure_loaded()
+        with self._lock:
+            section_path = self._get_section_path(section_id)
+        return self._separator.join(section_path) if section_path else None
+
+    @low_priority
+    def ensure_paths(self, paths: typing.Iterable[str]) -> typing.Dict[str, ModelID]:
+        """Create all missing sections for paths, returning path to section id mapping.
+
+        Sections of one depth level are created in parallel, levels are created in order.
+        Missing sections are created by one call at a time, after the tree is re-read.
+        """
+        split_paths = {path: self._split_path(path) for path in paths}
+        empty_paths = [path for path, section_path in split_paths.items() if not section_path]
+        if empty_paths:
+            raise TestRailException(f'Section paths must not be empty: {empty_paths}')
+        self._ensure_loaded()
+        if self._get_missing_levels(split_paths.values()):
+            with self._create_lock:
+                self.refresh()
+                for level in self._get_missing_levels(split_paths.values()):
+                    self._create_level(level)
+        with self._lock:
+            return {path: self._paths[section_path] for path, section_path in split_paths.items()}
+
+    def _ensure_loaded(self) -> None:
+        if not self._is_loaded:
+            self.refresh()
+
+    def _split_path(self, path: str) -> SectionPath:
+        return tuple(name.strip() for name in path.split(self._separator) if name.strip())
+
+    def _get_section_path(
+        self, section_id: typing.Optional[ModelID],
+    ) -> typing.Optional[SectionPath]:
+        if section_id is None:
+            return ()
+        section = self._sections.get(section_id)
+        if section is None:
+            return None
+        parent_path = self._get_section_path(section.parent_id)
+        return None if parent_path is None else (*parent_path, section.name)
+
+    def _get_missing_levels(
+        self, split_paths: typing.Iterable[SectionPath],
+    ) -> typing.List[typing.List[SectionPath]]:
+        missing: typing.Set[SectionPath] = set()
+        with self._lock:
+            for section_path in split_paths:
+                for depth in range(1, len(section_path) + 1):
+                    if section_path[:depth] not in self._paths:
+                        missing.add(section_path[:depth])
+        levels: typing.Dict[int, typing.List[SectionPath]] = {}
+        for section_path in sorted(missing):
+            levels.setdefault(len(section_path), []).append(section_path)
+        return [levels[depth] for depth in sorted(levels)]
+
+    def _create_level(self, level: typing.List[SectionPath]) -> None:
+        with self._lock:
+            new_sections = [
+                Section(
+                    name=section_path[-1], parent_id=self._paths.get(section_path[:-1]),
+                    suite_id=self._suite_id,
+                )
+                for section_path in level
+            ]
+        bulk_result = self._sections_api.add_sections_many(
+            new_sections, project_id=self._project_id,
+        )
+        with self._lock:
+            for section_path, item in zip(level, bulk_result.items):
+                if item.value is not None:
+                    self._sections[item.value.id] = item.value  # type: ignore
+                    self._paths[section_path] = item.value.id  # type: ignore
+        if not bulk_result.is_successful:
+            failed_paths = [
+                self._separator.join(section_path)
+                for section_path, item in zip(level, bulk_result.items) if item.error is not None
+            ]
+            raise TestRailException(f'Failed to create sections: {", ".join(failed_paths)}')
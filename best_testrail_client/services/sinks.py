@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import csv
+import dataclasses
+import json
+import typing
+
+import typing_extensions
+
+from best_testrail_client.custom_types import JsonData
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.basemodel import BaseModel
+
+SINK_FORMATS = ('jsonl', 'csv', 'parquet')
+
+
+class Sink(typing_extensions.Protocol):
+    def write(self, model: BaseModel) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+def get_columns(model_class: typing.Type[BaseModel]) -> typing.List[str]:
+    return [field.name for field in dataclasses.fields(model_class)]  # type: ignore
+
+
+def flatten_model(model: BaseModel, columns: typing.List[str]) -> JsonData:
+    """Model values by column, nested values (lists, custom fields) encoded as JSON."""
+    flat_data = {}
+    for column in columns:
+        value = model.cast_value(getattr(model, column))
+        flat_data[column] = json.dumps(value) if isinstance(value, (dict, list)) else value
+    return flat_data
+
+
+class JsonLinesSink:
+    def __init__(self, path: str, model_class: typing.Type[BaseModel]):
+        self._file = open(path, 'w', encoding='utf8')
+
+    def write(self, model: BaseModel) -> None:
+        self._file.write(json.dumps(model.to_json()) + '\n')
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CsvSink:
+    def __init__(self, path: str, model_class: typing.Type[BaseModel]):
+        self._columns = get_columns(model_class)
+        self._file = open(path, 'w', encoding='utf8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=self._columns)
+        self._writer.writeheader()
+
+    def write(self, model: BaseModel) -> None:
+        self._writer.writerow(flatten_model(model, self._columns))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetSink:
+    """Writes models in row groups of `batch_size`, requires pyarrow."""
+    def __init__(self, path: str, model_class: typing.Type[BaseModel], batch_size: int = 10000):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            raise TestRailException('Parquet export requires pyarrow')
+        self._pyarrow = pyarrow
+        self._columns = get_columns(model_class)
+        self._schema = pyarrow.schema([
+            (field.name, self._get_arrow_type(pyarrow, str(field.type)))
+            for field in dataclasses.fields(model_class)  # type: ignore
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._batch_size = batch_size
+        self._batch: typing.List[JsonData] = []
+
+    def write(self, model: BaseModel) -> None:
+        self._batch.append(flatten_model(model, self._columns))
+        if len(self._batch) >= self._batch_size:
+            self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def _flush(self) -> None:
+        if self._batch:
+            self._writer.write_table(
+                self._pyarrow.Table.from_pylist(self._batch, schema=self._schema),
+            )
+            self._batch = []
+
+    @staticmethod
+    def _get_arrow_type(pyarrow: typing.Any, type_name: str) -> typing.Any:
+        if 'List' in type_name or 'Dict' in type_name or 'JsonData' in type_name:
+            return pyarrow.string()
+        if 'bool' in type_name:
+            return pyarrow.bool_()
+        if 'int' in type_name or 'ModelID' in type_name or 'TimeStamp' in type_name:
+            return pyarrow.int64()
+        return pyarrow.string()
+
+
+def open_sink(path: str, sink_format: str, model_class: typing.Type[BaseModel]) -> Sink:
+    sink_classes: typing.Dict[str, typing.Any] = {
+        'jsonl': JsonLinesSink,
+        'csv': CsvSink,
+        'parquet': ParquetSink,
+    }
+    if sink_format not in sink_classes:
+        raise TestRailException(f'Unknown sink format: {sink_format}')
+    return sink_classes[sink_format](path, model_class)
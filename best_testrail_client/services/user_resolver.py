@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+import time
+import typing
+
+from best_testrail_client.custom_types import ModelID
+from best_testrail_client.exceptions import APIError
+from best_testrail_client.models.user import User
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.api.users_api import UsersAPI
+
+
+class UserResolver:
+    """Thread-safe cached user lookups by email, name and id.
+
+    All users are loaded with one `get_users` call on first use. Emails missing from it are
+    looked up with `get_user_by_email`, unknown ones are remembered for `negative_ttl` seconds.
+    Transport errors of the lookup are raised and not remembered.
+    """
+    def __init__(self, users_api: UsersAPI, negative_ttl: float = 300):
+        self._users_api = users_api
+        self._negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._is_loaded = False
+        self._by_id: typing.Dict[ModelID, User] = {}
+        self._by_email: typing.Dict[str, User] = {}
+        self._by_name: typing.Dict[str, User] = {}
+        self._unknown_emails: typing.Dict[str, float] = {}
+
+    def get_by_email(self, email: str) -> typing.Optional[User]:
+        email_key = email.strip().casefold()
+        self._ensure_loaded()
+        with self._lock:
+            user = self._by_email.get(email_key)
+            if user is not None or self._is_known_unknown(email_key):
+                return user
+        try:
+            user = self._users_api.get_user_by_email(email=email.strip())
+        except APIError:
+            with self._lock:
+                self._unknown_emails[email_key] = time.monotonic() + self._negative_ttl
+            return None
+        with self._lock:
+            self._add(user)
+        return user
+
+    def get_by_name(self, name: str) -> typing.Optional[User]:
+        self._ensure_loaded()
+        return self._by_name.get(name.strip().casefold())
+
+    def get_by_id(self, user_id: ModelID) -> typing.Optional[User]:
+        self._ensure_loaded()
+        return self._by_id.get(user_id)
+
+    def refresh(self) -> None:
+        users = self._users_api.get_users()
+        with self._lock:
+            self._by_id, self._by_email, self._by_name = {}, {}, {}
+            self._unknown_emails = {}
+            for user in users:
+                self._add(user)
+            self._is_loaded = True
+
+    def _ensure_loaded(self) -> None:
+        if not self._is_loaded:
+            self.refresh()
+
+    def _is_known_unknown(self, email_key: str) -> bool:
+        expires_at = self._unknown_emails.get(email_key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._unknown_emails[email_key]
+            return False
+        return True
+
+    def _add(self, user: User) -> None:
+        self._by_id[user.id] = user
+        self._by_email[user.email.casefold()] = user
+        self._by_name[user.name.casefold()] = user
@@ -0,0 +1,63 @@
+import threading
+import typing
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit of fan-out tasks, fed by outcomes of sent requests.
+
+    The limit grows by one after `limit` fast successful requests and is multiplied
+    by `decrease_factor` on 429 and 5xx responses, connection errors and latency over
+    `latency_tolerance` times the usual one, at most once per `limit` requests.
+    """
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: typing.Optional[int] = None,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        self._max_limit = max_limit
+        self._min_limit = min_limit
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._condition = threading.Condition()
+        self._limit = float(initial_limit or max(min_limit, max_limit // 2))
+        self._in_flight = 0
+        self._usual_latency: typing.Optional[float] = None
+        self._requests_since_decrease = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    def release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record(self, status_code: typing.Optional[int], latency: float) -> None:
+        with self._condition:
+            self._requests_since_decrease += 1
+            if self._is_overloaded(status_code, latency):
+                if self._requests_since_decrease >= self._limit:
+                    self._limit = max(float(self._min_limit), self._limit * self._decrease_factor)
+                    self._requests_since_decrease = 0
+                return
+            self._usual_latency = latency if self._usual_latency is None else (
+                self._usual_latency * 0.9 + latency * 0.1
+            )
+            self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def _is_overloaded(self, status_code: typing.Optional[int], latency: float) -> bool:
+        if status_code is None or status_code == 429 or status_code >= 500:
+            return True
+        return self._usual_latency is not None and (
+            latency > self._usual_latency * self._latency_tolerance
+        )
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import base64
+import enum
+import json
+import os
+import threading
+import time
+import typing
+
+import typing_extensions
+
+from best_testrail_client.custom_types import AttachmentFile, JsonData, Method
+from best_testrail_client.exceptions import CircuitOpen
+
+if False:  # TYPE_CHECKING
+    from best_testrail_client.client import TestRailClient
+
+
+class CircuitState(enum.Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class WriteFallback(typing_extensions.Protocol):
+    def divert(
+        self, url: str, data: typing.Optional[JsonData],
+        attachment: typing.Optional[AttachmentFile],
+    ) -> None:
+        ...
+
+
+class RequestSpool:
+    """Append-only JSON lines file of diverted writes, sent again with `replay()`."""
+    def __init__(self, path: str):
+        self._path = path
+        # reentrant: replay through a transport with an open circuit diverts to this spool
+        self._lock = threading.RLock()
+
+    def reset_after_fork(self) -> None:
+        self._lock = threading.RLock()
+
+    def divert(
+        self, url: str, data: typing.Optional[JsonData],
+        attachment: typing.Optional[AttachmentFile],
+    ) -> None:
+        record: JsonData = {'url': url, 'data': data}
+        if attachment is not None:
+            record['attachment'] = {
+                'name': attachment['name'],
+                'file_content': base64.b64encode(attachment['file_content']).decode('ascii'),
+            }
+        with self._lock, open(self._path, 'a', encoding='utf8') as spool_file:
+            spool_file.write(f'{json.dumps(record)}\n')
+
+    def replay(self, client: TestRailClient) -> int:
+        """Send spooled writes in order, keeping the ones not sent; returns sent count."""
+        with self._lock:
+            if not os.path.exists(self._path):
+                return 0
+            with open(self._path, encoding='utf8') as spool_file:
+                lines = [line for line in spool_file if line.strip()]
+            sent_count = 0
+            try:
+                for line in lines:
+                    record = json.loads(line)
+                    client._transport.request(
+                        record['url'], data=record['data'], method='POST',
+                        attachment=self._load_attachment(record.get('attachment')),
+                    )
+                    sent_count += 1
+            finally:
+                with open(self._path, 'w', encoding='utf8') as spool_file:
+                    spool_file.writelines(lines[sent_count:])
+            return sent_count
+
+    @staticmethod
+    def _load_attachment(
+        attachment_data: typing.Optional[JsonData],
+    ) -> typing.Optional[AttachmentFile]:
+        if attachment_data is None:
+            return None
+        return {
+            'name': attachment_data['name'],
+            'file_content': base64.b64decode(attachment_data['file_content']),
+        }
+
+
+class CircuitBreaker:
+    """Fails fast after `failure_threshold` consecutive failed or slow requests.
+
+    Failures are connection errors, timeouts and 5xx responses; calls slower than
+    `slow_call_seconds` count as failures too. An open circuit rejects requests with
+    CircuitOpen, passing writes to `fallback` first. After `reset_timeout` seconds
+    up to `half_open_calls` probe requests are let through: a success closes the
+    circuit, a failure opens it again.
+    """
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        slow_call_seconds: typing.Optional[float] = None,
+        half_open_calls: int = 1,
+        fallback: typing.Optional[WriteFallback] = None,
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._slow_call_seconds = slow_call_seconds
+        self._half_open_calls = half_open_calls
+        self._fallback = fallback
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures_count = 0
+        self._opened_at = 0.0
+        self._probes_count = 0
+
+    def reset_after_fork(self) -> None:
+        """Recreate the lock in a forked child, probes in flight belong to the parent."""
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._probes_count = 0
+        reset_fallback = getattr(self._fallback, 'reset_after_fork', None)
+        if reset_fallback is not None:
+            reset_fallback()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._get_state()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._get_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and self._probes_count < self._half_open_calls:
+                self._probes_count += 1
+                return True
+            return False
+
+    def record(self, status_code: typing.Optional[int], latency: float) -> None:
+        is_failed = status_code is None or status_code >= 500 or (
+            self._slow_call_seconds is not None and latency >= self._slow_call_seconds
+        )
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._probes_count = max(self._probes_count - 1, 0)
+            if not is_failed:
+                self._state = CircuitState.CLOSED
+                self._failures_count = 0
+                return
+            self._failures_count += 1
+            is_threshold_reached = self._failures_count >= self._failure_threshold
+            if self._state == CircuitState.HALF_OPEN or is_threshold_reached:
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+
+    def reject(
+        self, url: str, method: Method, data: typing.Optional[JsonData],
+        attachment: typing.Optional[AttachmentFile],
+    ) -> typing.NoReturn:
+        diverted = False
+        if method == 'POST' and self._fallback is not None:
+            self._fallback.divert(url, data, attachment)
+            diverted = True
+        raise CircuitOpen(f'Circuit is open, {url} is not sent', diverted=diverted)
+
+    def _get_state(self) -> CircuitState:
+        is_reset_timeout_passed = time.monotonic() - self._opened_at >= self._reset_timeout
+        if self._state == CircuitState.OPEN and is_reset_timeout_passed:
+            self._state = CircuitState.HALF_OPEN
+            self._probes_count = 0
+        return self._state
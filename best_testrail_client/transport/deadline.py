@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+import typing
+
+from best_testrail_client.custom_types import Timeout
+from best_testrail_client.exceptions import DeadlineExceeded
+
+_deadline: contextvars.ContextVar[typing.Optional[float]] = contextvars.ContextVar(
+    'testrail_deadline', default=None,
+)
+_timeout: contextvars.ContextVar[typing.Optional[Timeout]] = contextvars.ContextVar(
+    'testrail_timeout', default=None,
+)
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> typing.Iterator[None]:
+    """Time budget for all client calls in the block, nested deadlines can only shorten it.
+
+    Requests are sent with timeouts cut to the remaining time, fan-outs and pagination
+    skip remaining work and raise DeadlineExceeded once the budget runs out.
+    """
+    expires_at = time.monotonic() + seconds
+    current_expires_at = _deadline.get()
+    if current_expires_at is not None:
+        expires_at = min(expires_at, current_expires_at)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextlib.contextmanager
+def timeout(value: Timeout) -> typing.Iterator[None]:
+    """Override client request timeout for calls in the block."""
+    token = _timeout.set(value)
+    try:
+        yield
+    finally:
+        _timeout.reset(token)
+
+
+def get_remaining_time() -> typing.Optional[float]:
+    expires_at = _deadline.get()
+    return expires_at - time.monotonic() if expires_at is not None else None
+
+
+def has_overrides() -> bool:
+    """Whether calls in the current context run under a deadline or a timeout override."""
+    return _deadline.get() is not None or _timeout.get() is not None
+
+
+def is_expired() -> bool:
+    remaining_time = get_remaining_time()
+    return remaining_time is not None and remaining_time <= 0
+
+
+def check_deadline() -> None:
+    if is_expired():
+        raise DeadlineExceeded('Deadline exceeded')
+
+
+def sleep(seconds: float) -> None:
+    """Sleep before a retry, raising DeadlineExceeded at once if the budget ends first."""
+    remaining_time = get_remaining_time()
+    if remaining_time is not None and remaining_time < seconds:
+        raise DeadlineExceeded('Deadline exceeded')
+    time.sleep(seconds)
+
+
+def get_request_timeout(default: typing.Optional[Timeout]) -> typing.Optional[Timeout]:
+    """Timeout of the current call limited by the remaining deadline."""
+    request_timeout = _timeout.get() or default
+    remaining_time = get_remaining_time()
+    if remaining_time is None:
+        return request_timeout
+    remaining_time = max(remaining_time, 0.001)
+    if request_timeout is None:
+        return remaining_time
+    if isinstance(request_timeout, tuple):
+        return min(request_timeout[0], remaining_time), min(request_timeout[1], remaining_time)
+    return min(request_timeout, remaining_time)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import dataclasses
+import threading
+import typing
+
+from best_testrail_client.transport.deadline import check_deadline
+from best_testrail_client.transport.scheduler import Priority, priority
+
+if False:  # TYPE_CHECKING
+    import concurrent.futures
+
+    from best_testrail_client.transport.adaptive import AdaptiveLimiter
+
+KeyType = typing.TypeVar('KeyType')
+ValueType = typing.TypeVar('ValueType')
+
+
+@dataclasses.dataclass
+class BulkItem(typing.Generic[KeyType, ValueType]):
+    key: KeyType
+    value: typing.Optional[ValueType] = None
+    error: typing.Optional[Exception] = None
+
+
+@dataclasses.dataclass
+class BulkResult(typing.Generic[KeyType, ValueType]):
+    """Per-item outcome of a bulk call, in input order."""
+    items: typing.List[BulkItem[KeyType, ValueType]]
+
+    @property
+    def values(self) -> typing.List[ValueType]:
+        return [item.value for item in self.items if item.error is None]  # type: ignore
+
+    @property
+    def errors(self) -> typing.Dict[KeyType, Exception]:
+        return {item.key: item.error for item in self.items if item.error is not None}
+
+    @property
+    def is_successful(self) -> bool:
+        return all(item.error is None for item in self.items)
+
+
+class FanOutExecutor:
+    """Thread pool shared by bulk helpers of a client, capped at `max_workers` calls.
+
+    Tasks running in the pool must not fan out again, it may exhaust the pool.
+    Tasks started after the caller's deadline are skipped with DeadlineExceeded error,
+    the others send LOW priority requests. An adaptive limiter, if any, caps how many
+    tasks run at once below `max_workers`.
+    """
+    def __init__(self, max_workers: int = 8, limiter: typing.Optional[AdaptiveLimiter] = None):
+        self.max_workers = max_workers
+        self._limiter = limiter
+        self._lock = threading.Lock()
+        self._executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    @property
+    def concurrency(self) -> int:
+        return self._limiter.limit if self._limiter is not None else self.max_workers
+
+    def map(
+        self, func: typing.Callable[[KeyType], ValueType], keys: typing.Iterable[KeyType],
+    ) -> BulkResult[KeyType, ValueType]:
+        executor = self._get_executor()
+        # every task runs in a copy of the caller context to see its deadline and timeout
+        futures = [
+            executor.submit(contextvars.copy_context().run, self._call, func, key) for key in keys
+        ]
+        return BulkResult(items=[future.result() for future in futures])
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        import concurrent.futures
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='testrail-fan-out',
+                )
+            return self._executor
+
+    def _call(
+        self, func: typing.Callable[[KeyType], ValueType], key: KeyType,
+    ) -> BulkItem[KeyType, ValueType]:
+        try:
+            check_deadline()
+            with priority(Priority.LOW), self._limit_concurrency():
+                return BulkItem(key=key, value=func(key))
+        except Exception as error:  # noqa: B902
+            return BulkItem(key=key, error=error)
+
+    @contextlib.contextmanager
+    def _limit_concurrency(self) -> typing.Iterator[None]:
+        if self._limiter is None:
+            yield
+            return
+        self._limiter.acquire()
+        try:
+            yield
+        finally:
+            self._limiter.release()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+import typing
+
+
+@dataclasses.dataclass(frozen=True)
+class MetricsSnapshot:
+    requests_count: int
+    errors_count: int
+    status_counts: typing.Dict[int, int]
+    total_latency: float
+    short_circuited_count: int = 0
+    circuit_state: typing.Optional[str] = None
+    concurrency_limit: typing.Optional[int] = None
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.requests_count if self.requests_count else 0
+
+    def get_status_count(self, status_code: int) -> int:
+        return self.status_counts.get(status_code, 0)
+
+
+class TransportMetrics:
+    """Thread-safe counters of requests sent by a transport.
+
+    Requests failed without a response (connection errors, timeouts) are counted as errors,
+    requests rejected by an open circuit are counted as short-circuited.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, status_code: typing.Optional[int], latency: float) -> None:
+        with self._lock:
+            self._requests_count += 1
+            self._total_latency += latency
+            if status_code is None:
+                self._errors_count += 1
+            else:
+                self._status_counts[status_code] = self._status_counts.get(status_code, 0) + 1
+
+    def record_short_circuit(self) -> None:
+        with self._lock:
+            self._short_circuited_count += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._short_circuited_count = 0
+            self._requests_count = 0
+            self._errors_count = 0
+            self._status_counts: typing.Dict[int, int] = {}
+            self._total_latency = 0.0
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            return MetricsSnapshot(
+                requests_count=self._requests_count,
+                errors_count=self._errors_count,
+                status_counts=dict(self._status_counts),
+                total_latency=self._total_latency,
+                short_circuited_count=self._short_circuited_count,
+            )
@@ -0,0 +1,79 @@
+import threading
+import typing
+
+KeyType = typing.TypeVar('KeyType')
+ItemType = typing.TypeVar('ItemType')
+ValueType = typing.TypeVar('ValueType')
+
+
+class _Batch(typing.Generic[ItemType, ValueType]):
+    def __init__(self) -> None:
+        self.items: typing.List[ItemType] = []
+        self.is_full = threading.Event()
+        self.done = threading.Event()
+        self.values: typing.List[ValueType] = []
+        self.error: typing.Optional[Exception] = None
+
+
+class MicroBatcher(typing.Generic[KeyType, ItemType, ValueType]):
+    """Merges items submitted concurrently with the same key into one `flush` call.
+
+    The first caller of a batch waits up to `window` seconds for others to join, then
+    flushes the batch; a batch is flushed at once when it reaches `max_batch_size`.
+    `flush` returns one value per item in item order, every caller gets its own value
+    (or the flush exception). When a batch of several items fails with one of
+    `fallback_errors`, every caller submits its own item with `fallback` instead,
+    so only callers with bad items fail.
+    """
+    def __init__(
+        self,
+        flush: typing.Callable[[KeyType, typing.List[ItemType]], typing.List[ValueType]],
+        window: float = 0.05,
+        max_batch_size: int = 250,
+        fallback: typing.Optional[typing.Callable[[KeyType, ItemType], ValueType]] = None,
+        fallback_errors: typing.Tuple[typing.Type[Exception], ...] = (),
+    ):
+        self._flush = flush
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._fallback = fallback
+        self._fallback_errors = fallback_errors
+        self._lock = threading.Lock()
+        self._batches: typing.Dict[KeyType, _Batch[ItemType, ValueType]] = {}
+
+    def submit(self, key: KeyType, item: ItemType) -> ValueType:
+        with self._lock:
+            batch = self._batches.get(key)
+            is_leader = batch is None
+            if batch is None:
+                batch = self._batches[key] = _Batch()
+            index = len(batch.items)
+            batch.items.append(item)
+            if len(batch.items) >= self._max_batch_size:
+                del self._batches[key]
+                batch.is_full.set()
+        if is_leader:
+            self._lead(key, batch)
+        batch.done.wait()
+        if batch.error is None:
+            return batch.values[index]
+        can_fall_back = len(batch.items) > 1 and isinstance(batch.error, self._fallback_errors)
+        if self._fallback is not None and can_fall_back:
+            return self._fallback(key, item)
+        raise batch.error
+
+    def _lead(self, key: KeyType, batch: _Batch[ItemType, ValueType]) -> None:
+        batch.is_full.wait(self._window)
+        with self._lock:
+            if self._batches.get(key) is batch:
+                del self._batches[key]
+        try:
+            batch.values = self._flush(key, batch.items)
+            if len(batch.values) != len(batch.items):
+                raise ValueError(
+                    f'Batch of {len(batch.items)} items is flushed with {len(batch.values)} values',
+                )
+        except Exception as error:  # noqa: B902
+            batch.error = error
+        finally:
+            batch.done.set()
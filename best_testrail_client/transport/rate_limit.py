@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import typing
+
+import typing_extensions
+
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.transport import deadline
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+
+class RateLimiter(typing_extensions.Protocol):
+    def acquire(self) -> None:
+        ...
+
+
+def take_token(
+    tokens: float, updated_at: float, now: float, rate: float, burst: int,
+) -> typing.Tuple[float, float]:
+    """Refill token bucket and take one token, returning new tokens and seconds to wait."""
+    tokens = min(float(burst), tokens + max(now - updated_at, 0) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0
+    return tokens, (1 - tokens) / rate
+
+
+class TokenBucketRateLimiter:
+    """Thread-safe limit of `rate` requests per second with bursts up to `burst` requests.
+
+    A token that can not be taken within the current deadline raises DeadlineExceeded.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def reset_after_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            deadline.check_deadline()
+            with self._lock:
+                now = time.monotonic()
+                self._tokens, wait = take_token(
+                    self._tokens, self._updated_at, now, self._rate, self._burst,
+                )
+                self._updated_at = now
+            if not wait:
+                return
+            deadline.sleep(wait)
+
+
+class FileRateLimiter:
+    """Token bucket shared by all processes on a host through a lock file.
+
+    Every process (e.g. pytest-xdist workers) creating a limiter with the same path
+    shares one request budget. The file stays open for the limiter's lifetime, it is
+    reopened in a forked child. Waits are bounded by the current deadline like in
+    TokenBucketRateLimiter. Requires POSIX `fcntl`.
+    """
+    def __init__(self, path: str, rate: float, burst: int = 1):
+        if fcntl is None:
+            raise TestRailException('FileRateLimiter requires fcntl support')
+        self._path = path
+        self._rate = rate
+        self._burst = burst
+        self._open()
+
+    def acquire(self) -> None:
+        while True:
+            deadline.check_deadline()
+            wait = self._try_acquire()
+            if not wait:
+                return
+            deadline.sleep(wait)
+
+    def reset_after_fork(self) -> None:
+        # flock is held per open file, a child sharing the parent's one would not be excluded
+        if self._pid != os.getpid():
+            self._state_file.close()
+            self._open()
+
+    def close(self) -> None:
+        with self._lock:
+            self._state_file.close()
+
+    def _open(self) -> None:
+        self._pid = os.getpid()
+        # flock does not exclude threads sharing one open file
+        self._lock = threading.Lock()
+        self._state_file = open(self._path, 'a+', encoding='utf8')
+
+    def _try_acquire(self) -> float:
+        self.reset_after_fork()
+        with self._lock:
+            state_file = self._state_file
+            fcntl.flock(state_file.fileno(), fcntl.LOCK_EX)
+            try:
+                state_file.seek(0)
+                state = state_file.read().split()
+                now = time.time()
+                tokens, updated_at = (
+                    (float(state[0]), float(state[1])) if state else (self._burst, now)
+                )
+                tokens, wait = take_token(tokens, updated_at, now, self._rate, self._burst)
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(f'{tokens} {now}')
+                state_file.flush()
+            finally:
+                fcntl.flock(state_file.fileno(), fcntl.LOCK_UN)
+        return wait
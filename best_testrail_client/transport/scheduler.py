@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import collections
+import contextlib
+import contextvars
+import enum
+import functools
+import itertools
+import os
+import threading
+import typing
+
+from best_testrail_client.exceptions import DeadlineExceeded
+from best_testrail_client.transport import deadline
+
+
+class Priority(enum.Enum):
+    HIGH = 'high'
+    LOW = 'low'
+
+
+FuncType = typing.TypeVar('FuncType', bound=typing.Callable[..., typing.Any])
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    'testrail_priority', default=Priority.HIGH,
+)
+
+
+@contextlib.contextmanager
+def priority(value: Priority) -> typing.Iterator[None]:
+    """Priority of client calls in the block, calls are HIGH priority by default."""
+    token = _priority.set(value)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def low_priority(func: FuncType) -> FuncType:
+    """Run bulk operation requests with LOW priority."""
+    @functools.wraps(func)
+    def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        with priority(Priority.LOW):
+            return func(*args, **kwargs)
+    return typing.cast(FuncType, wrapper)
+
+
+def get_priority() -> Priority:
+    return _priority.get()
+
+
+class RequestScheduler:
+    """Admits requests by priority, keeping interactive calls fast next to bulk work.
+
+    At most `max_concurrency` requests are in flight and LOW priority ones never take
+    the last `reserved_high` slots. Waiting HIGH requests go first, but after
+    `max_high_streak` HIGH requests in a row a waiting LOW one is let through.
+    Admitted requests take rate limit tokens one by one in admission order, so the
+    budget is never idle while requests wait and HIGH ones get the next token.
+    A request not admitted within the current deadline raises DeadlineExceeded.
+    """
+    def __init__(self, max_concurrency: int = 8, reserved_high: int = 2, max_high_streak: int = 8):
+        self._max_concurrency = max_concurrency
+        self._max_low_concurrency = max(max_concurrency - reserved_high, 1)
+        self._max_high_streak = max_high_streak
+        self._tickets = itertools.count()
+        self._reset()
+
+    def reset_after_fork(self) -> None:
+        """Start idle in a forked child, slots and waiters belong to the parent's threads."""
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._condition = threading.Condition()
+        self._waiting: typing.Dict[Priority, typing.Deque[int]] = {
+            Priority.HIGH: collections.deque(), Priority.LOW: collections.deque(),
+        }
+        self._active = {Priority.HIGH: 0, Priority.LOW: 0}
+        self._high_streak = 0
+        self._is_dispatching = False
+
+    @contextlib.contextmanager
+    def slot(
+        self, request_priority: Priority,
+        before_start: typing.Optional[typing.Callable[[], None]] = None,
+    ) -> typing.Iterator[None]:
+        """Wait for the turn of a request, run `before_start` in turn order and hold a slot."""
+        self._admit(request_priority)
+        try:
+            try:
+                if before_start is not None:
+                    before_start()
+            finally:
+                with self._condition:
+                    self._is_dispatching = False
+                    self._condition.notify_all()
+            yield
+        finally:
+            with self._condition:
+                self._active[request_priority] -= 1
+                self._condition.notify_all()
+
+    def _admit(self, request_priority: Priority) -> None:
+        with self._condition:
+            ticket = next(self._tickets)
+            waiting = self._waiting[request_priority]
+            waiting.append(ticket)
+            try:
+                is_admitted = self._condition.wait_for(
+                    lambda: waiting[0] == ticket and self._can_start(request_priority),
+                    timeout=deadline.get_remaining_time(),
+                )
+            finally:
+                waiting.remove(ticket)
+                self._condition.notify_all()
+            if not is_admitted:
+                raise DeadlineExceeded('Deadline exceeded')
+            is_low_waiting = bool(self._waiting[Priority.LOW])
+            if request_priority == Priority.HIGH and is_low_waiting:
+                self._high_streak += 1
+            else:
+                self._high_streak = 0
+            self._active[request_priority] += 1
+            self._is_dispatching = True
+
+    def _can_start(self, request_priority: Priority) -> bool:
+        if self._is_dispatching or sum(self._active.values()) >= self._max_concurrency:
+            return False
+        can_low_start = self._active[Priority.LOW] < self._max_low_concurrency
+        is_low_due = self._high_streak >= self._max_high_streak
+        if request_priority == Priority.HIGH:
+            return not (is_low_due and can_low_start and self._waiting[Priority.LOW])
+        return can_low_start and (is_low_due or not self._waiting[Priority.HIGH])
@@ -0,0 +1,51 @@
+import copy
+import threading
+import typing
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result: typing.Any = None
+        self.error: typing.Optional[Exception] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller runs the function, callers arriving while it is in flight wait
+    and receive a copy of its result (or its exception).
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: typing.Dict[typing.Hashable, _Call] = {}
+
+    def do(self, key: typing.Hashable, func: typing.Callable[[], typing.Any]) -> typing.Any:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        if is_leader:
+            return self._lead(key, call, func)
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return copy.deepcopy(call.result)
+
+    def _lead(
+        self, key: typing.Hashable, call: _Call, func: typing.Callable[[], typing.Any],
+    ) -> typing.Any:
+        try:
+            call.result = func()
+        except Exception as error:  # noqa: B902
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import os
+import threading
+import time
+import typing
+import weakref
+
+from best_testrail_client.custom_types import JsonData, Method, AttachmentFile, Timeout
+from best_testrail_client.transport.adaptive import AdaptiveLimiter
+from best_testrail_client.transport import deadline
+from best_testrail_client.transport.fan_out import FanOutExecutor
+from best_testrail_client.transport.metrics import MetricsSnapshot, TransportMetrics
+from best_testrail_client.transport.scheduler import get_priority
+from best_testrail_client.transport.singleflight import SingleFlight
+
+if False:  # TYPE_CHECKING
+    import requests
+
+    from best_testrail_client.transport.circuit_breaker import CircuitBreaker
+    from best_testrail_client.transport.scheduler import RequestScheduler
+    from best_testrail_client.transport.rate_limit import RateLimiter
+
+
+_transports: weakref.WeakSet[Transport] = weakref.WeakSet()
+
+
+def _reset_transports_after_fork() -> None:
+    for transport in list(_transports):
+        transport.reset_after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_transports_after_fork)
+
+
+DEFAULT_TIMEOUT: Timeout = (10.0, 120.0)
+
+
+class Transport:
+    """HTTP layer shared by all API namespaces of a client.
+
+    Requests are sent with `timeout` unless overridden by `deadline.timeout()` and
+    never outlive a `deadline.deadline()` budget. A circuit breaker, if any, is shared
+    by all API namespaces of the client, so is a scheduler admitting requests by priority.
+    Timeouts cut short by a deadline are not recorded as circuit breaker failures.
+    With `adaptive_concurrency` fan-outs run as many tasks as request outcomes allow.
+    Transport is fork-safe: a forked child gets a new connection pool, thread pool,
+    in-flight request registry and metrics, and its scheduler, circuit breaker and
+    rate limiter locks are recreated.
+    """
+    def __init__(
+        self, testrail_url: str, login: str, token: str,
+        coalesce_requests: bool = True, max_workers: int = 8,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        timeout: typing.Optional[Timeout] = DEFAULT_TIMEOUT,
+        circuit_breaker: typing.Optional[CircuitBreaker] = None,
+        scheduler: typing.Optional[RequestScheduler] = None,
+        adaptive_concurrency: bool = False,
+    ):
+        self._token = token
+        self._login = login
+
+        if not testrail_url.endswith('/'):
+            testrail_url += '/'
+        self._base_url = f'{testrail_url}index.php?/api/v2/'
+        self._coalesce_requests = coalesce_requests
+        self._max_workers = max_workers
+        self._rate_limiter = rate_limiter
+        self._timeout = timeout
+        self._circuit_breaker = circuit_breaker
+        self._scheduler = scheduler
+        self._adaptive_concurrency = adaptive_concurrency
+        self._reset_state()
+        _transports.add(self)
+
+    def reset_after_fork(self) -> None:
+        self._reset_state()
+        # components may be shared by transports, they reset once per process themselves
+        for component in (self._rate_limiter, self._circuit_breaker, self._scheduler):
+            reset_component = getattr(component, 'reset_after_fork', None)
+            if reset_component is not None:
+                reset_component()
+
+    def _reset_state(self) -> None:
+        self._pid = os.getpid()
+        self._session_lock = threading.Lock()
+        self._session: typing.Optional[requests.Session] = None
+        self._single_flight = SingleFlight() if self._coalesce_requests else None
+        self._concurrency_limiter = (
+            AdaptiveLimiter(max_limit=self._max_workers) if self._adaptive_concurrency else None
+        )
+        self.fan_out = FanOutExecutor(
+            max_workers=self._max_workers, limiter=self._concurrency_limiter,
+        )
+        self.metrics = TransportMetrics()
+
+    def request(
+        self,
+        url: str, data: typing.Optional[JsonData] = None, method: Method = 'GET',
+        params: typing.Optional[JsonData] = None,
+        attachment: typing.Optional[AttachmentFile] = None,
+    ) -> typing.Any:
+        if self._pid != os.getpid():
+            self.reset_after_fork()
+        # a follower would share the leader's deadline and timeout, so these are not coalesced
+        if method == 'GET' and self._single_flight is not None and not deadline.has_overrides():
+            return self._single_flight.do(
+                self._get_request_key(url, params),
+                lambda: self._send(url, data, method, params, attachment),
+            )
+        return self._send(url, data, method, params, attachment)
+
+    def get_metrics(self) -> MetricsSnapshot:
+        snapshot = self.metrics.snapshot()
+        if self._circuit_breaker is not None:
+            snapshot = dataclasses.replace(
+                snapshot, circuit_state=self._circuit_breaker.state.value,
+            )
+        if self._concurrency_limiter is not None:
+            snapshot = dataclasses.replace(
+                snapshot, concurrency_limit=self._concurrency_limiter.limit,
+            )
+        return snapshot
+
+    def _get_request_key(self, url: str, params: typing.Optional[JsonData]) -> typing.Hashable:
+        query = tuple(sorted(
+            (key, str(value)) for key, value in (params or {}).items() if value is not None
+        ))
+        # a HIGH priority caller must not wait for a LOW priority leader in the scheduler
+        return self._base_url, url, query, self._login, self._token, get_priority()
+
+    def _get_session(self) -> requests.Session:
+        # requests is imported on first request, it is the slowest part of client startup
+        import requests
+
+        with self._session_lock:
+            if self._session is None:
+                self._session = requests.Session()
+                self._session.auth = (self._login, self._token)
+            return self._session
+
+    def _send(
+        self,
+        url: str, data: typing.Optional[JsonData], method: Method,
+        params: typing.Optional[JsonData], attachment: typing.Optional[AttachmentFile],
+    ) -> typing.Any:
+        if data is None:
+            data = {}
+        attach_files = None
+        if attachment is not None:
+            attach_files = {'attachment': (attachment['name'], attachment['file_content'])}
+        with self._schedule(lambda: self._wait_for_send(url, method, data, attachment)):
+            response = self._send_measured(
+                method, f'{self._base_url}{url}', json=data, params=params, files=attach_files,
+                timeout=deadline.get_request_timeout(self._timeout),
+            )
+
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            return response
+
+    def _schedule(self, before_start: typing.Callable[[], None]) -> typing.ContextManager[None]:
+        if self._scheduler is not None:
+            return self._scheduler.slot(get_priority(), before_start=before_start)
+        before_start()
+        return contextlib.nullcontext()
+
+    def _wait_for_send(
+        self, url: str, method: Method, data: JsonData,
+        attachment: typing.Optional[AttachmentFile],
+    ) -> None:
+        deadline.check_deadline()
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+            deadline.check_deadline()
+        if self._circuit_breaker is not None and not self._circuit_breaker.allow_request():
+            self.metrics.record_short_circuit()
+            self._circuit_breaker.reject(url, method, data, attachment)
+
+    def _send_measured(
+        self, method: Method, url: str, **kwargs: typing.Any,
+    ) -> requests.Response:
+        import requests
+
+        started_at = time.monotonic()
+        status_code = None
+        is_cut_by_deadline = False
+        try:
+            response = self._get_session().request(method, url, **kwargs)
+            status_code = response.status_code
+        except requests.Timeout:
+            is_cut_by_deadline = deadline.is_expired()
+            deadline.check_deadline()
+            raise
+        finally:
+            latency = time.monotonic() - started_at
+            self.metrics.record(status_code, latency)
+            # a timeout cut short by the caller's deadline says nothing about TestRail health
+            if not is_cut_by_deadline:
+                self._record_outcome(status_code, latency)
+        return response
+
+    def _record_outcome(self, status_code: typing.Optional[int], latency: float) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record(status_code, latency)
+        if self._concurrency_limiter is not None:
+            self._concurrency_limiter.record(status_code, latency)
@@ -1,9 +1,21 @@
+import math
 import typing
 
-from best_testrail_client.custom_types import ModelID
+from best_testrail_client.custom_types import ModelID, TimeSpan
 
 
 def convert_list_to_filter(
     values_list: typing.Optional[typing.List[ModelID]],
 ) -> typing.Optional[str]:
     return ','.join(str(value) for value in values_list) if values_list else None
+
+
+def convert_seconds_to_timespan(seconds: float) -> typing.Optional[TimeSpan]:
+    """Convert duration to TestRail timespan like `1h 2m 5s`, rounding up to whole seconds."""
+    if seconds <= 0:
+        return None
+    total_seconds = math.ceil(seconds)
+    hours, rest = divmod(total_seconds, 3600)
+    minutes, rest_seconds = divmod(rest, 60)
+    parts = [(hours, 'h'), (minutes, 'm'), (rest_seconds, 's')]
+    return ' '.join(f'{value}{unit}' for value, unit in parts if value)
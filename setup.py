@@ -50,4 +50,9 @@ setup(
     license='MIT',
     py_modules=[package_name],
     zip_safe=False,
+    entry_points={
+        'console_scripts': [
+            'best-testrail=best_testrail_client.cli.main:main',
+        ],
+    },
 )
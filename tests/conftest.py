@@ -1,5 +1,9 @@
+import json
+
 import pytest
+import requests
 
+from best_testrail_client.client import TestRailClient
 from best_testrail_client.models.attachment import Attachment
 from best_testrail_client.models.case import Case
 from best_testrail_client.models.case_type import CaseType
@@ -385,3 +389,26 @@ def milestone_data():
 @pytest.fixture
 def milestone(milestone_data):
     return Milestone.from_json(data_json=milestone_data)
+
+
+@pytest.fixture
+def testrail_client():
+    return TestRailClient('https://test.test.test/', 'login', 'token')
+
+
+@pytest.fixture
+def mocked_response(mocker):
+    def _with_response(raw_data=None, data_json=None, status_code=200):
+
+        mocked_requests = mocker.patch(
+            'requests.Session.request',
+        )
+        response = requests.Response()
+        response._content = json.dumps(data_json).encode('utf8') if data_json else raw_data
+        response.status_code = status_code
+
+        mocked_requests.return_value = response
+
+        return mocked_requests
+
+    return _with_response
@@ -38,3 +38,13 @@ def test_delete_attachment(testrail_client, mocked_response):
     response = testrail_client.attachments.delete_attachment(attachment_id=1)
 
     assert response is True
+
+
+def test_get_attachments_for_test_many(
+    testrail_client, mocked_response, attachment_data, attachment,
+):
+    mocked_response(data_json=[attachment_data])
+
+    bulk_result = testrail_client.attachments.get_attachments_for_test_many(test_ids=[1])
+
+    assert bulk_result.values == [[attachment]]
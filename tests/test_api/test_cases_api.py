@@ -68,3 +68,37 @@ def test_delete_case(testrail_client, mocked_response):
     response = testrail_client.cases.delete_case(case_id=1)
 
     assert response is True
+
+
+def test_get_cases_by_ids(testrail_client, mocked_response, case_data, case):
+    mocked_response(data_json=case_data)
+
+    bulk_result = testrail_client.cases.get_cases_by_ids(case_ids=[1, 1])
+
+    assert bulk_result.is_successful is True
+    assert bulk_result.values == [case, case]
+
+
+def test_cases_many_write_helpers(testrail_client, mocked_response):
+    expected_case = Case(id=1, title='Test Case', section_id=2)
+    mocked_requests = mocked_response(data_json=expected_case.to_json())
+
+    added = testrail_client.cases.add_cases_many(cases=[expected_case])
+    updated = testrail_client.cases.update_cases_many(cases=[expected_case])
+    deleted = testrail_client.cases.delete_cases_many(case_ids=[1])
+
+    assert added.values == [expected_case]
+    assert updated.values == [expected_case]
+    assert deleted.values == [True]
+    assert [call[0][1].rsplit('/', 2)[-2:] for call in mocked_requests.call_args_list] == [
+        ['add_case', '2'], ['update_case', '1'], ['delete_case', '1'],
+    ]
+
+
+def test_iter_cases(testrail_client, mocked_response, case_data, case):
+    mocked_requests = mocked_response(data_json=[case_data])
+
+    pages = list(testrail_client.cases.iter_cases(project_id=1, filters={'type_id': [1]}))
+
+    assert pages == [[case]]
+    assert mocked_requests.call_args_list[0][1]['params']['limit'] == 250
@@ -1,4 +1,10 @@
+import threading
+
+from best_testrail_client.client import TestRailClient
+from best_testrail_client.exceptions import CircuitOpen, TestRailException
 from best_testrail_client.models.result import Result
+from best_testrail_client.transport.circuit_breaker import CircuitBreaker, RequestSpool
+from best_testrail_client.transport.deadline import deadline
 
 
 def test_get_results(testrail_client, mocked_response, result_data, result):
@@ -64,3 +70,158 @@ def test_add_results_for_cases(testrail_client, mocked_response):
     api_results = testrail_client.results.add_results_for_cases(run_id=1, results=[expected_result])
 
     assert api_results[0] == expected_result
+
+
+def test_get_results_many(testrail_client, mocked_response, result_data, result):
+    mocked_response(data_json=[result_data])
+
+    bulk_result = testrail_client.results.get_results_many(test_ids=[1, 2])
+
+    assert bulk_result.values == [[result], [result]]
+    assert [item.key for item in bulk_result.items] == [1, 2]
+
+
+def test_get_results_for_case_many(testrail_client, mocked_response, result_data, result):
+    mocked_response(data_json=[result_data])
+
+    bulk_result = testrail_client.results.get_results_for_case_many(run_id=1, case_ids=[3])
+
+    assert bulk_result.values == [[result]]
+
+
+def test_iter_results_for_run(testrail_client, mocker, result):
+    get_results_for_run = mocker.patch.object(
+        testrail_client.results, 'get_results_for_run',
+        side_effect=lambda run_id, filters: [result] * (2 if filters['offset'] < 4 else 1),
+    )
+
+    pages = list(testrail_client.results.iter_results_for_run(
+        run_id=1, filters={'status_ids': [5]}, page_size=2,
+    ))
+
+    assert pages == [[result, result], [result, result], [result]]
+    assert get_results_for_run.call_args_list[0][1]['filters'] == {
+        'status_ids': [5], 'limit': 2, 'offset': 0,
+    }
+
+
+def test_iter_results_for_run_fans_out_while_pages_are_full(testrail_client, mocker, result):
+    get_results_for_run = mocker.patch.object(
+        testrail_client.results, 'get_results_for_run',
+        side_effect=lambda run_id, filters: [result] * (2 if filters['offset'] < 6 else 0),
+    )
+
+    pages = list(testrail_client.results.iter_results_for_run(run_id=1, page_size=2))
+
+    assert len(pages) == 4
+    assert sorted(
+        call[1]['filters']['offset'] for call in get_results_for_run.call_args_list
+    ) == [0, 2, 4, 6, 8, 10, 12]
+
+
+def test_iter_results_for_run_fetches_empty_listing_once(testrail_client, mocker):
+    get_results_for_run = mocker.patch.object(
+        testrail_client.results, 'get_results_for_run', return_value=[],
+    )
+
+    pages = list(testrail_client.results.iter_results_for_run(run_id=1))
+
+    assert pages == [[]]
+    assert get_results_for_run.call_count == 1
+
+
+def test_add_result_for_case_auto_batching(testrail_client, mocker):
+    add_results_for_cases = mocker.patch.object(
+        testrail_client.results, 'add_results_for_cases',
+        side_effect=lambda run_id, results: [
+            Result(status_id=result.status_id, case_id=result.case_id, id=result.case_id)
+            for result in reversed(results)
+        ],
+    )
+    testrail_client.results.enable_auto_batching(window=0.5, max_batch_size=2)
+    added_results = {}
+
+    def add_result(case_id):
+        added_results[case_id] = testrail_client.results.add_result_for_case(
+            run_id=1, case_id=case_id, result=Result(status_id=1),
+        )
+
+    threads = [threading.Thread(target=add_result, args=(case_id,)) for case_id in (5, 7)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {case_id: result.id for case_id, result in added_results.items()} == {5: 5, 7: 7}
+    add_results_for_cases.assert_called_once()
+    assert add_results_for_cases.call_args[1]['run_id'] == 1
+
+
+def add_results_concurrently(results_api, case_ids):
+    added_results, errors = {}, {}
+
+    def add_result(case_id):
+        try:
+            added_results[case_id] = results_api.add_result_for_case(
+                run_id=1, case_id=case_id, result=Result(status_id=1),
+            )
+        except TestRailException as error:
+            errors[case_id] = error
+
+    threads = [threading.Thread(target=add_result, args=(case_id,)) for case_id in case_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return added_results, errors
+
+
+def test_add_result_for_case_auto_batching_isolates_rejected_results(testrail_client, mocker):
+    def request(url, method, data):
+        if url == 'add_results_for_cases/1' or url.endswith('/999'):
+            return {'error': 'Field :case_id is not a valid test case'}
+        return {'id': 1, 'case_id': int(url.split('/')[-1]), 'status_id': 1}
+
+    mocker.patch.object(testrail_client.results, '_request', side_effect=request)
+    testrail_client.results.enable_auto_batching(window=0.5, max_batch_size=3)
+
+    added_results, errors = add_results_concurrently(testrail_client.results, [5, 7, 999])
+
+    assert {case_id: result.case_id for case_id, result in added_results.items()} == {5: 5, 7: 7}
+    assert list(errors) == [999]
+
+
+def test_add_result_for_case_is_not_batched_under_deadline(testrail_client, mocker):
+    add_results_for_cases = mocker.patch.object(testrail_client.results, 'add_results_for_cases')
+    mocker.patch.object(
+        testrail_client.results, '_request', return_value={'id': 1, 'case_id': 5, 'status_id': 1},
+    )
+    testrail_client.results.enable_auto_batching(window=10)
+
+    with deadline(5):
+        added_result = testrail_client.results.add_result_for_case(
+            run_id=1, case_id=5, result=Result(status_id=1),
+        )
+
+    assert added_result.id == 1
+    assert add_results_for_cases.call_count == 0
+
+
+def test_add_result_for_case_auto_batching_spools_batch_once(mocker, tmp_path):
+    spool = RequestSpool(str(tmp_path / 'spool.jsonl'))
+    circuit_breaker = CircuitBreaker(failure_threshold=1, fallback=spool)
+    circuit_breaker.record(None, latency=1)
+    client = TestRailClient(
+        'https://test.test.test/', 'login', 'token', circuit_breaker=circuit_breaker,
+    )
+    replay_client = mocker.Mock()
+    client.results.enable_auto_batching(window=0.5, max_batch_size=3)
+
+    added_results, errors = add_results_concurrently(client.results, [1, 2, 3])
+    spool.replay(replay_client)
+
+    assert added_results == {}
+    assert all(isinstance(error, CircuitOpen) for error in errors.values())
+    assert [
+        call[0][0] for call in replay_client._transport.request.call_args_list
+    ] == ['add_results_for_cases/1']
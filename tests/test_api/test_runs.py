@@ -87,3 +87,26 @@ def test_delete_run(testrail_client, mocked_response):
     response = testrail_client.runs.delete_run(run_id=1)
 
     assert response is True
+
+
+def test_get_runs_with_filters(testrail_client, mocked_response, run_data, run):
+    mocked_requests = mocked_response(data_json=[run_data])
+
+    api_runs = testrail_client.runs.get_runs(project_id=1, filters={
+        'created_by': [1, 2], 'is_completed': False, 'suite_id': [3], 'limit': 10,
+    })
+
+    assert api_runs[0] == run
+    assert mocked_requests.call_args[1]['params'] == {
+        'created_by': '1,2', 'is_completed': 0, 'milestone_id': None, 'suite_id': '3',
+        'limit': 10,
+    }
+
+
+def test_iter_runs(testrail_client, mocked_response, run_data, run):
+    mocked_requests = mocked_response(data_json=[run_data])
+
+    pages = list(testrail_client.runs.iter_runs(project_id=1, page_size=2))
+
+    assert pages == [[run]]
+    assert mocked_requests.call_args_list[0][1]['params']['offset'] == 0
@@ -89,3 +89,12 @@ def test_delete_section(testrail_client, mocked_response):
     response = testrail_client.sections.delete_section(section_id=1)
 
     assert response is True
+
+
+def test_add_sections_many(testrail_client, mocked_response, section_data, section):
+    mocked_response(data_json=section_data)
+
+    bulk_result = testrail_client.sections.add_sections_many(sections=[section], project_id=1)
+
+    assert bulk_result.values == [section]
+    assert bulk_result.items[0].key == section
@@ -13,3 +13,14 @@ def test_get_tests(mocked_response, testrail_client, test_data, test):
 
     assert len(api_tests) == 1
     assert api_tests[0] == test
+
+
+def test_iter_tests(mocked_response, testrail_client, test_data, test):
+    mocked_requests = mocked_response(data_json=[test_data])
+
+    pages = list(testrail_client.tests.iter_tests(run_id=1, filters={'status_ids': [5]}))
+
+    assert pages == [[test]]
+    assert mocked_requests.call_args_list[0][1]['params'] == {
+        'limit': 250, 'offset': 0, 'status_id': '5',
+    }
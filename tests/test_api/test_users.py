@@ -1,3 +1,8 @@
+import pytest
+
+from best_testrail_client.exceptions import TestRailException
+
+
 def test_get_user(testrail_client, mocked_response, user_data, user):
     mocked_response(data_json=user_data)
 
@@ -21,3 +26,10 @@ def test_get_users(testrail_client, mocked_response, user_data, user):
 
     assert len(api_users) == 1
     assert api_users[0] == user
+
+
+def test_get_user_by_email_raises_on_error(testrail_client, mocked_response):
+    mocked_response(data_json={'error': 'Field :email is not a valid user.'}, status_code=400)
+
+    with pytest.raises(TestRailException):
+        testrail_client.users.get_user_by_email(email='unknown@example.com')
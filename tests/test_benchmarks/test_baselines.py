@@ -0,0 +1,29 @@
+import pytest
+
+from benchmarks.baselines import find_regressions, load_baselines, save_baselines
+
+
+@pytest.mark.parametrize(
+    'measurements, higher_is_better, expected_regressions',
+    [
+        ({'decode': 85, 'encode': 70, 'new': 1}, True, ['encode']),
+        ({'decode': 125, 'encode': 115}, False, ['decode']),
+    ],
+)
+def test_find_regressions(measurements, higher_is_better, expected_regressions):
+    regressions = find_regressions(
+        measurements, {'decode': 100, 'encode': 100}, threshold=0.2,
+        higher_is_better=higher_is_better,
+    )
+
+    assert regressions == expected_regressions
+
+
+def test_save_baselines_merges_measurements(tmp_path):
+    path = str(tmp_path / 'baselines.json')
+
+    save_baselines(path, {'decode': 1, 'encode': 2})
+    save_baselines(path, {'encode': 3})
+
+    assert load_baselines(path) == {'decode': 1, 'encode': 3}
+    assert load_baselines(str(tmp_path / 'missing.json')) == {}
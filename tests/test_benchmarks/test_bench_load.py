@@ -0,0 +1,31 @@
+import pytest
+
+from benchmarks.bench_load import LoadTestReport, get_percentile
+
+
+@pytest.mark.parametrize(
+    'rank, expected_percentile',
+    [
+        (50, 5),
+        (90, 9),
+        (99, 10),
+        (1, 1),
+    ],
+)
+def test_get_percentile(rank, expected_percentile):
+    assert get_percentile(list(range(1, 11)), rank) == expected_percentile
+
+
+def test_load_test_report_describe():
+    report = LoadTestReport(
+        seconds=2, flows_count=4, failed_flows_count=1, results_count=300,
+        requests_count=20, throttled_count=1, errors={'RuntimeError: throttled': 1},
+    )
+    report.latencies['add_run'].extend([0.1, 0.2])
+
+    description = report.describe()
+
+    assert 'throughput: 150.0 results/s, 10.0 requests/s' in description
+    assert '429 rate: 5.0% (1 of 20 requests)' in description
+    assert 'add_run: p50 100.0ms, p90 200.0ms, p99 200.0ms' in description
+    assert 'close_run: no calls' in description
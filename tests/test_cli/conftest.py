@@ -0,0 +1,21 @@
+import pytest
+
+
+@pytest.fixture
+def junit_report(tmp_path):
+    path = tmp_path / 'report.xml'
+    path.write_text(
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<testsuites><testsuite name="suite">'
+        '<testcase classname="tests.test_login" name="test_login_C12" time="1.2"/>'
+        '<testcase classname="tests.test_login" name="test_logout" time="61">'
+        '<properties><property name="testrail_case_id" value="C13"/></properties>'
+        '<failure message="assert False">Traceback</failure>'
+        '</testcase>'
+        '<testcase classname="tests.test_login" name="test_skipped_C14" time="0">'
+        '<skipped message="not ready"/>'
+        '</testcase>'
+        '<testcase classname="tests.test_login" name="test_unmapped" time="0.1"/>'
+        '</testsuite></testsuites>',
+    )
+    return str(path)
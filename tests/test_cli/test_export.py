@@ -0,0 +1,29 @@
+from best_testrail_client.cli.main import main
+
+
+CREDENTIALS = ['--url', 'https://test.test.test/', '--login', 'login', '--token', 'token']
+
+
+def test_main_export(mocker, tmp_path, section, capsys):
+    mocker.patch(
+        'best_testrail_client.api.sections_api.SectionsAPI.get_sections', return_value=[section],
+    )
+
+    exit_code = main([
+        *CREDENTIALS, 'export', '--project-id', '1', '--entities', 'sections',
+        '--output-dir', str(tmp_path / 'export'),
+    ])
+
+    assert exit_code == 0
+    assert (tmp_path / 'export' / 'sections.jsonl').exists()
+    assert capsys.readouterr().out.startswith('sections: 1 records in ')
+
+
+def test_main_export_rejects_unknown_entities(tmp_path, capsys):
+    exit_code = main([
+        *CREDENTIALS, 'export', '--project-id', '1', '--entities', 'sections,plans',
+        '--output-dir', str(tmp_path),
+    ])
+
+    assert exit_code == 2
+    assert 'Unknown entities: plans' in capsys.readouterr().err
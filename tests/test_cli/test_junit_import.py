@@ -0,0 +1,101 @@
+import io
+
+import pytest
+
+from best_testrail_client.cli.junit_import import (
+    JUnitCase, convert_to_result, import_junit, iter_junit_cases,
+)
+from best_testrail_client.cli.main import main
+
+
+def test_iter_junit_cases(junit_report):
+    junit_cases = list(iter_junit_cases(junit_report))
+
+    assert junit_cases == [
+        JUnitCase(
+            name='test_login_C12', classname='tests.test_login', status='passed', elapsed=1.2,
+            case_id=12,
+        ),
+        JUnitCase(
+            name='test_logout', classname='tests.test_login', status='failed', elapsed=61,
+            case_id=13, message='assert False\nTraceback',
+        ),
+        JUnitCase(
+            name='test_skipped_C14', classname='tests.test_login', status='skipped', elapsed=0,
+            case_id=14, message='not ready',
+        ),
+        JUnitCase(
+            name='test_unmapped', classname='tests.test_login', status='passed', elapsed=0.1,
+        ),
+    ]
+
+
+def test_iter_junit_cases_leaves_non_numeric_case_ids_unmapped():
+    report = io.BytesIO(
+        b'<testsuites><testsuite name="first">'
+        b'<testcase classname="tests" name="test_C15">'
+        b'<properties><property name="testrail_case_id" value="TBD"/></properties>'
+        b'</testcase>'
+        b'<system-out>suite output</system-out>'
+        b'</testsuite><testsuite name="second">'
+        b'<testcase classname="tests" name="test_C16"/>'
+        b'</testsuite></testsuites>',
+    )
+
+    junit_cases = list(iter_junit_cases(report))
+
+    assert [junit_case.case_id for junit_case in junit_cases] == [None, 16]
+
+
+@pytest.mark.parametrize(
+    'junit_case, skipped_status_id, expected_status_id',
+    [
+        (JUnitCase('a', 'b', 'passed', 1, case_id=1), None, 1),
+        (JUnitCase('a', 'b', 'failed', 1, case_id=1), None, 5),
+        (JUnitCase('a', 'b', 'skipped', 1, case_id=1), 2, 2),
+        (JUnitCase('a', 'b', 'skipped', 1, case_id=1), None, None),
+        (JUnitCase('a', 'b', 'passed', 1), None, None),
+    ],
+)
+def test_convert_to_result(junit_case, skipped_status_id, expected_status_id):
+    result = convert_to_result(junit_case, skipped_status_id=skipped_status_id)
+
+    assert (result.status_id if result else None) == expected_status_id
+
+
+def test_import_junit_uploads_in_chunks(testrail_client, mocker, junit_report):
+    add_results_for_cases = mocker.patch.object(testrail_client.results, 'add_results_for_cases')
+    progress = io.StringIO()
+
+    uploaded_count, skipped_count = import_junit(
+        testrail_client, run_id=1, reports=[junit_report, junit_report], skipped_status_id=2,
+        chunk_size=4, progress=progress,
+    )
+
+    assert (uploaded_count, skipped_count) == (6, 2)
+    assert [len(call[1]['results']) for call in add_results_for_cases.call_args_list] == [4, 2]
+    first_results = add_results_for_cases.call_args_list[0][1]['results']
+    assert [result.elapsed for result in first_results] == ['2s', '1m 1s', None, '2s']
+    assert progress.getvalue().count('Uploaded') == 2
+
+
+def test_main_import_junit(mocker, junit_report, capsys):
+    add_results_for_cases = mocker.patch(
+        'best_testrail_client.api.results_api.ResultsAPI.add_results_for_cases',
+    )
+
+    exit_code = main([
+        '--url', 'https://test.test.test/', '--login', 'login', '--token', 'token',
+        'import-junit', '--run-id', '3', junit_report,
+    ])
+
+    assert exit_code == 0
+    assert add_results_for_cases.call_args[1]['run_id'] == 3
+    assert 'Done: 2 results uploaded, 2 skipped' in capsys.readouterr().err
+
+
+def test_main_requires_credentials(junit_report, monkeypatch):
+    monkeypatch.delenv('TESTRAIL_URL', raising=False)
+
+    with pytest.raises(SystemExit):
+        main(['import-junit', '--run-id', '3', junit_report])
@@ -0,0 +1,72 @@
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+from best_testrail_client.api.cases_api import CasesAPI
+from best_testrail_client.exceptions import TestRailException
+
+
+def test_client_creates_apis_on_first_access(testrail_client):
+    assert 'cases' not in testrail_client.__dict__
+
+    cases_api = testrail_client.cases
+
+    assert isinstance(cases_api, CasesAPI)
+    assert testrail_client.cases is cases_api
+    assert cases_api._transport is testrail_client._transport
+
+
+def test_client_set_project_id_applies_to_apis_created_later(testrail_client):
+    runs_api = testrail_client.runs
+
+    testrail_client.set_project_id(project_id=5)
+
+    assert runs_api._project_id == 5
+    assert testrail_client.sections._project_id == 5
+    assert testrail_client.results._project_id is None
+
+
+def test_client_import_defers_http_stack():
+    script = (
+        'import sys; import best_testrail_client.client as client; '
+        'client.TestRailClient("https://test.test.test/", "login", "token"); '
+        'print("requests" in sys.modules)'
+    )
+
+    output = subprocess.check_output([sys.executable, '-c', script])  # noqa: S603
+
+    assert output.strip() == b'False'
+
+
+def test_client_for_project_shares_transport(testrail_client, mocked_response, run_data):
+    mocked_requests = mocked_response(data_json=[run_data])
+    first_project, second_project = testrail_client.for_project(1), testrail_client.for_project(2)
+
+    first_project.runs.get_runs()
+    second_project.runs.get_runs()
+
+    assert first_project._transport is testrail_client._transport
+    assert first_project.project_id == 1
+    assert testrail_client.runs._project_id is None
+    assert [call[0][1].split('/')[-1] for call in mocked_requests.call_args_list] == ['1', '2']
+
+
+def test_project_client_is_immutable(testrail_client):
+    project_client = testrail_client.for_project(1)
+
+    with pytest.raises(TestRailException):
+        project_client.set_project_id(project_id=2)
+    with pytest.raises(TestRailException):
+        project_client.cases.set_project_id(project_id=2)
+    assert project_client.cases._project_id == 1
+
+
+def test_project_client_shares_namespace_state(testrail_client, mocker):
+    project_client = testrail_client.for_project(1)
+    listener = mocker.Mock()
+    project_client.cases.subscribe(listener)
+    testrail_client.results.enable_auto_batching()
+
+    assert testrail_client.cases._listeners == [listener]
+    assert project_client.results._batching_api._batcher is testrail_client.results._batcher
@@ -0,0 +1,64 @@
+import pytest
+
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.case import Case
+from best_testrail_client.services.case_index import CaseIndex
+
+
+@pytest.fixture
+def case_index(case):
+    return CaseIndex(
+        [case, Case(id=2, title='Other', section_id=2, custom={'custom_automation_id': 'a.b'})],
+        custom_keys=['custom_automation_id'],
+    )
+
+
+def test_case_index_lookups(case_index, case):
+    assert len(case_index) == 2
+    assert case_index.get(case_id=1) == case
+    assert case_index.get_by_ref(' rf-2 ') == [case]
+    assert case_index.get_by_title(
+        'change  document attributes (Author, title, organization)',
+    ) == [case]
+    assert case_index.get_by_title(case.title, section_id=1) == [case]
+    assert case_index.get_by_title(case.title, section_id=2) == []
+    assert [indexed.id for indexed in case_index.get_by_section(section_id=2)] == [2]
+    assert [
+        indexed.id for indexed in case_index.get_by_custom('custom_automation_id', 'a.b')
+    ] == [2]
+
+
+def test_case_index_keeps_custom_keys_apart(case):
+    case_index = CaseIndex(
+        [case, Case(id=2, title='Other', section_id=2, custom={'section': 1})],
+        custom_keys=['section'],
+    )
+
+    assert [indexed.id for indexed in case_index.get_by_section(section_id=1)] == [case.id]
+    assert [indexed.id for indexed in case_index.get_by_custom('section', 1)] == [2]
+    with pytest.raises(TestRailException, match='custom_automation_id'):
+        case_index.get_by_custom('custom_automation_id', 'a.b')
+
+
+def test_case_index_replaces_updated_case(case_index):
+    case_index.add(Case(id=2, title='Renamed', section_id=3))
+
+    assert case_index.get_by_title('Other') == []
+    assert case_index.get_by_section(section_id=2) == []
+    assert [indexed.id for indexed in case_index.get_by_title('renamed')] == [2]
+
+
+def test_case_index_follows_cases_api(testrail_client, mocked_response, case_index):
+    testrail_client.cases.subscribe(case_index)
+    new_case = Case(id=3, title='New', refs='NEW-1', section_id=1)
+    mocked_response(data_json=new_case.to_json())
+
+    testrail_client.cases.add_case(section_id=1, case=new_case)
+    assert case_index.get_by_ref('NEW-1') == [new_case]
+
+    testrail_client.cases.delete_case(case_id=3)
+    assert case_index.get(case_id=3) is None
+
+    testrail_client.cases.unsubscribe(case_index)
+    testrail_client.cases.add_case(section_id=1, case=new_case)
+    assert case_index.get(case_id=3) is None
@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+from best_testrail_client.exceptions import TestRailException
+
+from best_testrail_client.models.case import Case
+from best_testrail_client.models.section import Section
+from best_testrail_client.services.case_mirror import CaseMirror
+
+
+@pytest.fixture
+def case_mirror(testrail_client, tmp_path):
+    mirror = CaseMirror(
+        str(tmp_path / 'mirror.sqlite'), testrail_client.cases, testrail_client.sections,
+        project_id=1,
+    )
+    yield mirror
+    mirror.close()
+
+
+def test_case_mirror_first_sync_is_full(testrail_client, case_mirror, case, section, mocker):
+    mocker.patch.object(testrail_client.sections, 'get_sections', return_value=[section])
+    get_cases = mocker.patch.object(testrail_client.cases, 'get_cases', return_value=[case])
+
+    stats = case_mirror.sync()
+
+    assert stats.full is True
+    assert stats.watermark == case.updated_on
+    assert get_cases.call_args[1]['filters'] == {}
+    assert case_mirror.get_case(case_id=case.id) == case
+    assert case_mirror.get_cases(section_id=section.id) == [case]
+    assert case_mirror.get_sections() == [section]
+
+
+def test_case_mirror_incremental_sync(testrail_client, case_mirror, case, section, mocker):
+    mocker.patch.object(testrail_client.sections, 'get_sections', return_value=[section])
+    get_cases = mocker.patch.object(testrail_client.cases, 'get_cases', return_value=[case])
+    case_mirror.sync()
+    updated_case = Case(id=2, title='New', section_id=section.id, updated_on=case.updated_on + 10)
+    get_cases.return_value = [updated_case]
+
+    stats = case_mirror.sync()
+
+    assert stats.full is False
+    assert get_cases.call_args[1]['filters'] == {'updated_after': case.updated_on - 1}
+    assert case_mirror.count_cases() == 2
+    assert case_mirror.watermark == updated_case.updated_on
+
+
+def test_case_mirror_drops_cases_of_removed_sections(
+    testrail_client, case_mirror, case, section, mocker,
+):
+    mocker.patch.object(testrail_client.cases, 'get_cases', return_value=[case])
+    get_sections = mocker.patch.object(
+        testrail_client.sections, 'get_sections', return_value=[section],
+    )
+    case_mirror.sync()
+    get_sections.return_value = [Section(id=2, name='Other')]
+    testrail_client.cases.get_cases.return_value = []
+
+    stats = case_mirror.sync()
+
+    assert stats.cases_deleted == 1
+    assert case_mirror.get_case(case_id=case.id) is None
+
+
+def test_case_mirror_full_sync_removes_deleted_cases(
+    testrail_client, case_mirror, case, section, mocker,
+):
+    mocker.patch.object(testrail_client.sections, 'get_sections', return_value=[section])
+    get_cases = mocker.patch.object(
+        testrail_client.cases, 'get_cases',
+        return_value=[case, Case(id=2, section_id=section.id, updated_on=1)],
+    )
+    case_mirror.sync()
+    get_cases.return_value = [case]
+
+    stats = case_mirror.sync(full=True)
+
+    assert stats.cases_deleted == 1
+    assert [mirrored.id for mirrored in case_mirror.iter_cases()] == [case.id]
+
+
+def test_case_mirror_full_sync_is_due_daily(
+    testrail_client, case_mirror, case, section, mocker,
+):
+    mocker.patch.object(testrail_client.sections, 'get_sections', return_value=[section])
+    mocker.patch.object(testrail_client.cases, 'get_cases', return_value=[case])
+    case_mirror.sync()
+    mocker.patch(
+        'best_testrail_client.services.case_mirror.time.time',
+        return_value=time.time() + 24 * 60 * 60,
+    )
+
+    assert case_mirror.sync().full is True
+
+
+def test_case_mirror_rejects_file_of_another_project(testrail_client, case_mirror, tmp_path):
+    path = str(tmp_path / 'mirror.sqlite')
+
+    with pytest.raises(TestRailException, match='mirrors project 1 suite None'):
+        CaseMirror(path, testrail_client.cases, testrail_client.sections, project_id=2)
+    CaseMirror(path, testrail_client.cases, testrail_client.sections, project_id=1).close()
@@ -0,0 +1,83 @@
+import pytest
+
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.case import Case
+from best_testrail_client.services.case_sync import CaseSync, SyncAction
+
+
+@pytest.fixture
+def current_cases():
+    return [
+        Case(id=1, refs='A', title='First', section_id=1, custom={'custom_steps': 'one'}),
+        Case(id=2, refs='B', title='Second', section_id=1, updated_on=100),
+        Case(id=3, refs='C', title='Stale', section_id=1),
+        Case(id=4, title='Without key', section_id=1),
+    ]
+
+
+def test_case_sync_plan(testrail_client, current_cases):
+    case_sync = CaseSync(testrail_client.cases, project_id=1, delete_missing=True)
+
+    plan = case_sync.plan(
+        desired=[
+            Case(refs='A', title='First', custom={'custom_steps': 'two'}),
+            Case(refs='B', title='Second', updated_on=200),
+            Case(refs='D', title='New', section_id=2),
+        ],
+        current=current_cases,
+    )
+
+    assert plan.unchanged_count == 1
+    assert [(change.action, change.key) for change in plan.changes] == [
+        (SyncAction.UPDATE, 'A'), (SyncAction.ADD, 'D'), (SyncAction.DELETE, 'C'),
+    ]
+    assert plan.changes[0].case.to_json(include_none=False) == {
+        'id': 1, 'custom_steps': 'two',
+    }
+    assert plan.describe() == [
+        "update 'A' (C1): custom_steps: 'one' -> 'two'",
+        "add 'D'",
+        "delete 'C' (C3)",
+    ]
+
+
+def test_case_sync_noop_plan_fetches_current_cases(testrail_client, current_cases, mocker):
+    get_cases = mocker.patch.object(testrail_client.cases, 'get_cases', return_value=current_cases)
+    case_sync = CaseSync(testrail_client.cases, project_id=1, suite_id=2)
+
+    plan = case_sync.plan(desired=[Case(refs='C', title='Stale')])
+
+    assert plan.is_empty is True
+    assert plan.unchanged_count == 1
+    get_cases.assert_called_once_with(project_id=1, suite_id=2)
+
+
+@pytest.mark.parametrize(
+    'desired',
+    [
+        [Case(refs='A'), Case(refs='A')],
+        [Case(title='No key')],
+        [Case(refs='New', title='No section')],
+    ],
+)
+def test_case_sync_plan_rejects_invalid_desired_cases(testrail_client, current_cases, desired):
+    case_sync = CaseSync(testrail_client.cases)
+
+    with pytest.raises(TestRailException):
+        case_sync.plan(desired=desired, current=current_cases)
+
+
+def test_case_sync_by_custom_key_applies_plan(testrail_client, mocked_response):
+    case_sync = CaseSync(testrail_client.cases, key_field='custom_automation_id')
+    mocked_response(data_json={'id': 5, 'title': 'Renamed'})
+    plan = case_sync.plan(
+        desired=[Case(title='Renamed', custom={'custom_automation_id': 'x'})],
+        current=[Case(id=5, title='Old', custom={'custom_automation_id': 'x'})],
+    )
+
+    sync_result = case_sync.apply(plan)
+
+    assert sync_result.is_successful is True
+    assert sync_result.updated.values == [Case(id=5, title='Renamed')]
+    assert sync_result.added.items == []
+    assert sync_result.deleted.items == []
@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+
+from best_testrail_client.models.milestone import Milestone
+from best_testrail_client.models.run import Run
+from best_testrail_client.services.change_watcher import ChangeType, ChangeWatcher
+
+
+def make_run(run_id, created_on, passed_count=0, is_completed=False):
+    return Run(
+        id=run_id, name=f'Run {run_id}', include_all=True, created_on=created_on,
+        passed_count=passed_count, is_completed=is_completed,
+    )
+
+
+@pytest.fixture
+def projects_state(testrail_client, mocker):
+    state = {'active_runs': [], 'completed_runs': [], 'milestones': []}
+
+    def iter_runs(project_id, filters):
+        if not filters['is_completed']:
+            return [state['active_runs']]
+        created_after = filters.get('created_after', -1)
+        return [[run for run in state['completed_runs'] if run.created_on > created_after]]
+
+    mocker.patch.object(testrail_client.runs, 'iter_runs', side_effect=iter_runs)
+    mocker.patch.object(
+        testrail_client.milestones, 'get_milestones',
+        side_effect=lambda project_id: state['milestones'],
+    )
+    return state
+
+
+def describe_events(events):
+    return [(event.entity, event.change_type, event.entity_id) for event in events]
+
+
+def test_change_watcher_emits_changes(testrail_client, projects_state):
+    watcher = ChangeWatcher(testrail_client, project_ids=[1])
+    projects_state['active_runs'] = [make_run(1, created_on=100), make_run(2, created_on=200)]
+    projects_state['milestones'] = [Milestone(id=1, name='Release', is_completed=False)]
+    initial_events = watcher.poll(project_id=1)
+    projects_state['active_runs'] = [make_run(1, 100, passed_count=5), make_run(3, 300)]
+    projects_state['completed_runs'] = [make_run(2, 200, is_completed=True)]
+    projects_state['milestones'] = [
+        Milestone(id=1, name='Release', is_completed=True), Milestone(id=2, name='Next'),
+    ]
+
+    events = watcher.poll(project_id=1)
+
+    assert initial_events == []
+    assert describe_events(events) == [
+        ('run', ChangeType.UPDATED, 1),
+        ('run', ChangeType.CREATED, 3),
+        ('run', ChangeType.COMPLETED, 2),
+        ('milestone', ChangeType.COMPLETED, 1),
+        ('milestone', ChangeType.CREATED, 2),
+    ]
+    assert events[0].changed_fields == ('passed_count',)
+    completed_filters = testrail_client.runs.iter_runs.call_args_list[-1][1]['filters']
+    assert completed_filters == {'is_completed': True, 'created_after': 199}
+
+
+def test_change_watcher_detects_deleted_entities(testrail_client, projects_state):
+    watcher = ChangeWatcher(testrail_client, project_ids=[1])
+    projects_state['active_runs'] = [make_run(1, created_on=100)]
+    projects_state['milestones'] = [Milestone(id=1, name='Release')]
+    watcher.poll(project_id=1)
+    projects_state['active_runs'], projects_state['milestones'] = [], []
+
+    events = watcher.poll(project_id=1)
+
+    assert describe_events(events) == [
+        ('run', ChangeType.DELETED, 1), ('milestone', ChangeType.DELETED, 1),
+    ]
+
+
+def test_change_watcher_watch_polls_projects_at_intervals(testrail_client, projects_state):
+    watcher = ChangeWatcher(testrail_client, project_ids=[1, 2], interval=0.01, jitter=0.5)
+    stop_event = threading.Event()
+    received = []
+
+    def callback(event):
+        received.append(event)
+        stop_event.set()
+
+    projects_state['milestones'] = [Milestone(id=1, name='Release')]
+    watcher.poll_all()
+    projects_state['milestones'] = []
+    watcher.watch(callback, stop_event=stop_event)
+
+    assert describe_events(received) == [('milestone', ChangeType.DELETED, 1)]
+
+
+def test_change_watcher_reports_runs_completed_between_polls(testrail_client, projects_state):
+    watcher = ChangeWatcher(testrail_client, project_ids=[1], watch_milestones=False)
+    projects_state['active_runs'] = [make_run(1, created_on=100)]
+    projects_state['completed_runs'] = [make_run(9, 100, is_completed=True)]
+    watcher.poll(project_id=1)
+    projects_state['completed_runs'].append(make_run(5, 150, is_completed=True))
+
+    events = watcher.poll(project_id=1)
+
+    assert describe_events(events) == [
+        ('run', ChangeType.CREATED, 5), ('run', ChangeType.COMPLETED, 5),
+    ]
+    assert watcher.poll(project_id=1) == []
+
+
+def test_change_watcher_poll_without_changes_lists_once(testrail_client, projects_state):
+    watcher = ChangeWatcher(testrail_client, project_ids=[1])
+    projects_state['active_runs'] = [make_run(1, created_on=100)]
+    watcher.poll(project_id=1)
+    testrail_client.runs.iter_runs.reset_mock()
+    testrail_client.milestones.get_milestones.reset_mock()
+
+    assert watcher.poll(project_id=1) == []
+    assert testrail_client.runs.iter_runs.call_count == 2
+    assert testrail_client.milestones.get_milestones.call_count == 1
+
+
+def test_change_watcher_follows_projects_added_later(testrail_client, projects_state):
+    watcher = ChangeWatcher(testrail_client, interval=0.01)
+    stop_event = threading.Event()
+    received = []
+    thread = threading.Thread(target=watcher.watch, args=(received.append, stop_event))
+    thread.start()
+    projects_state['milestones'] = [Milestone(id=1, name='Release')]
+    watcher.add_project(1)
+    while not watcher._projects[1].is_initialized:
+        time.sleep(0.01)
+    projects_state['milestones'] = []
+    while not received:
+        time.sleep(0.01)
+    stop_event.set()
+    thread.join()
+
+    assert describe_events(received[:1]) == [('milestone', ChangeType.DELETED, 1)]
@@ -0,0 +1,57 @@
+import json
+
+from best_testrail_client.models.result import Result
+from best_testrail_client.services.project_export import ProjectExporter
+from best_testrail_client.transport.deadline import deadline, get_remaining_time
+from best_testrail_client.transport.scheduler import Priority, get_priority
+
+
+def test_project_export(testrail_client, mocker, tmp_path, case, section, run):
+    mocker.patch.object(testrail_client.cases, 'get_cases', side_effect=[[case, case], []])
+    mocker.patch.object(testrail_client.sections, 'get_sections', return_value=[section])
+    mocker.patch.object(testrail_client.runs, 'get_runs', side_effect=[[run], []])
+    get_results_for_run = mocker.patch.object(
+        testrail_client.results, 'get_results_for_run', return_value=[Result(status_id=1)],
+    )
+
+    stats = ProjectExporter(testrail_client, project_id=1, page_size=2).export(str(tmp_path))
+
+    assert {item.entity: item.records for item in stats} == {
+        'cases': 2, 'sections': 1, 'runs': 1, 'results': 1,
+    }
+    assert get_results_for_run.call_args[1]['run_id'] == run.id
+    assert get_results_for_run.call_count == 1
+    with open(tmp_path / 'cases.jsonl') as cases_file:
+        assert [json.loads(line)['id'] for line in cases_file] == [1, 1]
+    assert stats[0].describe().startswith('cases: 2 records in ')
+
+
+def test_project_export_selected_entities(testrail_client, mocker, tmp_path, section):
+    mocker.patch.object(testrail_client.sections, 'get_sections', return_value=[section])
+    get_runs = mocker.patch.object(testrail_client.runs, 'get_runs')
+
+    stats = ProjectExporter(testrail_client, project_id=1).export(
+        str(tmp_path), sink_format='csv', entities=['sections'],
+    )
+
+    assert [(item.entity, item.records) for item in stats] == [('sections', 1)]
+    assert get_runs.call_count == 0
+    assert (tmp_path / 'sections.csv').exists()
+
+
+def test_project_export_keeps_caller_context(testrail_client, mocker, tmp_path, section):
+    contexts = []
+
+    def get_sections(**kwargs):
+        contexts.append((get_priority(), get_remaining_time()))
+        return [section]
+
+    mocker.patch.object(testrail_client.sections, 'get_sections', side_effect=get_sections)
+
+    with deadline(60):
+        ProjectExporter(testrail_client, project_id=1).export(
+            str(tmp_path), entities=['sections'],
+        )
+
+    assert contexts[0][0] == Priority.LOW
+    assert 0 < contexts[0][1] <= 60
@@ -0,0 +1,53 @@
+import threading
+
+from best_testrail_client.models.result import Result
+from best_testrail_client.services.results_follower import RunResultsFollower
+
+
+def make_result(result_id, created_on):
+    return Result(status_id=1, id=result_id, created_on=created_on)
+
+
+def test_results_follower_fetches_after_watermark(testrail_client, mocker):
+    iter_results_for_run = mocker.patch.object(
+        testrail_client.results, 'iter_results_for_run',
+        return_value=[[make_result(2, 110), make_result(1, 100)]],
+    )
+    follower = RunResultsFollower(testrail_client.results, run_ids=[1])
+
+    first_results = follower.poll()
+    iter_results_for_run.return_value = [[make_result(3, 110), make_result(2, 110)]]
+    second_results = follower.poll()
+
+    assert [result.id for result in first_results] == [1, 2]
+    assert [result.id for result in second_results] == [3]
+    assert iter_results_for_run.call_args_list[0][1]['filters'] == {}
+    assert iter_results_for_run.call_args_list[1][1]['filters'] == {'created_after': 109}
+    assert follower.get_watermark(run_id=1) == 110
+
+
+def test_results_follower_without_new_results_keeps_watermark(testrail_client, mocker):
+    mocker.patch.object(testrail_client.results, 'iter_results_for_run', return_value=[])
+    follower = RunResultsFollower(testrail_client.results)
+    follower.add_run(run_id=1, created_after=500)
+
+    assert follower.poll() == []
+    assert follower.get_watermark(run_id=1) == 500
+    testrail_client.results.iter_results_for_run.assert_called_once()
+
+
+def test_results_follower_watch_calls_callback(testrail_client, mocker):
+    mocker.patch.object(
+        testrail_client.results, 'iter_results_for_run', return_value=[[make_result(1, 100)]],
+    )
+    follower = RunResultsFollower(testrail_client.results, run_ids=[1])
+    stop_event = threading.Event()
+    received = []
+
+    def callback(result):
+        received.append(result)
+        stop_event.set()
+
+    follower.watch(callback, interval=0, stop_event=stop_event)
+
+    assert [result.id for result in received] == [1]
@@ -0,0 +1,90 @@
+import pytest
+
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.case import Case
+from best_testrail_client.models.run import Run
+from best_testrail_client.models.test import Test
+from best_testrail_client.services.run_builder import RunBuilder
+
+
+@pytest.fixture
+def run_builder(testrail_client):
+    return RunBuilder(
+        testrail_client.runs, testrail_client.tests, testrail_client.cases, chunk_size=2,
+    )
+
+
+@pytest.fixture
+def runs_api(testrail_client, mocker):
+    mocker.patch.object(
+        testrail_client.runs, 'add_run',
+        side_effect=lambda run, project_id: Run(
+            id=10, name=run.name, include_all=run.include_all, case_ids=run.case_ids,
+        ),
+    )
+    mocker.patch.object(testrail_client.runs, 'update_run', side_effect=lambda run: run)
+    return testrail_client.runs
+
+
+def _mock_tests(testrail_client, mocker, *case_ids_per_call):
+    # every test of a run comes in its own page
+    return mocker.patch.object(testrail_client.tests, 'iter_tests', side_effect=[
+        iter([[Test(case_id=case_id)] for case_id in case_ids]) for case_ids in case_ids_per_call
+    ])
+
+
+def test_run_builder_extends_run_in_chunks(testrail_client, run_builder, runs_api, mocker):
+    _mock_tests(testrail_client, mocker, [1, 2, 3, 4, 5])
+
+    run = run_builder.create(Run(name='Big', include_all=True), project_id=1, case_ids=[
+        1, 2, 3, 3, 4, 5,
+    ])
+
+    assert runs_api.add_run.call_args[0][0].case_ids == [1, 2]
+    assert [call[0][0].case_ids for call in runs_api.update_run.call_args_list] == [
+        [1, 2, 3, 4], [1, 2, 3, 4, 5],
+    ]
+    assert run.id == 10
+    assert run.case_ids == [1, 2, 3, 4, 5]
+
+
+def test_run_builder_retries_missing_cases_once(testrail_client, run_builder, runs_api, mocker):
+    iter_tests = _mock_tests(testrail_client, mocker, [1], [1, 2])
+
+    run_builder.create(Run(name='Small', include_all=False), case_ids=[1, 2])
+
+    assert iter_tests.call_count == 2
+    assert runs_api.update_run.call_count == 1
+
+
+def test_run_builder_raises_on_missing_cases(testrail_client, run_builder, runs_api, mocker):
+    _mock_tests(testrail_client, mocker, [1], [1])
+
+    with pytest.raises(TestRailException, match='missing 1 cases'):
+        run_builder.create(Run(name='Small', include_all=False), case_ids=[1, 2])
+
+
+def test_run_builder_selects_cases_by_filter(testrail_client, run_builder, runs_api, mocker):
+    get_cases = mocker.patch.object(
+        testrail_client.cases, 'get_cases', return_value=[Case(id=7), Case(id=8)],
+    )
+
+    run = run_builder.create(
+        Run(name='Filtered', include_all=False, suite_id=3), project_id=1,
+        case_filter={'priority_id': [1]}, verify=False,
+    )
+
+    get_cases.assert_called_once_with(project_id=1, suite_id=3, filters={'priority_id': [1]})
+    assert run.case_ids == [7, 8]
+
+
+def test_run_builder_empty_filter_includes_all_cases(run_builder, runs_api):
+    run = run_builder.create(Run(name='All', include_all=False, case_ids=[1]), case_filter={})
+
+    assert run.include_all is True
+    assert run.case_ids is None
+
+
+def test_run_builder_requires_selection(run_builder):
+    with pytest.raises(TestRailException):
+        run_builder.create(Run(name='Nothing', include_all=False))
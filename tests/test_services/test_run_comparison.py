@@ -0,0 +1,58 @@
+import pytest
+
+from best_testrail_client.models.test import Test
+from best_testrail_client.services.run_comparison import DiffKind, RunComparator
+
+RUNS_STATUSES = {
+    1: {10: 1, 11: 5, 12: 1, 13: 5, 14: 1, 15: 4},
+    2: {10: 1, 11: 1, 12: 5, 13: 5, 14: 2, 16: 5},
+}
+
+
+@pytest.fixture
+def runs_tests(testrail_client, mocker):
+    def iter_tests(run_id, page_size):
+        tests = [
+            Test(id=run_id * 100 + case_id, case_id=case_id, status_id=status_id)
+            for case_id, status_id in RUNS_STATUSES[run_id].items()
+        ]
+        return (tests[start:start + page_size] for start in range(0, len(tests), page_size))
+
+    return mocker.patch.object(testrail_client.tests, 'iter_tests', side_effect=iter_tests)
+
+
+def test_run_comparator_compares_runs(testrail_client, runs_tests):
+    comparison = RunComparator(testrail_client, page_size=2).compare(
+        base_run_id=1, target_run_id=2,
+    )
+
+    assert {diff.case_id: diff.kind for diff in comparison.diffs} == {
+        11: DiffKind.FIXED,
+        12: DiffKind.NEW_FAILURE,
+        14: DiffKind.FLIPPED,
+        15: DiffKind.MISSING,
+        16: DiffKind.ADDED,
+    }
+    assert comparison.get_count(DiffKind.UNCHANGED) == 2
+    assert comparison.get_count(DiffKind.NEW_FAILURE) == 1
+    new_failure = comparison.get_diffs(DiffKind.NEW_FAILURE)[0]
+    assert (new_failure.base_test_id, new_failure.target_test_id) == (112, 212)
+    assert (new_failure.base_status_id, new_failure.target_status_id) == (1, 5)
+
+
+def test_run_comparator_streams_diffs(testrail_client, runs_tests):
+    diffs = RunComparator(testrail_client, page_size=1, max_pending_pages=1).iter_diffs(
+        base_run_id=1, target_run_id=2,
+    )
+
+    first_diff = next(diffs)
+    diffs.close()
+
+    assert first_diff.kind in {DiffKind.FIXED, DiffKind.NEW_FAILURE}
+
+
+def test_run_comparator_raises_fetch_errors(testrail_client, mocker):
+    mocker.patch.object(testrail_client.tests, 'iter_tests', side_effect=ValueError('boom'))
+
+    with pytest.raises(ValueError):
+        RunComparator(testrail_client).compare(base_run_id=1, target_run_id=2)
@@ -0,0 +1,90 @@
+import dataclasses
+import json
+
+import pytest
+
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.result import Result
+from best_testrail_client.models.test import Test
+from best_testrail_client.services.run_snapshot import RunSnapshotExporter
+
+
+@pytest.fixture
+def mocked_run(testrail_client, mocker, run, attachment):
+    mocker.patch.object(testrail_client.runs, 'get_run', return_value=run)
+    tests = [Test(id=1, case_id=10), Test(id=2, case_id=20), Test(id=3, case_id=30)]
+    mocker.patch.object(
+        testrail_client.tests, 'get_tests',
+        side_effect=lambda run_id, filters: tests[
+            filters['offset']:filters['offset'] + filters['limit']
+        ],
+    )
+    mocker.patch.object(testrail_client.results, 'get_results_for_run', side_effect=[
+        [Result(id=1, status_id=1, test_id=1), Result(id=2, status_id=5, test_id=2)],
+        [Result(id=3, status_id=1, test_id=2)],
+    ] + [[]] * 20)
+    mocker.patch.object(
+        testrail_client.attachments, 'get_attachments_for_test',
+        side_effect=lambda test_id: [dataclasses.replace(attachment, id=test_id)],
+    )
+    return run
+
+
+def _read_records(path):
+    with open(path) as snapshot_file:
+        return [json.loads(line) for line in snapshot_file]
+
+
+def test_run_snapshot_export(testrail_client, mocked_run, tmp_path):
+    path = str(tmp_path / 'snapshot.jsonl')
+    exporter = RunSnapshotExporter(testrail_client, chunk_size=2, page_size=2)
+
+    written_count = exporter.export(run_id=mocked_run.id, path=path)
+
+    records = _read_records(path)
+    assert written_count == 3
+    assert records[0] == {'type': 'run', 'run': mocked_run.to_json()}
+    assert [record['test']['id'] for record in records[1:]] == [1, 2, 3]
+    assert [
+        [result['id'] for result in record['results']] for record in records[1:]
+    ] == [[1], [2, 3], []]
+    assert records[2]['attachments'][0]['id'] == 2
+    assert records[2]['run_id'] == mocked_run.id
+
+
+def test_run_snapshot_export_resumes(testrail_client, mocked_run, tmp_path):
+    path = tmp_path / 'snapshot.jsonl'
+    path.write_text(
+        json.dumps({'type': 'run', 'run': {'id': mocked_run.id}}) + '\n'
+        + json.dumps({'type': 'test', 'test': {'id': 1}, 'results': []}) + '\n'
+        + '{"type": "test", "te',
+    )
+    exporter = RunSnapshotExporter(testrail_client, page_size=2)
+
+    written_count = exporter.export(run_id=mocked_run.id, path=str(path))
+
+    records = _read_records(path)
+    assert written_count == 2
+    assert [record['type'] for record in records] == ['run', 'test', 'test', 'test']
+    assert [record['test']['id'] for record in records[1:]] == [1, 2, 3]
+
+
+def test_run_snapshot_export_pages_tests(testrail_client, mocked_run, tmp_path):
+    exporter = RunSnapshotExporter(testrail_client, chunk_size=2, page_size=2)
+
+    exporter.export(run_id=mocked_run.id, path=str(tmp_path / 'snapshot.jsonl'))
+
+    assert {
+        call[1]['filters']['limit'] for call in testrail_client.tests.get_tests.call_args_list
+    } == {2}
+
+
+def test_run_snapshot_export_does_not_resume_other_run(testrail_client, mocked_run, tmp_path):
+    path = tmp_path / 'snapshot.jsonl'
+    path.write_text(json.dumps({'type': 'run', 'run': {'id': mocked_run.id + 1}}) + '\n')
+    exporter = RunSnapshotExporter(testrail_client)
+
+    with pytest.raises(TestRailException):
+        exporter.export(run_id=mocked_run.id, path=str(path))
+
+    assert len(_read_records(path)) == 1
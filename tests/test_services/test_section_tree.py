@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.section import Section
+from best_testrail_client.services.section_tree import SectionTree
+
+
+@pytest.fixture
+def section_tree(testrail_client, mocker):
+    mocker.patch.object(testrail_client.sections, 'get_sections', return_value=[
+        Section(id=1, name='A', depth=0),
+        Section(id=2, name='B', depth=1, parent_id=1),
+        Section(id=3, name='Orphan', depth=1, parent_id=100),
+    ])
+    return SectionTree(testrail_client.sections, project_id=1, suite_id=5)
+
+
+def test_section_tree_path_index(section_tree):
+    assert section_tree.get_section('A / B').id == 2
+    assert section_tree.get_section('A/C') is None
+    assert section_tree.get_path(section_id=2) == 'A/B'
+    assert section_tree.get_path(section_id=3) is None
+
+
+def test_section_tree_ensure_paths_creates_missing_levels(
+    testrail_client, section_tree, mocker,
+):
+    created_ids = iter(range(10, 20))
+
+    def add_section(section, project_id):
+        return Section(
+            id=next(created_ids), name=section.name, parent_id=section.parent_id,
+            suite_id=section.suite_id,
+        )
+    add_section_mock = mocker.patch.object(
+        testrail_client.sections, 'add_section', side_effect=add_section,
+    )
+
+    section_ids = section_tree.ensure_paths(['A/B', 'A/B/C/D', 'A/E', 'F'])
+
+    assert section_ids['A/B'] == 2
+    assert section_tree.get_path(section_ids['A/B/C/D']) == 'A/B/C/D'
+    assert section_tree.get_section('A/B/C/D').parent_id == section_tree.get_section('A/B/C').id
+    assert section_tree.get_section('A/E').parent_id == 1
+    assert section_tree.get_section('F').parent_id is None
+    assert add_section_mock.call_count == 4
+    assert {call[1]['section'].suite_id for call in add_section_mock.call_args_list} == {5}
+    assert section_tree.ensure_paths(['A/B/C/D']) == {'A/B/C/D': section_ids['A/B/C/D']}
+    assert add_section_mock.call_count == 4
+
+
+def test_section_tree_ensure_paths_reports_failed_sections(
+    testrail_client, section_tree, mocker,
+):
+    def add_section(section, project_id):
+        if section.name == 'Broken':
+            raise ValueError('boom')
+        return Section(id=10, name=section.name, parent_id=section.parent_id)
+    mocker.patch.object(testrail_client.sections, 'add_section', side_effect=add_section)
+
+    with pytest.raises(TestRailException, match='A/Broken'):
+        section_tree.ensure_paths(['A/Created', 'A/Broken'])
+
+    assert section_tree.get_section('A/Created').id == 10
+
+
+@pytest.mark.parametrize('path', ['', '/', ' / '])
+def test_section_tree_ensure_paths_rejects_empty_paths(section_tree, path):
+    with pytest.raises(TestRailException, match='must not be empty'):
+        section_tree.ensure_paths(['A', path])
+
+
+def test_section_tree_ensure_paths_creates_sections_once(testrail_client, mocker):
+    sections = [Section(id=1, name='A', depth=0)]
+    mocker.patch.object(
+        testrail_client.sections, 'get_sections', side_effect=lambda **kwargs: list(sections),
+    )
+
+    def add_section(section, project_id):
+        time.sleep(0.05)
+        created_section = Section(
+            id=len(sections) + 1, name=section.name, parent_id=section.parent_id, depth=1,
+        )
+        sections.append(created_section)
+        return created_section
+    add_section_mock = mocker.patch.object(
+        testrail_client.sections, 'add_section', side_effect=add_section,
+    )
+    section_tree = SectionTree(testrail_client.sections, project_id=1)
+    section_tree.refresh()
+    section_ids = []
+    threads = [
+        threading.Thread(target=lambda: section_ids.append(section_tree.ensure_paths(['A/B'])))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert add_section_mock.call_count == 1
+    assert section_ids == [{'A/B': 2}, {'A/B': 2}]
@@ -0,0 +1,47 @@
+import csv
+import json
+
+import pytest
+
+from best_testrail_client.exceptions import TestRailException
+from best_testrail_client.models.case import Case
+from best_testrail_client.services.sinks import open_sink
+
+
+@pytest.mark.parametrize('sink_format', ['jsonl', 'csv'])
+def test_text_sinks(tmp_path, case, sink_format):
+    path = str(tmp_path / f'cases.{sink_format}')
+    sink = open_sink(path, sink_format, Case)
+
+    sink.write(case)
+    sink.close()
+
+    with open(path) as sink_file:
+        if sink_format == 'jsonl':
+            records = [json.loads(line) for line in sink_file]
+        else:
+            records = list(csv.DictReader(sink_file))
+    assert len(records) == 1
+    assert records[0]['title'] == case.title
+    if sink_format == 'csv':
+        assert json.loads(records[0]['custom']) == case.custom
+        assert records[0]['template_id'] == ''
+
+
+def test_parquet_sink(tmp_path, case):
+    parquet = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'cases.parquet')
+    sink = open_sink(path, 'parquet', Case)
+
+    sink.write(case)
+    sink.write(Case(id=2))
+    sink.close()
+
+    rows = parquet.read_table(path).to_pylist()
+    assert [row['id'] for row in rows] == [1, 2]
+    assert json.loads(rows[0]['custom']) == case.custom
+
+
+def test_open_sink_rejects_unknown_format(tmp_path):
+    with pytest.raises(TestRailException):
+        open_sink(str(tmp_path / 'cases.xml'), 'xml', Case)
@@ -0,0 +1,60 @@
+import pytest
+
+from best_testrail_client.exceptions import APIError, CircuitOpen
+from best_testrail_client.models.user import User
+from best_testrail_client.services.user_resolver import UserResolver
+
+
+@pytest.fixture
+def user_resolver(testrail_client, mocker, user):
+    mocker.patch.object(testrail_client.users, 'get_users', return_value=[user])
+    return UserResolver(testrail_client.users, negative_ttl=60)
+
+
+def test_user_resolver_uses_bulk_loaded_users(testrail_client, user_resolver, user, mocker):
+    get_user_by_email = mocker.patch.object(testrail_client.users, 'get_user_by_email')
+
+    assert user_resolver.get_by_email(' Alexis@Example.com') == user
+    assert user_resolver.get_by_name('alexis gonzalez') == user
+    assert user_resolver.get_by_id(user_id=1) == user
+    assert testrail_client.users.get_users.call_count == 1
+    assert get_user_by_email.call_count == 0
+
+
+def test_user_resolver_falls_back_to_get_user_by_email(testrail_client, user_resolver, mocker):
+    new_user = User(email='new@example.com', id=2, is_active=True, name='New')
+    mocker.patch.object(testrail_client.users, 'get_user_by_email', return_value=new_user)
+
+    assert user_resolver.get_by_email('new@example.com') == new_user
+    assert user_resolver.get_by_id(user_id=2) == new_user
+    assert user_resolver.get_by_email('new@example.com') == new_user
+    assert testrail_client.users.get_user_by_email.call_count == 1
+
+
+def test_user_resolver_caches_unknown_emails(testrail_client, user_resolver, mocker):
+    get_user_by_email = mocker.patch.object(
+        testrail_client.users, 'get_user_by_email', side_effect=APIError('Unknown'),
+    )
+    monotonic = mocker.patch('best_testrail_client.services.user_resolver.time.monotonic')
+    monotonic.return_value = 100
+
+    assert user_resolver.get_by_email('unknown@example.com') is None
+    assert user_resolver.get_by_email('unknown@example.com') is None
+    assert get_user_by_email.call_count == 1
+
+    monotonic.return_value = 161
+    assert user_resolver.get_by_email('unknown@example.com') is None
+    assert get_user_by_email.call_count == 2
+
+
+def test_user_resolver_does_not_cache_transport_errors(testrail_client, user_resolver, mocker):
+    new_user = User(email='new@example.com', id=2, is_active=True, name='New')
+    get_user_by_email = mocker.patch.object(
+        testrail_client.users, 'get_user_by_email',
+        side_effect=[CircuitOpen('Circuit is open'), new_user],
+    )
+
+    with pytest.raises(CircuitOpen):
+        user_resolver.get_by_email('new@example.com')
+    assert user_resolver.get_by_email('new@example.com') == new_user
+    assert get_user_by_email.call_count == 2
@@ -0,0 +1,71 @@
+import threading
+import time
+
+from best_testrail_client.transport.adaptive import AdaptiveLimiter
+from best_testrail_client.transport.fan_out import FanOutExecutor
+from best_testrail_client.transport.transport import Transport
+
+
+def test_adaptive_limiter_grows_while_latency_is_flat():
+    limiter = AdaptiveLimiter(max_limit=4, initial_limit=2)
+
+    for _ in range(6):
+        limiter.record(200, latency=0.1)
+
+    assert limiter.limit == 4
+
+
+def test_adaptive_limiter_backs_off_once_per_window():
+    limiter = AdaptiveLimiter(max_limit=16, initial_limit=8)
+    for _ in range(8):
+        limiter.record(200, latency=0.1)
+
+    limiter.record(429, latency=0.1)
+    limiter.record(503, latency=0.1)
+
+    assert limiter.limit == 4
+
+
+def test_adaptive_limiter_backs_off_on_latency_spikes():
+    limiter = AdaptiveLimiter(max_limit=4, min_limit=2, initial_limit=4)
+    for _ in range(4):
+        limiter.record(200, latency=0.1)
+
+    limiter.record(200, latency=1)
+    for _ in range(4):
+        limiter.record(None, latency=0.1)
+
+    assert limiter.limit == 2
+
+
+def test_fan_out_runs_tasks_within_adaptive_limit():
+    fan_out = FanOutExecutor(max_workers=4, limiter=AdaptiveLimiter(max_limit=4, initial_limit=1))
+    lock, running, max_running = threading.Lock(), [0], [0]
+
+    def task(key):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return key
+
+    bulk_result = fan_out.map(task, range(4))
+
+    assert bulk_result.values == [0, 1, 2, 3]
+    assert max_running[0] == 1
+    assert fan_out.concurrency == 1
+
+
+def test_transport_exposes_concurrency_limit(mocked_response):
+    mocked_response(data_json={'error': 'Unavailable'}, status_code=503)
+    transport = Transport(
+        'https://test.test.test/', 'login', 'token', max_workers=8, adaptive_concurrency=True,
+    )
+    assert transport.get_metrics().concurrency_limit == 4
+
+    for _ in range(4):
+        transport.request('add_result/1', method='POST')
+
+    assert transport.get_metrics().concurrency_limit == 2
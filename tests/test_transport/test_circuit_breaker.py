@@ -0,0 +1,125 @@
+import pytest
+
+from best_testrail_client.exceptions import CircuitOpen
+from best_testrail_client.transport.circuit_breaker import (
+    CircuitBreaker, CircuitState, RequestSpool,
+)
+from best_testrail_client.transport.transport import Transport
+
+
+@pytest.fixture
+def monotonic(mocker):
+    return mocker.patch(
+        'best_testrail_client.transport.circuit_breaker.time.monotonic', return_value=100,
+    )
+
+
+@pytest.fixture
+def open_circuit_breaker(monotonic):
+    circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    circuit_breaker.record(None, latency=1)
+    circuit_breaker.record(503, latency=1)
+    return circuit_breaker
+
+
+@pytest.mark.parametrize(
+    'status_code, latency, expected_state',
+    [
+        (500, 0.1, CircuitState.OPEN),
+        (None, 0.1, CircuitState.OPEN),
+        (200, 5, CircuitState.OPEN),
+        (200, 0.1, CircuitState.CLOSED),
+        (429, 0.1, CircuitState.CLOSED),
+    ],
+)
+def test_circuit_breaker_counts_failures(monotonic, status_code, latency, expected_state):
+    circuit_breaker = CircuitBreaker(failure_threshold=2, slow_call_seconds=2)
+
+    for _ in range(2):
+        circuit_breaker.record(status_code, latency=latency)
+
+    assert circuit_breaker.state == expected_state
+
+
+def test_circuit_breaker_success_resets_consecutive_failures(monotonic):
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+
+    for status_code in (500, 200, 500):
+        circuit_breaker.record(status_code, latency=0.1)
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+def test_circuit_breaker_probes_after_reset_timeout(open_circuit_breaker, monotonic):
+    assert open_circuit_breaker.allow_request() is False
+
+    monotonic.return_value = 130
+
+    assert open_circuit_breaker.state == CircuitState.HALF_OPEN
+    assert open_circuit_breaker.allow_request() is True
+    assert open_circuit_breaker.allow_request() is False
+    open_circuit_breaker.record(200, latency=0.1)
+    assert open_circuit_breaker.state == CircuitState.CLOSED
+
+
+def test_circuit_breaker_failed_probe_opens_circuit(open_circuit_breaker, monotonic):
+    monotonic.return_value = 130
+    open_circuit_breaker.allow_request()
+
+    open_circuit_breaker.record(None, latency=10)
+
+    assert open_circuit_breaker.state == CircuitState.OPEN
+    assert open_circuit_breaker.allow_request() is False
+
+
+def test_circuit_breaker_diverts_writes_to_fallback(mocker):
+    fallback = mocker.Mock()
+    circuit_breaker = CircuitBreaker(fallback=fallback)
+
+    with pytest.raises(CircuitOpen) as write_error:
+        circuit_breaker.reject('add_result/1', 'POST', {'status_id': 1}, None)
+    with pytest.raises(CircuitOpen) as read_error:
+        circuit_breaker.reject('get_case/1', 'GET', None, None)
+
+    assert write_error.value.diverted is True
+    assert read_error.value.diverted is False
+    fallback.divert.assert_called_once_with('add_result/1', {'status_id': 1}, None)
+
+
+def test_request_spool_replays_writes_in_order(mocker, tmp_path):
+    spool = RequestSpool(str(tmp_path / 'spool.jsonl'))
+    spool.divert('add_result/1', {'status_id': 1}, None)
+    spool.divert('add_attachment_to_run/1', {}, {'name': 'log.txt', 'file_content': b'log'})
+    spool.divert('add_result/2', {'status_id': 5}, None)
+    client = mocker.Mock()
+    transport = client._transport
+    transport.request.side_effect = [None, None, CircuitOpen('Circuit is open')]
+
+    with pytest.raises(CircuitOpen):
+        spool.replay(client)
+    transport.request.side_effect = None
+    sent_count = spool.replay(client)
+
+    assert sent_count == 1
+    assert transport.request.call_args_list[1][1]['attachment'] == {
+        'name': 'log.txt', 'file_content': b'log',
+    }
+    assert transport.request.call_args_list[3][0][0] == 'add_result/2'
+    assert spool.replay(client) == 0
+
+
+def test_transport_short_circuits_requests(mocked_response, monotonic):
+    mocked_requests = mocked_response(data_json={'error': 'Unavailable'}, status_code=503)
+    transport = Transport(
+        'https://test.test.test/', 'login', 'token',
+        circuit_breaker=CircuitBreaker(failure_threshold=1),
+    )
+    transport.request('add_result/1', method='POST')
+
+    with pytest.raises(CircuitOpen):
+        transport.request('add_result/1', method='POST')
+
+    metrics = transport.get_metrics()
+    assert mocked_requests.call_count == 1
+    assert metrics.circuit_state == 'open'
+    assert metrics.short_circuited_count == 1
@@ -0,0 +1,122 @@
+import pytest
+import requests
+
+from best_testrail_client.exceptions import DeadlineExceeded
+from best_testrail_client.transport.deadline import (
+    check_deadline, deadline, get_remaining_time, get_request_timeout, timeout,
+)
+from best_testrail_client.transport.circuit_breaker import CircuitBreaker, CircuitState
+from best_testrail_client.transport.fan_out import FanOutExecutor
+from best_testrail_client.transport.transport import DEFAULT_TIMEOUT, Transport
+
+
+@pytest.fixture
+def monotonic(mocker):
+    return mocker.patch(
+        'best_testrail_client.transport.deadline.time.monotonic', return_value=100,
+    )
+
+
+def test_nested_deadline_only_shortens_budget(monotonic):
+    with deadline(10):
+        with deadline(60):
+            assert get_remaining_time() == 10
+        with deadline(5):
+            assert get_remaining_time() == 5
+    assert get_remaining_time() is None
+
+
+def test_check_deadline_raises_after_budget(monotonic):
+    with deadline(10):
+        check_deadline()
+        monotonic.return_value = 110
+
+        with pytest.raises(DeadlineExceeded):
+            check_deadline()
+
+
+@pytest.mark.parametrize(
+    'default, override, expected_timeout',
+    [
+        ((5, 60), None, (5, 60)),
+        ((5, 60), 30, 30),
+        (None, None, None),
+    ],
+)
+def test_get_request_timeout(default, override, expected_timeout):
+    with timeout(override):
+        assert get_request_timeout(default) == expected_timeout
+
+
+@pytest.mark.parametrize(
+    'default, budget, expected_timeout',
+    [
+        ((5, 60), 20, (5, 20)),
+        (None, 20, 20),
+        (10, 0, 0.001),
+    ],
+)
+def test_get_request_timeout_is_limited_by_deadline(
+    monotonic, default, budget, expected_timeout,
+):
+    with deadline(budget):
+        assert get_request_timeout(default) == expected_timeout
+
+
+def test_fan_out_propagates_deadline_and_skips_expired_tasks(monotonic):
+    fan_out = FanOutExecutor(max_workers=2)
+
+    with deadline(10):
+        bulk_result = fan_out.map(lambda key: get_remaining_time(), [1, 2])
+        monotonic.return_value = 110
+        expired_result = fan_out.map(lambda key: key, [1, 2])
+
+    assert bulk_result.values == [10, 10]
+    assert all(isinstance(error, DeadlineExceeded) for error in expired_result.errors.values())
+    assert len(expired_result.errors) == 2
+
+
+def test_transport_sends_timeouts(mocked_response):
+    mocked_requests = mocked_response(data_json={'id': 1})
+    transport = Transport('https://test.test.test/', 'login', 'token')
+
+    transport.request('get_case/1')
+    with timeout((1, 2)):
+        transport.request('get_case/2')
+
+    assert mocked_requests.call_args_list[0][1]['timeout'] == DEFAULT_TIMEOUT
+    assert mocked_requests.call_args_list[1][1]['timeout'] == (1, 2)
+
+
+def test_transport_does_not_send_after_deadline(mocked_response, monotonic):
+    mocked_requests = mocked_response(data_json={'id': 1})
+    transport = Transport('https://test.test.test/', 'login', 'token')
+
+    with deadline(10):
+        monotonic.return_value = 110
+        with pytest.raises(DeadlineExceeded):
+            transport.request('add_case/1', method='POST')
+
+    assert mocked_requests.call_count == 0
+
+
+def test_transport_timeout_cut_by_deadline_is_not_a_failure(mocker, monotonic):
+    def time_out(*args, **kwargs):
+        monotonic.return_value = 110
+        raise requests.Timeout()
+
+    mocker.patch('requests.Session.request', side_effect=time_out)
+    circuit_breaker = CircuitBreaker(failure_threshold=1)
+    transport = Transport(
+        'https://test.test.test/', 'login', 'token', circuit_breaker=circuit_breaker,
+    )
+
+    with deadline(10), pytest.raises(DeadlineExceeded):
+        transport.request('get_case/1')
+    state_after_deadline = circuit_breaker.state
+    with pytest.raises(requests.Timeout):
+        transport.request('get_case/1')
+
+    assert transport.get_metrics().requests_count == 2
+    assert state_after_deadline == CircuitState.CLOSED
+    assert circuit_breaker.state == CircuitState.OPEN
@@ -0,0 +1,28 @@
+from best_testrail_client.transport.fan_out import FanOutExecutor
+
+
+def _invert(value):
+    return 1 / value
+
+
+def test_fan_out_preserves_order_and_collects_errors():
+    fan_out = FanOutExecutor(max_workers=2)
+
+    bulk_result = fan_out.map(_invert, [1, 0, 4])
+    fan_out.shutdown()
+
+    assert [item.key for item in bulk_result.items] == [1, 0, 4]
+    assert bulk_result.values == [1, 0.25]
+    assert list(bulk_result.errors) == [0]
+    assert isinstance(bulk_result.errors[0], ZeroDivisionError)
+    assert bulk_result.is_successful is False
+
+
+def test_fan_out_recreates_pool_after_shutdown():
+    fan_out = FanOutExecutor(max_workers=1)
+    fan_out.shutdown()
+
+    bulk_result = fan_out.map(_invert, [2])
+
+    assert bulk_result.is_successful is True
+    assert bulk_result.values == [0.5]
@@ -0,0 +1,17 @@
+from best_testrail_client.transport.metrics import TransportMetrics
+
+
+def test_transport_metrics_snapshot():
+    metrics = TransportMetrics()
+    metrics.record(200, latency=0.5)
+    metrics.record(429, latency=0.25)
+    metrics.record(None, latency=0.75)
+
+    snapshot = metrics.snapshot()
+    metrics.reset()
+
+    assert snapshot.requests_count == 3
+    assert snapshot.errors_count == 1
+    assert snapshot.status_counts == {200: 1, 429: 1}
+    assert snapshot.average_latency == 0.5
+    assert metrics.snapshot().requests_count == 0
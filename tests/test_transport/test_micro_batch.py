@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from best_testrail_client.transport.micro_batch import MicroBatcher
+
+
+def submit_concurrently(batcher, key_items):
+    values, errors = {}, {}
+
+    def submit(key, item):
+        try:
+            values[item] = batcher.submit(key, item)
+        except Exception as error:  # noqa: B902
+            errors[item] = error
+
+    threads = [threading.Thread(target=submit, args=key_item) for key_item in key_items]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return values, errors
+
+
+def test_micro_batcher_merges_items_by_key():
+    flushes = []
+
+    def flush(key, items):
+        flushes.append((key, sorted(items)))
+        return [item * 10 for item in items]
+
+    batcher = MicroBatcher(flush, window=0.5, max_batch_size=3)
+
+    values, errors = submit_concurrently(batcher, [(1, 1), (1, 2), (1, 3), (2, 4)])
+
+    assert values == {1: 10, 2: 20, 3: 30, 4: 40}
+    assert sorted(flushes) == [(1, [1, 2, 3]), (2, [4])]
+    assert errors == {}
+
+
+def test_micro_batcher_shares_flush_errors():
+    def flush(key, items):
+        raise ValueError('Flush failed')
+
+    batcher = MicroBatcher(flush, window=0.1, max_batch_size=2)
+
+    values, errors = submit_concurrently(batcher, [(1, 1), (1, 2)])
+
+    assert values == {}
+    assert [str(error) for error in errors.values()] == ['Flush failed', 'Flush failed']
+
+
+def test_micro_batcher_checks_values_count():
+    batcher = MicroBatcher(lambda key, items: [], window=0)
+
+    with pytest.raises(ValueError):
+        batcher.submit(1, 1)
+
+
+def test_micro_batcher_falls_back_to_single_items():
+    def flush(key, items):
+        raise ValueError('Batch is rejected')
+
+    def submit_one(key, item):
+        if item == 3:
+            raise KeyError(item)
+        return item * 10
+
+    batcher = MicroBatcher(
+        flush, window=0.5, max_batch_size=3, fallback=submit_one, fallback_errors=(ValueError,),
+    )
+
+    values, errors = submit_concurrently(batcher, [('key', 1), ('key', 2), ('key', 3)])
+
+    assert values == {1: 10, 2: 20}
+    assert list(errors) == [3]
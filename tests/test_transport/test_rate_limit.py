@@ -0,0 +1,92 @@
+import pytest
+
+from best_testrail_client.exceptions import DeadlineExceeded
+from best_testrail_client.transport.deadline import deadline
+from best_testrail_client.transport.rate_limit import (
+    FileRateLimiter, TokenBucketRateLimiter, take_token,
+)
+
+
+@pytest.mark.parametrize(
+    'tokens, updated_at, now, expected_result',
+    [
+        (2, 0, 0, (1, 0)),
+        (0, 0, 1, (1, 0)),
+        (0, 0, 100, (1, 0)),
+        (0, 0, 0.25, (0.5, 0.25)),
+    ],
+)
+def test_take_token(tokens, updated_at, now, expected_result):
+    assert take_token(tokens, updated_at, now, rate=2, burst=2) == expected_result
+
+
+def test_token_bucket_rate_limiter_waits_for_tokens(mocker):
+    monotonic = mocker.patch(
+        'best_testrail_client.transport.rate_limit.time.monotonic', return_value=0,
+    )
+    sleep = mocker.patch(
+        'best_testrail_client.transport.rate_limit.time.sleep',
+        side_effect=lambda seconds: setattr(monotonic, 'return_value', seconds),
+    )
+    rate_limiter = TokenBucketRateLimiter(rate=4)
+
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+
+    sleep.assert_called_once_with(0.25)
+
+
+def test_token_bucket_rate_limiter_does_not_wait_past_deadline(mocker):
+    mocker.patch('best_testrail_client.transport.rate_limit.time.monotonic', return_value=0)
+    sleep = mocker.patch('best_testrail_client.transport.rate_limit.time.sleep')
+    rate_limiter = TokenBucketRateLimiter(rate=1)
+    rate_limiter.acquire()
+
+    with deadline(0.5), pytest.raises(DeadlineExceeded):
+        rate_limiter.acquire()
+
+    assert sleep.call_count == 0
+    assert rate_limiter._tokens == 0
+
+
+def test_file_rate_limiter_shares_budget_through_file(mocker, tmp_path):
+    mocker.patch('best_testrail_client.transport.rate_limit.time.time', return_value=100)
+    sleep = mocker.patch(
+        'best_testrail_client.transport.rate_limit.time.sleep', side_effect=InterruptedError,
+    )
+    path = str(tmp_path / 'rate.lock')
+    first_limiter = FileRateLimiter(path, rate=1, burst=1)
+    second_limiter = FileRateLimiter(path, rate=1, burst=1)
+
+    first_limiter.acquire()
+    with pytest.raises(InterruptedError):
+        second_limiter.acquire()
+
+    sleep.assert_called_once_with(1)
+    assert open(path).read() == '0.0 100'
+
+
+def test_file_rate_limiter_keeps_file_open(mocker, tmp_path):
+    path = str(tmp_path / 'rate.lock')
+    rate_limiter = FileRateLimiter(path, rate=100, burst=2)
+    state_file = rate_limiter._state_file
+    fsync = mocker.patch('best_testrail_client.transport.rate_limit.os.fsync', create=True)
+
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+
+    assert rate_limiter._state_file is state_file
+    assert fsync.call_count == 0
+    rate_limiter.close()
+
+
+def test_file_rate_limiter_reopens_file_after_fork(mocker, tmp_path):
+    rate_limiter = FileRateLimiter(str(tmp_path / 'rate.lock'), rate=100, burst=2)
+    state_file = rate_limiter._state_file
+    mocker.patch('os.getpid', return_value=-1)
+
+    rate_limiter.acquire()
+
+    assert rate_limiter._state_file is not state_file
+    assert state_file.closed
+    rate_limiter.close()
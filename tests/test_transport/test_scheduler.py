@@ -0,0 +1,113 @@
+import collections
+import threading
+import time
+
+import pytest
+
+from best_testrail_client.exceptions import DeadlineExceeded
+from best_testrail_client.transport.deadline import deadline
+from best_testrail_client.transport.fan_out import FanOutExecutor
+from best_testrail_client.transport.scheduler import (
+    Priority, RequestScheduler, get_priority, low_priority, priority,
+)
+
+
+def start_request(scheduler, request_priority, name, admitted, release=None):
+    def send():
+        with scheduler.slot(request_priority):
+            admitted.append(name)
+            if release is not None:
+                release.wait(5)
+
+    thread = threading.Thread(target=send)
+    thread.start()
+    return thread
+
+
+def wait_for_waiting(scheduler, high_count, low_count):
+    for _ in range(500):
+        waiting = scheduler._waiting
+        is_started = sum(scheduler._active.values()) > 0
+        counts = (len(waiting[Priority.HIGH]), len(waiting[Priority.LOW]))
+        if is_started and counts == (high_count, low_count):
+            return
+        time.sleep(0.01)
+    raise AssertionError('Requests are not waiting')
+
+
+def run_queued_requests(scheduler, queued_requests):
+    admitted, release = [], threading.Event()
+    threads = [start_request(scheduler, Priority.LOW, 'holder', admitted, release)]
+    wait_for_waiting(scheduler, high_count=0, low_count=0)
+    high_count, low_count = 0, 0
+    for request_priority, name in queued_requests:
+        threads.append(start_request(scheduler, request_priority, name, admitted))
+        high_count += request_priority == Priority.HIGH
+        low_count += request_priority == Priority.LOW
+        wait_for_waiting(scheduler, high_count, low_count)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return admitted
+
+
+def test_priority_context():
+    @low_priority
+    def bulk_operation():
+        return get_priority()
+
+    with priority(Priority.LOW):
+        assert get_priority() == Priority.LOW
+    assert get_priority() == Priority.HIGH
+    assert bulk_operation() == Priority.LOW
+    assert FanOutExecutor().map(lambda key: get_priority(), [1]).values == [Priority.LOW]
+
+
+def test_scheduler_admits_high_priority_first():
+    scheduler = RequestScheduler(max_concurrency=1, reserved_high=0)
+
+    admitted = run_queued_requests(
+        scheduler, [(Priority.LOW, 'bulk'), (Priority.HIGH, 'lookup')],
+    )
+
+    assert admitted == ['holder', 'lookup', 'bulk']
+
+
+def test_scheduler_does_not_starve_low_priority():
+    scheduler = RequestScheduler(max_concurrency=1, reserved_high=0, max_high_streak=1)
+
+    admitted = run_queued_requests(
+        scheduler,
+        [(Priority.LOW, 'bulk'), (Priority.HIGH, 'lookup_1'), (Priority.HIGH, 'lookup_2')],
+    )
+
+    assert admitted == ['holder', 'lookup_1', 'bulk', 'lookup_2']
+
+
+def test_scheduler_reserves_slots_for_high_priority():
+    scheduler = RequestScheduler(max_concurrency=2, reserved_high=1)
+    admitted, release = [], threading.Event()
+    threads = [start_request(scheduler, Priority.LOW, 'bulk_1', admitted, release)]
+    wait_for_waiting(scheduler, high_count=0, low_count=0)
+    threads.append(start_request(scheduler, Priority.LOW, 'bulk_2', admitted))
+    wait_for_waiting(scheduler, high_count=0, low_count=1)
+
+    threads.append(start_request(scheduler, Priority.HIGH, 'lookup', admitted))
+    threads[-1].join(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert admitted == ['bulk_1', 'lookup', 'bulk_2']
+
+
+def test_scheduler_does_not_wait_past_deadline():
+    scheduler = RequestScheduler(max_concurrency=1, reserved_high=0)
+
+    with scheduler.slot(Priority.LOW):
+        with deadline(0.05), pytest.raises(DeadlineExceeded):
+            with scheduler.slot(Priority.HIGH):
+                pass
+
+    assert scheduler._waiting[Priority.HIGH] == collections.deque()
+    assert scheduler._active == {Priority.HIGH: 0, Priority.LOW: 0}
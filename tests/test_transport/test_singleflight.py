@@ -0,0 +1,68 @@
+import threading
+import time
+
+import pytest
+
+from best_testrail_client.transport.singleflight import SingleFlight
+
+
+def _wait_for(condition):
+    for _ in range(500):
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError('Condition was not met')
+
+
+def _run_concurrently(single_flight, func, followers_count):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(single_flight.do('key', func)))
+        for _ in range(followers_count + 1)
+    ]
+    threads[0].start()
+    _wait_for(lambda: 'key' in single_flight._calls)
+    for thread in threads[1:]:
+        thread.start()
+    _wait_for(lambda: single_flight._calls['key'].waiters == followers_count)
+    return threads, results
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        release.wait()
+        return {'id': 1}
+
+    threads, results = _run_concurrently(single_flight, func, followers_count=3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{'id': 1}] * 4
+    assert single_flight._calls == {}
+
+
+def test_single_flight_shares_errors():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def func():
+        release.wait()
+        errors.append(1)
+        raise ValueError('boom')
+
+    threads, _ = _run_concurrently(single_flight, func, followers_count=1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 1
+    with pytest.raises(ValueError):
+        single_flight.do('key', func)
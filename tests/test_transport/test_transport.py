@@ -0,0 +1,132 @@
+import pytest
+import requests
+
+from best_testrail_client.transport.circuit_breaker import CircuitBreaker
+from best_testrail_client.transport.deadline import deadline, timeout
+from best_testrail_client.transport.rate_limit import TokenBucketRateLimiter
+from best_testrail_client.transport.scheduler import Priority, RequestScheduler, priority
+from best_testrail_client.transport.transport import Transport
+
+
+def test_transport_coalesces_get_requests(mocker, mocked_response):
+    mocked_response(data_json={'id': 1})
+    transport = Transport('https://test.test.test', 'login', 'token')
+    do = mocker.spy(transport._single_flight, 'do')
+
+    transport.request('get_case/1', params={'limit': None})
+    transport.request('add_case/1', method='POST', data={'title': 'Case'})
+
+    assert do.call_count == 1
+    assert do.call_args[0][0] == (
+        'https://test.test.test/index.php?/api/v2/', 'get_case/1', (), 'login', 'token',
+        Priority.HIGH,
+    )
+
+
+def test_transport_coalesces_get_requests_by_priority(mocker, mocked_response):
+    mocked_response(data_json={'id': 1})
+    transport = Transport('https://test.test.test', 'login', 'token')
+    do = mocker.spy(transport._single_flight, 'do')
+
+    transport.request('get_case/1')
+    with priority(Priority.LOW):
+        transport.request('get_case/1')
+
+    assert do.call_args_list[0][0][0] != do.call_args_list[1][0][0]
+
+
+def test_transport_does_not_coalesce_requests_with_deadline(mocker, mocked_response):
+    mocked_response(data_json={'id': 1})
+    transport = Transport('https://test.test.test', 'login', 'token')
+    do = mocker.spy(transport._single_flight, 'do')
+
+    with deadline(10):
+        transport.request('get_case/1')
+    with timeout(5):
+        transport.request('get_case/1')
+
+    assert do.call_count == 0
+
+
+def test_transport_without_coalescing(mocked_response):
+    mocked_requests = mocked_response(data_json={'id': 1})
+    transport = Transport('https://test.test.test/', 'login', 'token', coalesce_requests=False)
+
+    response = transport.request('get_case/1')
+
+    assert response == {'id': 1}
+    assert transport._single_flight is None
+    assert mocked_requests.call_count == 1
+
+
+def test_transport_applies_rate_limiter(mocker, mocked_response):
+    mocked_response(data_json={'id': 1})
+    rate_limiter = mocker.Mock()
+    transport = Transport('https://test.test.test/', 'login', 'token', rate_limiter=rate_limiter)
+
+    transport.request('add_case/1', method='POST')
+
+    rate_limiter.acquire.assert_called_once_with()
+
+
+def test_transport_resets_state_in_forked_child(mocker, mocked_response):
+    mocked_response(data_json={'id': 1})
+    transport = Transport('https://test.test.test/', 'login', 'token')
+    transport.request('get_case/1')
+    session, fan_out = transport._session, transport.fan_out
+    mocker.patch('best_testrail_client.transport.transport.os.getpid', return_value=-1)
+
+    transport.request('get_case/1')
+
+    assert transport._pid == -1
+    assert transport._session is not session
+    assert transport.fan_out is not fan_out
+
+
+def test_transport_resets_components_in_forked_child(mocker, mocked_response):
+    mocked_response(data_json={'id': 1})
+    scheduler = RequestScheduler(max_concurrency=1)
+    transport = Transport(
+        'https://test.test.test/', 'login', 'token', scheduler=scheduler,
+        circuit_breaker=CircuitBreaker(), rate_limiter=TokenBucketRateLimiter(rate=100),
+    )
+    scheduler._admit(Priority.HIGH)  # forked while the parent dispatches a request
+    mocker.patch('os.getpid', return_value=-1)
+
+    response = transport.request('get_case/1')
+
+    assert response == {'id': 1}
+    assert scheduler._pid == -1
+
+
+def test_transport_records_metrics(mocked_response):
+    mocked_requests = mocked_response(data_json={'error': 'Rate Limit'}, status_code=429)
+    transport = Transport('https://test.test.test/', 'login', 'token')
+    transport.request('add_case/1', method='POST')
+    mocked_requests.side_effect = requests.ConnectionError
+
+    with pytest.raises(requests.ConnectionError):
+        transport.request('add_case/1', method='POST')
+
+    metrics = transport.metrics.snapshot()
+    assert metrics.requests_count == 2
+    assert metrics.errors_count == 1
+    assert metrics.get_status_count(429) == 1
+
+
+def test_transport_sends_through_scheduler(mocker, mocked_response):
+    mocked_response(data_json={'id': 1})
+    rate_limiter = mocker.Mock()
+    scheduler = RequestScheduler(max_concurrency=1)
+    slot = mocker.spy(scheduler, 'slot')
+    transport = Transport(
+        'https://test.test.test/', 'login', 'token',
+        rate_limiter=rate_limiter, scheduler=scheduler,
+    )
+
+    with priority(Priority.LOW):
+        transport.request('add_case/1', method='POST')
+
+    assert slot.call_args[0][0] == Priority.LOW
+    rate_limiter.acquire.assert_called_once_with()
+    assert scheduler._active == {Priority.HIGH: 0, Priority.LOW: 0}
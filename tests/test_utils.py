@@ -1,6 +1,6 @@
 import pytest
 
-from best_testrail_client.utils import convert_list_to_filter
+from best_testrail_client.utils import convert_list_to_filter, convert_seconds_to_timespan
 
 
 @pytest.mark.parametrize(
@@ -15,3 +15,17 @@ def test_convert_list_to_filter(values_list, expected_result):
     filter_string = convert_list_to_filter(values_list=values_list)
 
     assert filter_string == expected_result
+
+
+@pytest.mark.parametrize(
+    'seconds, expected_timespan',
+    [
+        (0, None),
+        (0.1, '1s'),
+        (65, '1m 5s'),
+        (3600, '1h'),
+        (3725.5, '1h 2m 6s'),
+    ],
+)
+def test_convert_seconds_to_timespan(seconds, expected_timespan):
+    assert convert_seconds_to_timespan(seconds) == expected_timespan